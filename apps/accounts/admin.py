@@ -3,6 +3,26 @@ from django.contrib import admin
 # Register your models here.
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from .models import User, Role, Permission, RolePermission, UserRole
+from .rbac import invalidate_on_commit
+
+
+class InvalidateRBACMixin:
+    """
+    RolePermission / UserRole tidak punya signal invalidasi (lihat
+    signals.py), jadi perubahan lewat admin menaikkan versi RBAC di sini.
+    """
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_on_commit()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_on_commit()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        invalidate_on_commit()
 
 
 @admin.register(User)
@@ -43,12 +63,12 @@ class PermissionAdmin(admin.ModelAdmin):
 
 
 @admin.register(RolePermission)
-class RolePermissionAdmin(admin.ModelAdmin):
+class RolePermissionAdmin(InvalidateRBACMixin, admin.ModelAdmin):
     list_display = ("role", "permission", "created_at")
     search_fields = ("role__name", "permission__code")
 
 
 @admin.register(UserRole)
-class UserRoleAdmin(admin.ModelAdmin):
+class UserRoleAdmin(InvalidateRBACMixin, admin.ModelAdmin):
     list_display = ("user", "role", "created_at")
     search_fields = ("user__email", "role__name")
@@ -0,0 +1,28 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .rbac import MEMO_ATTR
+from .tokens import permissions_from_token
+
+
+class PermissionClaimJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication yang mengisi memo permission user dari claim token
+    (lihat apps.accounts.tokens), sehingga HasPermission dan
+    user_has_permission tidak perlu query RBAC ke DB.
+
+    Jika mode tidak aktif / token stale, perilakunya sama dengan
+    JWTAuthentication biasa.
+    """
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is None:
+            return None
+
+        user, validated_token = result
+
+        perms = permissions_from_token(validated_token)
+        if perms is not None:
+            setattr(user, MEMO_ATTR, perms)
+
+        return user, validated_token
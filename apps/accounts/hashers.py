@@ -0,0 +1,19 @@
+"""
+Profil hasher untuk user yang dibuat massal (import / seed).
+
+Password awal user massal umumnya sementara, jadi boleh di-hash dengan
+iterasi PBKDF2 lebih rendah (BULK_PASSWORD_HASH_ITERATIONS). Algoritma
+ini tidak pernah jadi hasher utama: saat user login pertama kali,
+check_password melihat algoritmanya berbeda dari PASSWORD_HASHERS[0]
+dan otomatis meng-hash ulang password dengan hasher default.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class BulkPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    algorithm = "pbkdf2_sha256_bulk"
+
+    def __init__(self):
+        # atribut instance -> ikut ter-pickle ke worker hashing.py
+        self.iterations = settings.BULK_PASSWORD_HASH_ITERATIONS
@@ -0,0 +1,56 @@
+"""
+Hash password massal secara paralel.
+
+PBKDF2 (hasher default Django) murni CPU-bound, jadi untuk ribuan user
+di-hash di ProcessPoolExecutor (spawn). Worker hanya menerima instance
+hasher + list password, tidak perlu django.setup().
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+
+# di bawah jumlah ini hash langsung di proses ini (start proses spawn mahal)
+MIN_PARALLEL = 32
+
+
+def hash_chunk(hasher, passwords):
+    return [hasher.encode(password, hasher.salt()) for password in passwords]
+
+
+def hash_passwords(passwords, algorithm="default"):
+    """
+    Return list hash sesuai urutan passwords.
+    Password kosong / None -> unusable password.
+    """
+    hasher = get_hasher(algorithm)
+    hashes = [None if password else make_password(None) for password in passwords]
+
+    usable = [(index, password) for index, password in enumerate(passwords) if password]
+    max_workers = settings.PASSWORD_HASH_WORKERS or multiprocessing.cpu_count()
+
+    # proses daemon (worker prefork Celery) tidak boleh membuat child process
+    if len(usable) < MIN_PARALLEL or max_workers < 2 or multiprocessing.current_process().daemon:
+        encoded = hash_chunk(hasher, [password for _, password in usable])
+    else:
+        # beberapa chunk per worker supaya beban rata
+        size = max(1, len(usable) // (max_workers * 4))
+        chunks = [
+            [password for _, password in usable[start:start + size]]
+            for start in range(0, len(usable), size)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(chunks)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            encoded = [
+                value
+                for chunk in pool.map(hash_chunk, [hasher] * len(chunks), chunks)
+                for value in chunk
+            ]
+
+    for (index, _), value in zip(usable, encoded):
+        hashes[index] = value
+    return hashes
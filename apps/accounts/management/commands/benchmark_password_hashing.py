@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.hashing import hash_chunk, hash_passwords
+
+
+class Command(BaseCommand):
+    help = "Benchmark hash password: serial vs paralel (hashing.py) per profil hasher"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=200, help="Jumlah password per percobaan")
+        parser.add_argument(
+            "--algorithm",
+            action="append",
+            help="Algoritma hasher (boleh berulang). Default: default + BULK_PASSWORD_HASHER",
+        )
+        parser.add_argument("--estimate", type=int, default=5000, help="Estimasi waktu untuk N user")
+
+    def timed(self, func, *args, **kwargs):
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        return time.perf_counter() - started
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        if count < 1:
+            raise CommandError("--count minimal 1.")
+
+        algorithms = options["algorithm"] or list(dict.fromkeys(["default", settings.BULK_PASSWORD_HASHER]))
+        passwords = [f"Password-{index}!" for index in range(count)]
+        estimate = options["estimate"]
+
+        self.stdout.write(self.style.WARNING(
+            f"🚀 Benchmark {count} password, workers={settings.PASSWORD_HASH_WORKERS or 'jumlah CPU'}..."
+        ))
+
+        for algorithm in algorithms:
+            try:
+                hasher = get_hasher(algorithm)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+
+            serial = self.timed(hash_chunk, hasher, passwords)
+            parallel = self.timed(hash_passwords, passwords, algorithm=algorithm)
+            iterations = getattr(hasher, "iterations", "-")
+
+            self.stdout.write(
+                f"{hasher.algorithm} (iterations={iterations})\n"
+                f"  serial  : {serial:.2f}s ({serial / count * 1000:.1f} ms/hash, "
+                f"~{serial / count * estimate:.0f}s untuk {estimate} user)\n"
+                f"  paralel : {parallel:.2f}s ({parallel / count * 1000:.1f} ms/hash, "
+                f"~{parallel / count * estimate:.0f}s untuk {estimate} user)"
+            )
+
+        self.stdout.write(self.style.SUCCESS("🎉 Benchmark selesai."))
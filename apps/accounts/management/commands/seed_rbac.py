@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from apps.accounts.models import Role, Permission, RolePermission
+from apps.accounts.services import sync_links
 
 
 class Command(BaseCommand):
@@ -58,7 +59,7 @@ class Command(BaseCommand):
         modules = {
             "employees": ["view", "create", "update", "delete"],
             "attendance": ["view", "checkin", "checkout", "update", "delete"],
-            "leave": ["view", "create", "approve", "reject", "delete"],
+            "leave": ["view", "create", "approve", "reject", "delete", "manage"],
             "payroll": ["view", "generate", "update", "delete"],
             "roles": ["view", "create", "update", "delete", "assign"],
             "permissions": ["view", "create", "update", "delete"],
@@ -92,19 +93,12 @@ class Command(BaseCommand):
 
         def assign_permissions(role_name, perm_codes: list[str]):
             role = role_objects[role_name]
-            created_count = 0
+            permission_ids = [
+                permission_objects[code].id for code in perm_codes if code in permission_objects
+            ]
 
-            for code in perm_codes:
-                perm = permission_objects.get(code)
-                if not perm:
-                    continue
-
-                obj, created = RolePermission.objects.get_or_create(
-                    role=role,
-                    permission=perm,
-                )
-                if created:
-                    created_count += 1
+            # 1 SELECT + 1 bulk INSERT, cache RBAC di-invalidate 1x setelah commit
+            created_count, _ = sync_links(RolePermission, "role", [role.id], "permission", permission_ids)
 
             self.stdout.write(
                 self.style.SUCCESS(f"🔗 Assign {created_count} permission ke role: {role_name}")
@@ -5,6 +5,7 @@ from django.db import transaction
 from django.conf import settings
 
 from apps.accounts.models import User, Role, UserRole
+from apps.accounts.services import sync_links
 
 
 class Command(BaseCommand):
@@ -46,7 +47,7 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING(f"ℹ️ User sudah ada: {user.email}"))
 
             # Pastikan role ter-assign
-            _, created = UserRole.objects.get_or_create(user=user, role=role)
+            created, _ = sync_links(UserRole, "user", [user.id], "role", [role.id])
             if created:
                 self.stdout.write(self.style.SUCCESS("🔗 Role Super Admin berhasil di-assign."))
             else:
@@ -65,7 +66,7 @@ class Command(BaseCommand):
         )
 
         # assign role
-        UserRole.objects.get_or_create(user=user, role=role)
+        sync_links(UserRole, "user", [user.id], "role", [role.id])
 
         self.stdout.write(self.style.SUCCESS("✅ Super Admin berhasil dibuat!"))
         self.stdout.write(self.style.SUCCESS(f"📧 Email       : {default_email}"))
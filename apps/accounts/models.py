@@ -8,6 +8,8 @@ from django.utils.text import slugify
 from django.conf import settings
 
 from .managers import UserManager
+from .rbac import get_user_permissions
+from .utils import user_has_permission  # noqa: F401
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -47,28 +49,14 @@ class User(AbstractBaseUser, PermissionsMixin):
         """
         Return set of permission code
         contoh: {"employees.view", "leave.approve"}
-        """
-        perms = Permission.objects.filter(
-            permission_roles__role__role_users__user=self,
-            is_active=True,
-            permission_roles__role__is_active=True,
-        ).values_list("code", flat=True)
 
-        return set(perms)
+        Di-cache per request + cache Django (lihat apps.accounts.rbac).
+        """
+        return set(get_user_permissions(self))
 
     def has_permission(self, perm_code: str) -> bool:
         return perm_code in self.get_permissions()
     
-def user_has_permission(user, perm_code: str):
-    if user.is_superuser:
-        return True
-
-    role = getattr(user, "role", None)
-    if not role:
-        return False
-
-    return role.permissions.filter(code=perm_code).exists()
-
 class Role(models.Model):
     name = models.CharField(max_length=50, unique=True)
     code = models.SlugField(max_length=60, unique=True)
@@ -1,4 +1,6 @@
-from rest_framework.permissions import BasePermission
+from rest_framework.permissions import BasePermission, IsAuthenticated
+
+from .rbac import get_user_permissions
 
 
 class HasPermission(BasePermission):
@@ -18,6 +20,37 @@ class HasPermission(BasePermission):
         if not user or not user.is_authenticated:
             return False
 
-        user_perms = user.get_permissions()
+        user_perms = get_user_permissions(user)
 
         return all(perm in user_perms for perm in required)
+
+
+class HasPermissionOrStaff(HasPermission):
+    """
+    HasPermission, tetapi user is_staff / superuser selalu lolos
+    (sama seperti pola `user_has_permission(...) or user.is_staff`).
+    """
+
+    def has_permission(self, request, view):
+        user = request.user
+        if user and user.is_authenticated and (user.is_staff or user.is_superuser):
+            return True
+
+        return super().has_permission(request, view)
+
+
+class ActionPermissionMixin:
+    """
+    Mixin ViewSet: permission code per action.
+
+    action_permissions = {"create": ["roles.create"], ...}
+    Action yang tidak terdaftar cukup IsAuthenticated.
+    Staff / superuser selalu lolos, supaya admin pertama (createsuperuser,
+    belum punya role) bisa menyiapkan RBAC.
+    """
+    action_permissions = {}
+    required_permissions = []
+
+    def get_permissions(self):
+        self.required_permissions = self.action_permissions.get(self.action, [])
+        return [IsAuthenticated(), HasPermissionOrStaff()]
@@ -0,0 +1,115 @@
+"""
+Resolusi permission RBAC dengan cache bertingkat:
+
+1. memo di object user (berlaku selama 1 request, karena request.user
+   dibuat ulang oleh authentication di setiap request)
+2. cache Django yang diberi versi - HANYA jika cache shared (Redis)
+3. query DB (saat cache miss, atau setiap request jika cache per proses)
+
+Versi global dinaikkan setiap kali Role / Permission berubah (signals.py)
+dan setelah commit operasi RolePermission / UserRole di services.py,
+sehingga semua entry lama tidak terbaca lagi tanpa menghapus key satu
+per satu.
+
+Dengan cache per proses (LocMem, tanpa REDIS_URL) kenaikan versi tidak
+terlihat worker lain, jadi level 2 dilewati: revoke langsung berlaku di
+request berikutnya, dengan biaya 1 query permission per request.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.core.caches import cache_is_shared
+
+VERSION_KEY = "rbac:version"
+USER_PERMS_KEY = "rbac:perms:v{version}:user:{user_id}"
+ME_PAYLOAD_KEY = "rbac:me:v{version}:user:{user_id}"
+
+# atribut memo di instance user
+MEMO_ATTR = "_rbac_permissions"
+
+
+def get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # pakai timestamp supaya versi baru (mis. setelah key ter-evict)
+        # tidak pernah bentrok dengan entry versi lama yang masih tersimpan
+        cache.add(VERSION_KEY, int(time.time() * 1000), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_permission_cache():
+    """
+    Naikkan versi cache RBAC. Panggil manual setelah operasi bulk
+    (bulk_create / queryset.update) yang tidak memicu signal.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, int(time.time() * 1000), timeout=None)
+
+
+def invalidate_on_commit():
+    """
+    1x invalidasi setelah transaksi commit (dipakai services.py / admin).
+    """
+    transaction.on_commit(invalidate_permission_cache)
+
+
+def load_user_permissions(user):
+    from .models import Permission
+
+    codes = Permission.objects.filter(
+        permission_roles__role__role_users__user=user,
+        is_active=True,
+        permission_roles__role__is_active=True,
+    ).values_list("code", flat=True)
+
+    return frozenset(codes)
+
+
+def get_user_permissions(user):
+    """
+    Return frozenset permission code milik user.
+    contoh: frozenset({"employees.view", "leave.approve"})
+    """
+    if user is None or not user.is_authenticated or not user.pk:
+        return frozenset()
+
+    perms = getattr(user, MEMO_ATTR, None)
+    if perms is not None:
+        return perms
+
+    if not cache_is_shared():
+        perms = load_user_permissions(user)
+        setattr(user, MEMO_ATTR, perms)
+        return perms
+
+    key = USER_PERMS_KEY.format(version=get_version(), user_id=user.pk)
+    perms = cache.get(key)
+
+    if perms is None:
+        perms = load_user_permissions(user)
+        cache.set(key, perms, timeout=settings.RBAC_CACHE_TIMEOUT)
+
+    setattr(user, MEMO_ATTR, perms)
+    return perms
+
+
+def clear_user_memo(user):
+    if hasattr(user, MEMO_ATTR):
+        delattr(user, MEMO_ATTR)
+
+
+# =====================================================
+# Cache payload /me (ikut versi RBAC)
+# =====================================================
+def me_payload_key(user_id):
+    return ME_PAYLOAD_KEY.format(version=get_version(), user_id=user_id)
+
+
+def invalidate_me_payload(user_id):
+    cache.delete(me_payload_key(user_id))
@@ -1,8 +1,14 @@
 from django.contrib.auth import authenticate
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
 
 from .models import Role, Permission, RolePermission, UserRole, User
+from .tokens import stamp_permission_claims
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -14,6 +20,12 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
     username_field = "email"
 
+    @classmethod
+    def get_token(cls, user):
+        # claim permission ikut tersalin ke access token
+        token = super().get_token(user)
+        return stamp_permission_claims(token, user)
+
     def validate(self, attrs):
         login_value = attrs.get("email")  # default field SimpleJWT
         password = attrs.get("password")
@@ -52,6 +64,30 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         return data
 
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh token membawa claim permission saat login; access token baru
+    di-stamp ulang supaya perubahan RBAC ikut terbawa.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        if not settings.RBAC_JWT_PERMISSIONS:
+            return data
+
+        access = AccessToken(data["access"])
+        user = get_user_model().objects.filter(
+            **{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]}
+        ).first()
+
+        if user:
+            stamp_permission_claims(access, user)
+            data["access"] = str(access)
+
+        return data
+
 # untuk melihat profile diri sendiri
 class MeSerializer(serializers.ModelSerializer):
     roles = serializers.SerializerMethodField()
@@ -71,25 +107,48 @@ class MeSerializer(serializers.ModelSerializer):
             "permissions_grouped",
         ]
 
+    def _get_rbac(self, obj):
+        """
+        Ambil role aktif + permission-nya sekali (1 query role + 1 prefetch),
+        lalu permission & grouping diturunkan di memory.
+        """
+        cached = getattr(self, "_rbac_data", None)
+        if cached is not None and cached[0] == obj.pk:
+            return cached[1]
+
+        roles = list(
+            Role.objects.filter(role_users__user=obj, is_active=True)
+            .order_by("name")
+            .prefetch_related(
+                Prefetch(
+                    "role_permissions",
+                    queryset=RolePermission.objects.filter(
+                        permission__is_active=True
+                    ).select_related("permission"),
+                )
+            )
+        )
+
+        perms = {}
+        for role in roles:
+            for role_perm in role.role_permissions.all():
+                perms[role_perm.permission_id] = role_perm.permission
+
+        perms = sorted(perms.values(), key=lambda p: (p.module, p.action))
+
+        self._rbac_data = (obj.pk, (roles, perms))
+        return roles, perms
+
     def get_roles(self, obj):
-        roles = Role.objects.filter(
-            role_users__user=obj,
-            is_active=True
-        ).order_by("name")
+        roles, _ = self._get_rbac(obj)
         return RoleSerializer(roles, many=True).data
 
     def get_permissions(self, obj):
-        perms = Permission.objects.filter(
-            permission_roles__role__role_users__user=obj,
-            is_active=True
-        ).distinct().order_by("module", "action")
+        _, perms = self._get_rbac(obj)
         return PermissionSerializer(perms, many=True).data
 
     def get_permissions_grouped(self, obj):
-        perms = Permission.objects.filter(
-            permission_roles__role__role_users__user=obj,
-            is_active=True
-        ).distinct().order_by("module", "action")
+        _, perms = self._get_rbac(obj)
 
         grouped = {}
         for p in perms:
@@ -126,11 +185,8 @@ class CreateEmployeeUserSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
-        password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        # create_user sudah hash password, cukup 1x hash + 1x INSERT
+        return User.objects.create_user(**validated_data)
 
 # ==========================
 # PERMISSION
@@ -237,3 +293,32 @@ class AssignRoleToUserSerializer(serializers.Serializer):
         child=serializers.IntegerField(),
         allow_empty=False
     )
+
+
+class SyncPermissionsToRoleSerializer(serializers.Serializer):
+    role_id = serializers.IntegerField()
+    permission_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=True
+    )
+
+
+class SyncRolesToUserSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField()
+    role_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=True
+    )
+
+
+class BulkAssignRoleSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=20000,
+    )
+    role_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=True
+    )
+    replace = serializers.BooleanField(default=False)
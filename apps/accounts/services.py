@@ -0,0 +1,137 @@
+from django.conf import settings
+from django.db import transaction
+
+from .hashing import hash_passwords
+from .models import User, UserRole
+from .rbac import invalidate_on_commit
+
+CHUNK_SIZE = 1000
+
+
+def find_missing_ids(model, ids):
+    """
+    Return id (terurut) yang tidak ada di tabel model, dengan 1 query.
+    """
+    ids = set(ids)
+    found = set(model.objects.filter(id__in=ids).values_list("id", flat=True))
+    return sorted(ids - found)
+
+
+@transaction.atomic
+def sync_links(model, owner_field, owner_ids, target_field, target_ids, replace=False):
+    """
+    Sinkronisasi tabel relasi (RolePermission / UserRole) berbasis diff.
+
+    - replace=False : tambahkan pasangan (owner, target) yang belum ada
+    - replace=True  : set target milik owner menjadi persis target_ids
+
+    Per chunk owner hanya ada 1 SELECT, 1 DELETE (replace) dan
+    1 bulk INSERT. Return (created_count, deleted_count).
+    """
+    owner_key = f"{owner_field}_id"
+    target_key = f"{target_field}_id"
+
+    owner_ids = sorted(set(owner_ids))
+    target_ids = set(target_ids)
+
+    created = 0
+    deleted = 0
+
+    for start in range(0, len(owner_ids), CHUNK_SIZE):
+        chunk = owner_ids[start:start + CHUNK_SIZE]
+
+        existing_qs = model.objects.filter(**{f"{owner_key}__in": chunk})
+        if not replace:
+            existing_qs = existing_qs.filter(**{f"{target_key}__in": target_ids})
+
+        existing = set(existing_qs.values_list(owner_key, target_key))
+        wanted = {(owner_id, target_id) for owner_id in chunk for target_id in target_ids}
+
+        if replace and existing - wanted:
+            removed, _ = (
+                model.objects.filter(**{f"{owner_key}__in": chunk})
+                .exclude(**{f"{target_key}__in": target_ids})
+                .delete()
+            )
+            deleted += removed
+
+        to_create = [
+            model(**{owner_key: owner_id, target_key: target_id})
+            for owner_id, target_id in wanted - existing
+        ]
+        model.objects.bulk_create(to_create, batch_size=CHUNK_SIZE, ignore_conflicts=True)
+        created += len(to_create)
+
+    if created or deleted:
+        # 1x invalidasi per operasi (tidak ada signal per row)
+        invalidate_on_commit()
+
+    return created, deleted
+
+
+@transaction.atomic
+def remove_links(model, owner_field, owner_id, target_field, target_ids):
+    """
+    Hapus pasangan (owner, target_ids) dari tabel relasi. Return jumlah
+    row terhapus.
+    """
+    deleted, _ = model.objects.filter(
+        **{f"{owner_field}_id": owner_id, f"{target_field}_id__in": target_ids}
+    ).delete()
+
+    if deleted:
+        invalidate_on_commit()
+    return deleted
+
+
+def build_users(rows, algorithm=None):
+    """
+    User (belum disimpan) dengan password sudah di-hash.
+
+    rows: list dict field User + "password" (kosong -> unusable password).
+    Hash dikerjakan paralel (hashing.py) memakai BULK_PASSWORD_HASHER;
+    panggil di luar transaksi karena CPU-bound dan lama.
+    """
+    password_hashes = hash_passwords(
+        [row.get("password") for row in rows],
+        algorithm=algorithm or settings.BULK_PASSWORD_HASHER,
+    )
+
+    users = []
+    for row, password_hash in zip(rows, password_hashes):
+        fields = {name: value for name, value in row.items() if name != "password"}
+        fields["email"] = User.objects.normalize_email(fields["email"])
+        users.append(User(password=password_hash, **fields))
+    return users
+
+
+@transaction.atomic
+def insert_users(users, role_ids=()):
+    """
+    bulk_create User hasil build_users + assign role_ids.
+    Return dict email -> user id. Validasi (email unik dll) tanggung
+    jawab pemanggil.
+    """
+    User.objects.bulk_create(users, batch_size=CHUNK_SIZE)
+
+    # MySQL tidak mengembalikan pk dari bulk_create -> ambil ulang per chunk
+    emails = [user.email for user in users]
+    user_ids = {}
+    for start in range(0, len(emails), CHUNK_SIZE):
+        user_ids.update(
+            User.objects.filter(email__in=emails[start:start + CHUNK_SIZE])
+            .values_list("email", "id")
+        )
+
+    if role_ids:
+        sync_links(UserRole, "user", user_ids.values(), "role", role_ids)
+
+    return user_ids
+
+
+def bulk_create_users(rows, role_ids=(), algorithm=None):
+    """
+    Buat banyak User sekaligus: hash paralel lalu bulk INSERT.
+    Return dict email -> user id.
+    """
+    return insert_users(build_users(rows, algorithm=algorithm), role_ids=role_ids)
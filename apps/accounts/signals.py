@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Permission, Role, User
+from .rbac import invalidate_me_payload, invalidate_on_commit
+from .tokens import invalidate_permission_catalog
+
+
+# =====================================================
+# Invalidasi cache permission RBAC
+# =====================================================
+# RolePermission / UserRole sengaja tanpa signal per row: perubahan lewat
+# services.sync_links / remove_links (1x invalidasi on_commit per operasi).
+# Semua invalidasi setelah commit: sebelum itu request lain bisa mengisi
+# ulang cache dari data lama dengan versi baru.
+@receiver(post_save, sender=Role, dispatch_uid="rbac_role_saved")
+@receiver(post_delete, sender=Role, dispatch_uid="rbac_role_deleted")
+@receiver(post_save, sender=Permission, dispatch_uid="rbac_permission_saved")
+@receiver(post_delete, sender=Permission, dispatch_uid="rbac_permission_deleted")
+def invalidate_rbac_cache(sender, **kwargs):
+    invalidate_on_commit()
+
+
+@receiver(post_save, sender=Permission, dispatch_uid="rbac_catalog_saved")
+@receiver(post_delete, sender=Permission, dispatch_uid="rbac_catalog_deleted")
+def invalidate_jwt_permission_catalog(sender, **kwargs):
+    transaction.on_commit(invalidate_permission_catalog)
+
+
+@receiver(post_save, sender=User, dispatch_uid="rbac_me_payload_user_saved")
+def invalidate_user_me_payload(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_me_payload(user_id))
@@ -1,3 +1,251 @@
 from django.test import TestCase
 
 # Create your tests here.
+import shutil
+import tempfile
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from . import rbac, services, tokens
+from .models import Permission, Role, RolePermission, User, UserRole
+
+
+class RBACBootstrapTest(TestCase):
+    """
+    Endpoint RBAC (role / permission / user-role) memakai permission per
+    action; superuser tanpa role tetap bisa menyiapkan RBAC.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(email="admin@example.com", password="secret", full_name="Admin")
+        cls.user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+
+        cls.role_admin = User.objects.create_user(email="rbac@example.com", password="secret", full_name="RBAC")
+        permission = Permission.objects.create(
+            module="roles",
+            action="create",
+            name="Create Role",
+            code="roles.create",
+        )
+        role = Role.objects.create(name="RBAC Admin")
+        RolePermission.objects.create(role=role, permission=permission)
+        UserRole.objects.create(user=cls.role_admin, role=role)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_superuser_without_role_can_bootstrap(self):
+        self.client.force_authenticate(self.superuser)
+
+        response = self.client.post("/api/accounts/roles/", {"name": "HR"}, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+
+        response = self.client.post("/api/accounts/permissions/", {
+            "module": "leave",
+            "action": "approve",
+            "name": "Approve Leave",
+            "code": "leave.approve",
+        }, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+
+        response = self.client.post(
+            "/api/accounts/user-role/assign-roles/",
+            {"user_id": self.user.id, "role_ids": [Role.objects.get(name="HR").id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertTrue(UserRole.objects.filter(user=self.user, role__name="HR").exists())
+
+    def test_action_permission_required(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post("/api/accounts/roles/", {"name": "HR"}, format="json")
+        self.assertEqual(response.status_code, 403)
+
+        # action tanpa permission code cukup login
+        self.assertEqual(self.client.get("/api/accounts/roles/").status_code, 200)
+
+        self.client.force_authenticate(self.role_admin)
+        response = self.client.post("/api/accounts/roles/", {"name": "HR"}, format="json")
+        self.assertEqual(response.status_code, 201)
+
+        # roles.create tidak mencakup roles.delete
+        role = Role.objects.get(name="HR")
+        self.assertEqual(self.client.delete(f"/api/accounts/roles/{role.id}/").status_code, 403)
+
+
+class SharedCacheMixin:
+    """
+    Versi RBAC hanya dipakai dengan cache shared; FileBasedCache dianggap
+    shared oleh cache_is_shared.
+    """
+
+    def setUp(self):
+        super().setUp()
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+
+        settings_override = override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            },
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class RBACCacheVersionTest(SharedCacheMixin, TestCase):
+    """
+    Perubahan Role / Permission / UserRole menaikkan versi RBAC setelah
+    commit; entry cache versi lama tidak terbaca lagi.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.permission = Permission.objects.create(
+            module="leave",
+            action="approve",
+            name="Approve Leave",
+            code="leave.approve",
+        )
+        cls.role = Role.objects.create(name="HR")
+        RolePermission.objects.create(role=cls.role, permission=cls.permission)
+        UserRole.objects.create(user=cls.user, role=cls.role)
+
+    def fresh_permissions(self):
+        return rbac.get_user_permissions(User.objects.get(pk=self.user.pk))
+
+    def test_role_and_permission_change_bump_version(self):
+        for instance in (self.role, self.permission):
+            with self.subTest(model=type(instance).__name__):
+                version = rbac.get_version()
+
+                with self.captureOnCommitCallbacks(execute=True):
+                    instance.save()
+                    # sebelum commit versi belum berubah
+                    self.assertEqual(rbac.get_version(), version)
+
+                self.assertGreater(rbac.get_version(), version)
+
+    def test_revoke_reloads_from_db(self):
+        self.assertEqual(self.fresh_permissions(), {"leave.approve"})
+
+        # tanpa invalidasi entry cache tetap dipakai
+        UserRole.objects.filter(user=self.user).delete()
+        self.assertEqual(self.fresh_permissions(), {"leave.approve"})
+
+        UserRole.objects.create(user=self.user, role=self.role)
+        with self.captureOnCommitCallbacks(execute=True):
+            services.remove_links(UserRole, "user", self.user.id, "role", [self.role.id])
+
+        # versi baru -> cache miss -> 1 query permission ke DB
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(rbac.get_user_permissions(user), frozenset())
+
+    def test_process_local_cache_reads_db(self):
+        with override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        }):
+            self.assertEqual(self.fresh_permissions(), {"leave.approve"})
+
+            UserRole.objects.filter(user=self.user).delete()
+            self.assertEqual(self.fresh_permissions(), frozenset())
+
+
+@override_settings(RBAC_JWT_PERMISSIONS=True)
+class PermissionClaimTest(SharedCacheMixin, TestCase):
+    """
+    Bitset permission di access token (tokens.py): dipercaya hanya selama
+    versi RBAC dan versi catalog masih sama.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+
+        # > 8 permission supaya bitset lebih dari 1 byte
+        cls.permissions = [
+            Permission.objects.create(module=module, action=action, name=code, code=code)
+            for code in ["roles.create"] + [f"module.action{index}" for index in range(1, 10)]
+            for module, action in [code.split(".")]
+        ]
+        inactive = Permission.objects.create(
+            module="module",
+            action="inactive",
+            name="Inactive",
+            code="module.inactive",
+            is_active=False,
+        )
+
+        cls.role = Role.objects.create(name="HR")
+        for permission in (cls.permissions[0], cls.permissions[3], cls.permissions[9], inactive):
+            RolePermission.objects.create(role=cls.role, permission=permission)
+        UserRole.objects.create(user=cls.user, role=cls.role)
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+
+    def mint(self):
+        return tokens.stamp_permission_claims(AccessToken.for_user(self.user), self.user)
+
+    def revoke_role(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            services.remove_links(UserRole, "user", self.user.id, "role", [self.role.id])
+
+    def create_role(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.client.post("/api/accounts/roles/", {"name": "New"}, format="json")
+
+    def test_bitset_matches_db(self):
+        expected = rbac.load_user_permissions(self.user)
+        self.assertEqual(expected, {"roles.create", "module.action3", "module.action9"})
+
+        _, codes = tokens.get_catalog()
+        self.assertNotIn("module.inactive", codes)
+        self.assertEqual(tokens.decode_permissions(tokens.encode_permissions(expected, codes), codes), expected)
+
+        self.assertEqual(tokens.permissions_from_token(self.mint()), expected)
+
+    def test_fresh_token_skips_rbac_query(self):
+        token = self.mint()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.create_role(token)
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertFalse([query for query in queries if "role_permissions" in query["sql"]])
+
+    def test_old_rbac_version_falls_back_to_db(self):
+        token = self.mint()
+        self.revoke_role()
+
+        self.assertNotEqual(token[tokens.RBAC_VERSION_CLAIM], rbac.get_version())
+        self.assertIsNone(tokens.permissions_from_token(token))
+        self.assertEqual(self.create_role(token).status_code, 403)
+
+    def test_catalog_change_invalidates_token(self):
+        token = self.mint()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Permission.objects.create(module="leave", action="approve", name="Approve Leave", code="leave.approve")
+
+        # rv disamakan: hanya versi catalog yang berbeda
+        token[tokens.RBAC_VERSION_CLAIM] = rbac.get_version()
+        self.assertNotEqual(token[tokens.CATALOG_VERSION_CLAIM], tokens.get_catalog()[0])
+        self.assertIsNone(tokens.permissions_from_token(token))
+
+    def test_claims_ignored_with_process_local_cache(self):
+        token = self.mint()
+
+        with override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        }):
+            self.assertIsNone(tokens.permissions_from_token(token))
@@ -0,0 +1,123 @@
+"""
+Bitset permission di dalam JWT access token (opt-in via RBAC_JWT_PERMISSIONS).
+
+Catalog = daftar Permission aktif diurutkan berdasarkan id. Posisi bit
+sebuah permission = index-nya di catalog. Versi catalog (hash isi catalog)
+dan versi RBAC (apps.accounts.rbac.get_version) ikut disimpan di token;
+token yang dibuat dengan catalog / versi RBAC berbeda dianggap stale dan
+permission-nya di-resolve ulang lewat apps.accounts.rbac. Jadi perubahan
+Role / UserRole / RolePermission / Permission langsung berlaku, tidak
+menunggu access token kedaluwarsa.
+
+Claim hanya dipercaya jika cache shared (Redis): versi di LocMem tidak
+terlihat worker lain, sehingga token selalu di-resolve ulang.
+
+Claim:
+- perms : bitset permission (base64url, little-endian)
+- pcv   : versi catalog permission
+- rv    : versi RBAC saat token dibuat
+"""
+import base64
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.caches import cache_is_shared
+
+from .rbac import get_user_permissions, get_version
+
+CATALOG_KEY = "rbac:catalog"
+
+PERMS_CLAIM = "perms"
+CATALOG_VERSION_CLAIM = "pcv"
+RBAC_VERSION_CLAIM = "rv"
+
+
+def get_catalog():
+    """
+    Return (version, codes) — codes berupa tuple permission code aktif
+    terurut berdasarkan id.
+    """
+    catalog = cache.get(CATALOG_KEY)
+    if catalog is None:
+        from .models import Permission
+
+        codes = tuple(
+            Permission.objects.filter(is_active=True)
+            .order_by("id")
+            .values_list("code", flat=True)
+        )
+        version = hashlib.sha1("\n".join(codes).encode()).hexdigest()[:12]
+
+        catalog = (version, codes)
+        cache.set(CATALOG_KEY, catalog, timeout=settings.RBAC_CACHE_TIMEOUT)
+
+    return catalog
+
+
+def invalidate_permission_catalog():
+    cache.delete(CATALOG_KEY)
+
+
+def encode_permissions(perm_codes, catalog_codes):
+    bits = 0
+    for index, code in enumerate(catalog_codes):
+        if code in perm_codes:
+            bits |= 1 << index
+
+    raw = bits.to_bytes(max(1, (bits.bit_length() + 7) // 8), "little")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_permissions(value, catalog_codes):
+    raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+    bits = int.from_bytes(raw, "little")
+
+    return frozenset(
+        code for index, code in enumerate(catalog_codes) if bits >> index & 1
+    )
+
+
+def stamp_permission_claims(token, user):
+    """
+    Tambahkan claim perms + pcv ke token (RefreshToken / AccessToken).
+    Tidak melakukan apa-apa jika mode JWT permission tidak aktif.
+    """
+    if not settings.RBAC_JWT_PERMISSIONS:
+        return token
+
+    version, codes = get_catalog()
+    token[CATALOG_VERSION_CLAIM] = version
+    token[RBAC_VERSION_CLAIM] = get_version()
+    token[PERMS_CLAIM] = encode_permissions(get_user_permissions(user), codes)
+
+    return token
+
+
+def permissions_from_token(token):
+    """
+    Return frozenset permission dari claim token, atau None jika mode
+    tidak aktif, cache tidak shared, claim tidak ada, atau versi catalog /
+    versi RBAC sudah berubah (stale).
+    """
+    if not settings.RBAC_JWT_PERMISSIONS or token is None or not cache_is_shared():
+        return None
+
+    value = token.get(PERMS_CLAIM)
+    version = token.get(CATALOG_VERSION_CLAIM)
+    rbac_version = token.get(RBAC_VERSION_CLAIM)
+    if value is None or version is None or rbac_version is None:
+        return None
+
+    if rbac_version != get_version():
+        return None
+
+    current_version, codes = get_catalog()
+    if version != current_version:
+        return None
+
+    try:
+        return decode_permissions(value, codes)
+    except (TypeError, ValueError):
+        return None
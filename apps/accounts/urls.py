@@ -1,8 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenRefreshView
 
-from .views import CustomTokenObtainPairView, MeView, EmployeeUserViewSet
+from .views import CustomTokenObtainPairView, CustomTokenRefreshView, MeView, EmployeeUserViewSet
 from .views_role_permission import RoleViewSet, PermissionViewSet, UserRoleViewSet
 
 router = DefaultRouter()
@@ -13,7 +12,7 @@ router.register(r"employees", EmployeeUserViewSet, basename="employees")
 urlpatterns = [
     # auth
     path("login/", CustomTokenObtainPairView.as_view(), name="login"),
-    path("refresh/", TokenRefreshView.as_view(), name="refresh"),
+    path("refresh/", CustomTokenRefreshView.as_view(), name="refresh"),
 
     # role & permission
     path("", include(router.urls)),
@@ -23,6 +22,8 @@ urlpatterns = [
     path("user-role/user/<int:user_id>/", UserRoleViewSet.as_view({"get": "user_detail"})),
     path("user-role/assign-roles/", UserRoleViewSet.as_view({"post": "assign_roles"})),
     path("user-role/remove-roles/", UserRoleViewSet.as_view({"post": "remove_roles"})),
+    path("user-role/sync-roles/", UserRoleViewSet.as_view({"post": "sync_roles"})),
+    path("user-role/bulk-assign-roles/", UserRoleViewSet.as_view({"post": "bulk_assign_roles"})),
     path("me/", MeView.as_view(), name="me"),
     
 ]
@@ -1,9 +1,8 @@
+from .rbac import get_user_permissions
+
+
 def user_has_permission(user, perm_code: str):
     if user.is_superuser:
         return True
 
-    role = getattr(user, "role", None)
-    if not role:
-        return False
-
-    return role.permissions.filter(code=perm_code).exists()
+    return perm_code in get_user_permissions(user)
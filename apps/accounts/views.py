@@ -1,20 +1,32 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.shortcuts import render
+from django.utils.http import parse_etags
 
 # Create your views here.
-from rest_framework_simplejwt.views import TokenObtainPairView
-from .serializers import CustomTokenObtainPairSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from .serializers import CustomTokenObtainPairSerializer, CustomTokenRefreshSerializer
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from apps.accounts.permissions import HasPermission
 from rest_framework.permissions import IsAuthenticated
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 
 from .serializers import MeSerializer, CreateEmployeeUserSerializer, UserMiniSerializer
 from apps.accounts.models import User
+from apps.accounts.rbac import me_payload_key
+from apps.core.caches import cache_is_shared
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
+class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+
 class EmployeeListAPIView(APIView):
     permission_classes = [HasPermission]
     required_permissions = ["employees.view"]
@@ -24,10 +36,45 @@ class EmployeeListAPIView(APIView):
 
 
 class MeView(APIView):
+    """
+    Profile user login. Payload di-cache per user (ikut versi RBAC) dan
+    mendukung ETag / If-None-Match -> 304 tanpa query RBAC.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        return Response(MeSerializer(request.user).data)
+        etag, payload = get_me_payload(request.user)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(payload)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+
+def get_me_payload(user):
+    """
+    Return (etag, payload) untuk /me, dari cache jika ada.
+    Cache per proses (LocMem) tidak dipakai: invalidasinya tidak terlihat
+    worker lain (lihat apps.accounts.rbac).
+    """
+    shared = cache_is_shared()
+    key = me_payload_key(user.pk)
+
+    cached = cache.get(key) if shared else None
+    if cached is not None:
+        return cached
+
+    raw = json.dumps(MeSerializer(user).data, cls=DjangoJSONEncoder, sort_keys=True)
+    etag = '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+    cached = (etag, json.loads(raw))
+    if shared:
+        cache.set(key, cached, timeout=settings.RBAC_CACHE_TIMEOUT)
+    return cached
 
 class EmployeeUserViewSet(viewsets.ModelViewSet):
     """
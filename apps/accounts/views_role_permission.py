@@ -1,27 +1,36 @@
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
 
 from .models import Role, Permission, RolePermission, UserRole, User
+from .permissions import ActionPermissionMixin
 from .serializers import (
     RoleSerializer,
     RoleDetailSerializer,
     PermissionSerializer,
     AssignPermissionToRoleSerializer,
     AssignRoleToUserSerializer,
+    SyncPermissionsToRoleSerializer,
+    SyncRolesToUserSerializer,
+    BulkAssignRoleSerializer,
     UserRoleDetailSerializer,
     UserMiniSerializer,
 )
+from .services import find_missing_ids, remove_links, sync_links
 
 
 # ============================================================
 # PERMISSION CRUD
 # ============================================================
-class PermissionViewSet(viewsets.ModelViewSet):
+class PermissionViewSet(ActionPermissionMixin, viewsets.ModelViewSet):
     queryset = Permission.objects.all().order_by("module", "action")
     serializer_class = PermissionSerializer
-    permission_classes = [IsAuthenticated]
+    action_permissions = {
+        "create": ["permissions.create"],
+        "update": ["permissions.update"],
+        "partial_update": ["permissions.update"],
+        "destroy": ["permissions.delete"],
+    }
 
     filterset_fields = ["module", "is_active"]
     search_fields = ["code", "name", "module", "action"]
@@ -31,10 +40,18 @@ class PermissionViewSet(viewsets.ModelViewSet):
 # ============================================================
 # ROLE CRUD
 # ============================================================
-class RoleViewSet(viewsets.ModelViewSet):
+class RoleViewSet(ActionPermissionMixin, viewsets.ModelViewSet):
     queryset = Role.objects.all().order_by("name")
     serializer_class = RoleSerializer
-    permission_classes = [IsAuthenticated]
+    action_permissions = {
+        "create": ["roles.create"],
+        "update": ["roles.update"],
+        "partial_update": ["roles.update"],
+        "destroy": ["roles.delete"],
+        "assign_permissions": ["roles.update"],
+        "sync_permissions": ["roles.update"],
+        "remove_permissions": ["roles.update"],
+    }
 
     filterset_fields = ["is_active"]
     search_fields = ["name", "code"]
@@ -67,15 +84,14 @@ class RoleViewSet(viewsets.ModelViewSet):
         if not role:
             return Response({"detail": "Role tidak ditemukan"}, status=status.HTTP_404_NOT_FOUND)
 
-        permissions = Permission.objects.filter(id__in=permission_ids)
-        if permissions.count() != len(permission_ids):
-            return Response({"detail": "Ada permission yang tidak ditemukan"}, status=status.HTTP_400_BAD_REQUEST)
+        missing = find_missing_ids(Permission, permission_ids)
+        if missing:
+            return Response(
+                {"detail": "Ada permission yang tidak ditemukan", "missing_ids": missing},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        created = 0
-        for perm in permissions:
-            obj, is_created = RolePermission.objects.get_or_create(role=role, permission=perm)
-            if is_created:
-                created += 1
+        created, _ = sync_links(RolePermission, "role", [role.id], "permission", permission_ids)
 
         return Response(
             {
@@ -86,6 +102,51 @@ class RoleViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK
         )
 
+    # -----------------------------
+    # Replace permission set of role
+    # -----------------------------
+    @action(detail=False, methods=["post"], url_path="sync-permissions")
+    def sync_permissions(self, request):
+        """
+        Set permission role menjadi persis permission_ids
+        (yang tidak ada di list akan dihapus).
+        Body:
+        {
+          "role_id": 1,
+          "permission_ids": [1,2,3]
+        }
+        """
+        serializer = SyncPermissionsToRoleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        role_id = serializer.validated_data["role_id"]
+        permission_ids = serializer.validated_data["permission_ids"]
+
+        role = Role.objects.filter(id=role_id).first()
+        if not role:
+            return Response({"detail": "Role tidak ditemukan"}, status=status.HTTP_404_NOT_FOUND)
+
+        missing = find_missing_ids(Permission, permission_ids)
+        if missing:
+            return Response(
+                {"detail": "Ada permission yang tidak ditemukan", "missing_ids": missing},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        created, deleted = sync_links(
+            RolePermission, "role", [role.id], "permission", permission_ids, replace=True
+        )
+
+        return Response(
+            {
+                "message": "Sync permission berhasil",
+                "role_id": role.id,
+                "created_count": created,
+                "deleted_count": deleted,
+            },
+            status=status.HTTP_200_OK
+        )
+
     # -----------------------------
     # Remove permissions from role
     # -----------------------------
@@ -108,10 +169,7 @@ class RoleViewSet(viewsets.ModelViewSet):
         if not role:
             return Response({"detail": "Role tidak ditemukan"}, status=status.HTTP_404_NOT_FOUND)
 
-        deleted, _ = RolePermission.objects.filter(
-            role=role,
-            permission_id__in=permission_ids
-        ).delete()
+        deleted = remove_links(RolePermission, "role", role.id, "permission", permission_ids)
 
         return Response(
             {
@@ -126,11 +184,18 @@ class RoleViewSet(viewsets.ModelViewSet):
 # ============================================================
 # USER ROLE MANAGEMENT
 # ============================================================
-class UserRoleViewSet(viewsets.ViewSet):
+class UserRoleViewSet(ActionPermissionMixin, viewsets.ViewSet):
     """
     Endpoint untuk assign/unassign role ke user.
     """
-    permission_classes = [IsAuthenticated]
+    action_permissions = {
+        "users": ["roles.view"],
+        "user_detail": ["roles.view"],
+        "assign_roles": ["roles.assign"],
+        "sync_roles": ["roles.assign"],
+        "bulk_assign_roles": ["roles.assign"],
+        "remove_roles": ["roles.assign"],
+    }
 
     @action(detail=False, methods=["get"], url_path="users")
     def users(self, request):
@@ -167,15 +232,14 @@ class UserRoleViewSet(viewsets.ViewSet):
         if not user:
             return Response({"detail": "User tidak ditemukan"}, status=status.HTTP_404_NOT_FOUND)
 
-        roles = Role.objects.filter(id__in=role_ids)
-        if roles.count() != len(role_ids):
-            return Response({"detail": "Ada role yang tidak ditemukan"}, status=status.HTTP_400_BAD_REQUEST)
+        missing = find_missing_ids(Role, role_ids)
+        if missing:
+            return Response(
+                {"detail": "Ada role yang tidak ditemukan", "missing_ids": missing},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        created = 0
-        for role in roles:
-            obj, is_created = UserRole.objects.get_or_create(user=user, role=role)
-            if is_created:
-                created += 1
+        created, _ = sync_links(UserRole, "user", [user.id], "role", role_ids)
 
         return Response(
             {
@@ -186,6 +250,91 @@ class UserRoleViewSet(viewsets.ViewSet):
             status=status.HTTP_200_OK
         )
 
+    @action(detail=False, methods=["post"], url_path="sync-roles")
+    def sync_roles(self, request):
+        """
+        Set role user menjadi persis role_ids
+        (yang tidak ada di list akan dihapus).
+        Body:
+        {
+          "user_id": 10,
+          "role_ids": [1,2]
+        }
+        """
+        serializer = SyncRolesToUserSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user_id = serializer.validated_data["user_id"]
+        role_ids = serializer.validated_data["role_ids"]
+
+        user = User.objects.filter(id=user_id).first()
+        if not user:
+            return Response({"detail": "User tidak ditemukan"}, status=status.HTTP_404_NOT_FOUND)
+
+        missing = find_missing_ids(Role, role_ids)
+        if missing:
+            return Response(
+                {"detail": "Ada role yang tidak ditemukan", "missing_ids": missing},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        created, deleted = sync_links(UserRole, "user", [user.id], "role", role_ids, replace=True)
+
+        return Response(
+            {
+                "message": "Sync role berhasil",
+                "user_id": user.id,
+                "created_count": created,
+                "deleted_count": deleted,
+            },
+            status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-assign-roles")
+    def bulk_assign_roles(self, request):
+        """
+        Assign role ke banyak user sekaligus (mis. saat reorganisasi).
+        replace=true -> role lain milik user tersebut dihapus.
+        Body:
+        {
+          "user_ids": [10, 11, 12],
+          "role_ids": [1, 2],
+          "replace": false
+        }
+        """
+        serializer = BulkAssignRoleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user_ids = serializer.validated_data["user_ids"]
+        role_ids = serializer.validated_data["role_ids"]
+        replace = serializer.validated_data["replace"]
+
+        missing_users = find_missing_ids(User, user_ids)
+        if missing_users:
+            return Response(
+                {"detail": "Ada user yang tidak ditemukan", "missing_ids": missing_users},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        missing_roles = find_missing_ids(Role, role_ids)
+        if missing_roles:
+            return Response(
+                {"detail": "Ada role yang tidak ditemukan", "missing_ids": missing_roles},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        created, deleted = sync_links(UserRole, "user", user_ids, "role", role_ids, replace=replace)
+
+        return Response(
+            {
+                "message": "Bulk assign role berhasil",
+                "user_count": len(set(user_ids)),
+                "created_count": created,
+                "deleted_count": deleted,
+            },
+            status=status.HTTP_200_OK
+        )
+
     @action(detail=False, methods=["post"], url_path="remove-roles")
     def remove_roles(self, request):
         """
@@ -205,10 +354,7 @@ class UserRoleViewSet(viewsets.ViewSet):
         if not user:
             return Response({"detail": "User tidak ditemukan"}, status=status.HTTP_404_NOT_FOUND)
 
-        deleted, _ = UserRole.objects.filter(
-            user=user,
-            role_id__in=role_ids
-        ).delete()
+        deleted = remove_links(UserRole, "user", user.id, "role", role_ids)
 
         return Response(
             {
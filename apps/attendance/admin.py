@@ -1,7 +1,8 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import Attendance, AttendanceSetting
+from .models import Attendance, AttendanceMonthlySummary, AttendanceSetting
+from .rollup import rebuild_employee_month
 
 
 @admin.register(AttendanceSetting)
@@ -33,6 +34,7 @@ class AttendanceAdmin(admin.ModelAdmin):
         "check_out_time",
         "working_minutes",
         "working_hours",
+        "auto_checked_out",
         "check_in_location_name",
         "check_out_location_name",
         "created_at",
@@ -41,6 +43,7 @@ class AttendanceAdmin(admin.ModelAdmin):
     list_filter = (
         "date",
         "status",
+        "auto_checked_out",
         "employee__department",
         "employee__position",
         "employee__employment_status",
@@ -70,3 +73,49 @@ class AttendanceAdmin(admin.ModelAdmin):
         return obj.employee.user.full_name
 
     get_full_name.short_description = "Full Name"
+
+    # edit manual di admin -> rollup bulan terkait dihitung ulang
+    def save_model(self, request, obj, form, change):
+        touched = {(obj.employee_id, obj.date)}
+        if change:
+            touched.add((form.initial.get("employee"), form.initial.get("date")))
+
+        super().save_model(request, obj, form, change)
+
+        for employee_id, day in touched:
+            if employee_id and day:
+                rebuild_employee_month(employee_id, day.year, day.month)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        rebuild_employee_month(obj.employee_id, obj.date.year, obj.date.month)
+
+    def delete_queryset(self, request, queryset):
+        touched = {
+            (employee_id, day.year, day.month)
+            for employee_id, day in queryset.values_list("employee_id", "date")
+        }
+        super().delete_queryset(request, queryset)
+
+        for employee_id, year, month in touched:
+            rebuild_employee_month(employee_id, year, month)
+
+
+@admin.register(AttendanceMonthlySummary)
+class AttendanceMonthlySummaryAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "employee",
+        "year",
+        "month",
+        "total_days",
+        "on_time_count",
+        "late_count",
+        "alpha_count",
+        "total_working_minutes",
+        "updated_at",
+    )
+    list_filter = ("year", "month")
+    search_fields = ("employee__employee_number", "employee__user__full_name")
+    ordering = ("-year", "-month", "employee")
+    readonly_fields = ("updated_at",)
@@ -0,0 +1,116 @@
+"""
+Materialisasi Attendance alpha.
+
+Employee aktif yang tidak punya Attendance dan tidak sedang leave
+approved di suatu hari kerja dibuatkan row Attendance status "alpha",
+sehingga laporan cukup menghitung status tanpa anti-join ke Employee.
+
+Kandidat dipilih dengan 1 query (NOT IN subquery Attendance & leave),
+dibaca per chunk id (keyset) lalu di-bulk_create(ignore_conflicts=True).
+Idempotent: menjalankan ulang hari yang sama tidak membuat duplikat
+(unique employee + date), dan backfill bisa dilanjutkan dari hari
+mana saja.
+"""
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.workdays import is_working_day
+from apps.employees.models import Employee
+from apps.leave.models import LeaveRequest
+
+from .models import Attendance
+from .rollup import rebuild_month
+
+logger = logging.getLogger(__name__)
+
+ALPHA_NOTES = "Alpha otomatis: tidak ada check-in"
+
+
+def absent_employees(day):
+    """
+    Queryset id employee yang wajib hadir di `day` tapi tidak ada record.
+    """
+    checked_in = Attendance.objects.filter(date=day).values("employee_id")
+    on_leave = LeaveRequest.objects.filter(
+        status="approved",
+        start_date__lte=day,
+        end_date__gte=day,
+    ).values("employee_id")
+
+    return (
+        Employee.objects.filter(
+            Q(join_date__isnull=True) | Q(join_date__lte=day),
+            Q(resign_date__isnull=True) | Q(resign_date__gte=day),
+            is_active_employee=True,
+        )
+        .exclude(id__in=checked_in)
+        .exclude(id__in=on_leave)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+@transaction.atomic
+def materialize_day(day, chunk_size=1000):
+    """
+    Buat row alpha untuk 1 hari. Return jumlah employee yang diproses.
+    Hari libur / weekend dilewati (return 0).
+    """
+    if not is_working_day(day):
+        return 0
+
+    employee_ids = []
+    last_id = 0
+    while True:
+        chunk = list(absent_employees(day).filter(id__gt=last_id)[:chunk_size])
+        if not chunk:
+            break
+
+        Attendance.objects.bulk_create(
+            [
+                Attendance(employee_id=employee_id, date=day, status="alpha", notes=ALPHA_NOTES)
+                for employee_id in chunk
+            ],
+            batch_size=chunk_size,
+            ignore_conflicts=True,
+        )
+        employee_ids.extend(chunk)
+        last_id = chunk[-1]
+
+    if employee_ids:
+        # banyak employee -> rebuild 1 bulan penuh lebih murah dari IN (...) raksasa
+        subset = employee_ids if len(employee_ids) <= chunk_size else None
+        rebuild_month(day.year, day.month, employee_ids=subset)
+
+    return len(employee_ids)
+
+
+def materialize_range(start, end, chunk_size=1000, on_day=None):
+    """
+    Backfill [start, end] (inclusive), 1 transaksi per hari supaya bisa
+    dihentikan & dilanjutkan. Hari ini / masa depan tidak diproses karena
+    employee masih bisa check-in.
+    """
+    end = min(end, timezone.localdate() - timedelta(days=1))
+
+    total = 0
+    day = start
+    while day <= end:
+        created = materialize_day(day, chunk_size=chunk_size)
+        total += created
+        if on_day:
+            on_day(day, created)
+        day += timedelta(days=1)
+
+    return total
+
+
+def materialize_yesterday():
+    day = timezone.localdate() - timedelta(days=1)
+    created = materialize_day(day)
+    logger.info("Alpha %s: %s employee", day, created)
+    return created
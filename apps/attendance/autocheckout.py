@@ -0,0 +1,140 @@
+"""
+Auto check-out untuk attendance yang lupa check-out.
+
+Row dengan check_in_time tapi tanpa check_out_time, yang tanggalnya
+sudah melewati jam pulang (AttendanceSetting.work_end_time) + grace
+(ATTENDANCE_AUTO_CHECKOUT_GRACE_MINUTES), ditutup dengan:
+
+    check_out_time   = MAX(check_in_time, tanggal + jam pulang)
+    working_minutes  = selisih menit check-in -> check-out
+    working_hours    = working_minutes / 60
+    auto_checked_out = True  (antrean review HR)
+
+1 UPDATE set-based per tanggal (jam pulang kebijakan sama untuk semua
+row di tanggal tersebut), lalu rollup bulan terkait dihitung ulang.
+"""
+import logging
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import DateTimeField, F, FloatField, Func, IntegerField, Value
+from django.db.models.functions import Cast, Greatest, Round
+from django.utils import timezone
+
+from .models import Attendance
+from .rollup import rebuild_month
+from .utils import get_active_setting
+
+logger = logging.getLogger(__name__)
+
+
+class MinutesBetween(Func):
+    """
+    Selisih menit (integer, dibulatkan ke bawah) dua datetime: end - start.
+    """
+    output_field = IntegerField()
+    arity = 2
+
+    # template per database, {start} / {end} = SQL kedua argumen
+    templates = {
+        "mysql": "TIMESTAMPDIFF(MINUTE, {start}, {end})",
+        "postgresql": "FLOOR(EXTRACT(EPOCH FROM ({end} - {start})) / 60)::integer",
+        "sqlite": "((CAST(strftime('%%s', {end}) AS INTEGER) - CAST(strftime('%%s', {start}) AS INTEGER)) / 60)",
+    }
+
+    def as_sql(self, compiler, connection, **extra_context):
+        template = self.templates.get(connection.vendor)
+        if template is None:
+            raise NotImplementedError(f"MinutesBetween belum didukung di {connection.vendor}.")
+
+        start_sql, start_params = compiler.compile(self.source_expressions[0])
+        end_sql, end_params = compiler.compile(self.source_expressions[1])
+
+        # urutan params mengikuti urutan kemunculan di template
+        if template.index("{start}") < template.index("{end}"):
+            params = (*start_params, *end_params)
+        else:
+            params = (*end_params, *start_params)
+
+        return template.format(start=start_sql, end=end_sql), params
+
+
+def work_end_time():
+    setting = get_active_setting()
+    return setting.work_end_time if setting else time(17, 0)
+
+
+def policy_check_out(day, end_time):
+    return timezone.make_aware(datetime.combine(day, end_time))
+
+
+def last_closable_date(now, end_time):
+    """
+    Tanggal terakhir yang jam pulang + grace-nya sudah lewat.
+    """
+    grace = timedelta(minutes=settings.ATTENDANCE_AUTO_CHECKOUT_GRACE_MINUTES)
+    today = timezone.localtime(now).date()
+
+    if policy_check_out(today, end_time) + grace <= now:
+        return today
+    return today - timedelta(days=1)
+
+
+@transaction.atomic
+def close_day(day, end_time):
+    """
+    Tutup semua row terbuka di 1 tanggal. Return (jumlah row, employee_ids).
+    """
+    open_qs = Attendance.objects.filter(
+        date=day,
+        check_in_time__isnull=False,
+        check_out_time__isnull=True,
+    )
+    employee_ids = list(open_qs.values_list("employee_id", flat=True))
+    if not employee_ids:
+        return 0, []
+
+    check_out = Greatest(F("check_in_time"), Value(policy_check_out(day, end_time), output_field=DateTimeField()))
+    minutes = MinutesBetween(F("check_in_time"), check_out)
+
+    updated = open_qs.update(
+        check_out_time=check_out,
+        working_minutes=minutes,
+        working_hours=Round(Cast(minutes, FloatField()) / 60, 2),
+        auto_checked_out=True,
+        updated_at=timezone.now(),
+    )
+    return updated, employee_ids
+
+
+def close_open_attendances(now=None, chunk_size=1000):
+    """
+    Job auto check-out. Return jumlah row yang ditutup.
+    """
+    now = now or timezone.now()
+    end_time = work_end_time()
+    until = last_closable_date(now, end_time)
+
+    days = (
+        Attendance.objects.filter(
+            date__lte=until,
+            check_in_time__isnull=False,
+            check_out_time__isnull=True,
+        )
+        .order_by("date")
+        .values_list("date", flat=True)
+        .distinct()
+    )
+
+    total = 0
+    for day in list(days):
+        updated, employee_ids = close_day(day, end_time)
+        total += updated
+
+        if employee_ids:
+            subset = employee_ids if len(employee_ids) <= chunk_size else None
+            rebuild_month(day.year, day.month, employee_ids=subset)
+            logger.info("Auto check-out %s: %s row", day, updated)
+
+    return total
@@ -0,0 +1,136 @@
+"""
+Export attendance ke CSV / XLSX dengan memori konstan.
+
+- CSV  : StreamingHttpResponse, baris dikirim ke client sambil dibaca
+- XLSX : openpyxl write-only (baris langsung di-flush ke file temp),
+         lalu file di-stream dengan FileResponse
+
+Data dibaca per batch keyset (date, id) lewat .values(), tanpa membuat
+instance model. Teks bebas (notes, lokasi, nama) di-escape supaya tidak
+dieksekusi sebagai formula oleh Excel / LibreOffice.
+"""
+import csv
+import tempfile
+from datetime import datetime
+
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from openpyxl import Workbook
+
+from apps.core.pagination import iterate_keyset
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_ORDERING = ("date", "id")
+
+# (header, field .values())
+EXPORT_COLUMNS = (
+    ("Date", "date"),
+    ("Employee Number", "employee__employee_number"),
+    ("Full Name", "employee__user__full_name"),
+    ("Department", "employee__department__name"),
+    ("Status", "status"),
+    ("Check In", "check_in_time"),
+    ("Check Out", "check_out_time"),
+    ("Working Minutes", "working_minutes"),
+    ("Working Hours", "working_hours"),
+    ("Check In Location", "check_in_location_name"),
+    ("Check Out Location", "check_out_location_name"),
+    ("Notes", "notes"),
+)
+
+EXPORT_FIELDS = [field for _, field in EXPORT_COLUMNS]
+
+FILE_TYPES = ("csv", "xlsx")
+
+# awalan yang dibaca spreadsheet sebagai formula (CSV / formula injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def local_naive(value):
+    """
+    Datetime aware (UTC) -> jam lokal tanpa tzinfo (openpyxl tidak
+    menerima tzinfo, dan HR membaca jam lokal).
+    """
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    return value
+
+
+def escape_formula(value):
+    """
+    Teks yang diawali karakter formula diberi prefix ' sehingga dibaca
+    sebagai teks biasa. Angka / tanggal tidak diubah.
+    """
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_export_rows(queryset):
+    rows = iterate_keyset(
+        queryset,
+        EXPORT_ORDERING,
+        EXPORT_FIELDS,
+        chunk_size=EXPORT_CHUNK_SIZE,
+    )
+    for row in rows:
+        yield [escape_formula(local_naive(row[field])) for field in EXPORT_FIELDS]
+
+
+class Echo:
+    """
+    Pseudo-buffer untuk csv.writer: write() langsung return barisnya.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(queryset):
+    writer = csv.writer(Echo())
+    # BOM supaya Excel membaca UTF-8 dengan benar
+    yield "﻿" + writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    for row in iter_export_rows(queryset):
+        yield writer.writerow(["" if value is None else value for value in row])
+
+
+def csv_response(queryset, filename):
+    response = StreamingHttpResponse(iter_csv(queryset), content_type=CONTENT_TYPES["csv"])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+    return response
+
+
+def write_xlsx(queryset, file):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Attendance")
+
+    sheet.append([header for header, _ in EXPORT_COLUMNS])
+    for row in iter_export_rows(queryset):
+        sheet.append(row)
+
+    workbook.save(file)
+
+
+def xlsx_response(queryset, filename):
+    # TemporaryFile otomatis terhapus saat FileResponse menutup file
+    file = tempfile.TemporaryFile(suffix=".xlsx")
+    write_xlsx(queryset, file)
+    file.seek(0)
+
+    return FileResponse(
+        file,
+        as_attachment=True,
+        filename=f"{filename}.xlsx",
+        content_type=CONTENT_TYPES["xlsx"],
+    )
+
+
+def export_response(queryset, file_type, filename):
+    if file_type == "xlsx":
+        return xlsx_response(queryset, filename)
+    return csv_response(queryset, filename)
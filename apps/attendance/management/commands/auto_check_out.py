@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.attendance.autocheckout import close_open_attendances
+
+
+class Command(BaseCommand):
+    help = "Tutup attendance tanpa check-out yang sudah lewat jam pulang + grace"
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING("🚀 Auto check-out..."))
+        closed = close_open_attendances()
+        self.stdout.write(self.style.SUCCESS(f"🎉 Selesai, {closed} attendance ditutup."))
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.attendance.alpha import materialize_range
+
+
+def parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Format tanggal harus YYYY-MM-DD, bukan '{value}'.")
+
+
+class Command(BaseCommand):
+    help = "Buat Attendance alpha untuk employee tanpa check-in & tanpa leave approved"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="start", help="Tanggal awal YYYY-MM-DD (default: kemarin)")
+        parser.add_argument("--to", dest="end", help="Tanggal akhir YYYY-MM-DD (default: sama dengan --from)")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        yesterday = timezone.localdate() - timedelta(days=1)
+
+        start = parse_date(options["start"]) if options["start"] else yesterday
+        end = parse_date(options["end"]) if options["end"] else start
+
+        if end < start:
+            raise CommandError("--to tidak boleh lebih kecil dari --from.")
+        if start > yesterday:
+            raise CommandError("Hanya hari yang sudah lewat yang bisa diproses.")
+
+        self.stdout.write(self.style.WARNING(f"🚀 Materialisasi alpha {start} s/d {end}..."))
+
+        def report(day, created):
+            self.stdout.write(f"  {day}: {created} employee")
+
+        total = materialize_range(start, end, chunk_size=options["chunk_size"], on_day=report)
+
+        self.stdout.write(self.style.SUCCESS(f"🎉 Selesai, {total} employee diproses."))
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.employees.models import Employee
+from apps.attendance.rollup import iter_months, rebuild_month
+
+
+def parse_month(value):
+    try:
+        parsed = datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise CommandError(f"Format bulan harus YYYY-MM, bukan '{value}'.")
+    return parsed.year, parsed.month
+
+
+class Command(BaseCommand):
+    help = "Rebuild rollup AttendanceMonthlySummary untuk range bulan (YYYY-MM)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="start", help="Bulan awal YYYY-MM (default: bulan ini)")
+        parser.add_argument("--to", dest="end", help="Bulan akhir YYYY-MM (default: sama dengan --from)")
+        parser.add_argument(
+            "--employee",
+            dest="employee_numbers",
+            action="append",
+            help="Batasi ke employee_number tertentu (boleh diulang)",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+
+        start = parse_month(options["start"]) if options["start"] else (today.year, today.month)
+        end = parse_month(options["end"]) if options["end"] else start
+
+        if end < start:
+            raise CommandError("--to tidak boleh lebih kecil dari --from.")
+
+        employee_ids = None
+        if options["employee_numbers"]:
+            employee_ids = list(
+                Employee.objects.filter(
+                    employee_number__in=options["employee_numbers"]
+                ).values_list("id", flat=True)
+            )
+
+        self.stdout.write(self.style.WARNING(
+            f"🚀 Rebuild attendance summary {start[0]}-{start[1]:02d} s/d {end[0]}-{end[1]:02d}..."
+        ))
+
+        total = 0
+        for year, month in iter_months(*start, *end):
+            written = rebuild_month(year, month, employee_ids=employee_ids)
+            total += written
+            self.stdout.write(f"  {year}-{month:02d}: {written} row")
+
+        self.stdout.write(self.style.SUCCESS(f"🎉 Rebuild selesai, {total} row rollup ditulis."))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0003_alter_attendance_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="attendance",
+            name="check_in_photo_thumb",
+            field=models.ImageField(
+                blank=True, null=True, upload_to="attendance/checkin/thumbs/"
+            ),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="check_out_photo_thumb",
+            field=models.ImageField(
+                blank=True, null=True, upload_to="attendance/checkout/thumbs/"
+            ),
+        ),
+    ]
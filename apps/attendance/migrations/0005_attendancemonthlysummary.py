@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0004_attendance_check_in_photo_thumb_and_more"),
+        ("employees", "0002_alter_employee_employee_number"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendanceMonthlySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveSmallIntegerField()),
+                ("month", models.PositiveSmallIntegerField()),
+                ("total_days", models.PositiveIntegerField(default=0)),
+                ("on_time_count", models.PositiveIntegerField(default=0)),
+                ("late_count", models.PositiveIntegerField(default=0)),
+                ("alpha_count", models.PositiveIntegerField(default=0)),
+                ("total_working_minutes", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attendance_summaries",
+                        to="employees.employee",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "attendance_monthly_summaries",
+                "ordering": ["-year", "-month"],
+                "indexes": [
+                    models.Index(
+                        fields=["year", "month"], name="att_summary_period_idx"
+                    )
+                ],
+                "unique_together": {("employee", "year", "month")},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0005_attendancemonthlysummary"),
+        ("employees", "0002_alter_employee_employee_number"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["date", "status"], name="att_date_status_idx"),
+        ),
+    ]
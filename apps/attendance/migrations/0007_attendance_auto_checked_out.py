@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0006_attendance_att_date_status_idx"),
+        ("employees", "0003_employee_hierarchy"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="attendance",
+            name="auto_checked_out",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["auto_checked_out", "date"], name="att_auto_checkout_idx"
+            ),
+        ),
+    ]
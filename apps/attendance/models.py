@@ -46,6 +46,10 @@ class Attendance(models.Model):
     check_in_photo = models.ImageField(upload_to="attendance/checkin/", null=True, blank=True)
     check_out_photo = models.ImageField(upload_to="attendance/checkout/", null=True, blank=True)
 
+    # diisi oleh job pemrosesan foto (apps.attendance.photos)
+    check_in_photo_thumb = models.ImageField(upload_to="attendance/checkin/thumbs/", null=True, blank=True)
+    check_out_photo_thumb = models.ImageField(upload_to="attendance/checkout/thumbs/", null=True, blank=True)
+
     check_in_lat = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     check_in_lng = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     check_in_location_name = models.CharField(max_length=255, null=True, blank=True)
@@ -59,13 +63,23 @@ class Attendance(models.Model):
     
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="on_time")
     notes = models.TextField(null=True, blank=True)
+
+    # check-out diisi job auto check-out (apps.attendance.autocheckout), perlu review HR
+    auto_checked_out = models.BooleanField(default=False)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # unique (employee, date) sekaligus jadi index listing per employee
         unique_together = ("employee", "date")
         ordering = ["-date"]
+        indexes = [
+            # listing HR per periode (+ filter status)
+            models.Index(fields=["date", "status"], name="att_date_status_idx"),
+            # antrean review HR untuk row auto check-out
+            models.Index(fields=["auto_checked_out", "date"], name="att_auto_checkout_idx"),
+        ]
         permissions = [
             ("view_all", "Can view all attendance"),
         ]
@@ -74,6 +88,42 @@ class Attendance(models.Model):
         return f"{self.employee.employee_number} - {self.date}"
 
 
+class AttendanceMonthlySummary(models.Model):
+    """
+    Rollup attendance per employee per bulan.
+    Di-maintain incremental dari check-in/check-out dan edit HR
+    (lihat rollup.py). Rebuild manual:
+    python manage.py rebuild_attendance_summary --from 2024-01 --to 2026-12
+    """
+    employee = models.ForeignKey(
+        "employees.Employee",
+        on_delete=models.CASCADE,
+        related_name="attendance_summaries",
+    )
+
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+
+    total_days = models.PositiveIntegerField(default=0)
+    on_time_count = models.PositiveIntegerField(default=0)
+    late_count = models.PositiveIntegerField(default=0)
+    alpha_count = models.PositiveIntegerField(default=0)
+    total_working_minutes = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "attendance_monthly_summaries"
+        unique_together = ("employee", "year", "month")
+        ordering = ["-year", "-month"]
+        indexes = [
+            models.Index(fields=["year", "month"], name="att_summary_period_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.employee.employee_number} - {self.year}/{self.month:02d}"
+
+
 # class Attendance(models.Model):
 #     STATUS_CHOICES = [
 #         ("on_time", "On Time"),
@@ -0,0 +1,103 @@
+"""
+Pipeline foto check-in / check-out.
+
+Request hanya memindahkan upload ke folder spool lalu enqueue job.
+Job (tasks.process_attendance_photo) melakukan resize + re-encode JPEG,
+membuat thumbnail, membuang EXIF, lalu menempelkan hasilnya ke Attendance.
+"""
+import io
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from apps.core.background import enqueue
+
+from .models import Attendance
+
+logger = logging.getLogger(__name__)
+
+# kind -> (field foto, field thumbnail)
+PHOTO_FIELDS = {
+    "check_in": ("check_in_photo", "check_in_photo_thumb"),
+    "check_out": ("check_out_photo", "check_out_photo_thumb"),
+}
+
+
+def spool_upload(uploaded_file):
+    """
+    Simpan upload ke folder spool, return path file.
+    Upload besar yang sudah berupa temp file cukup dipindahkan (tanpa copy).
+    """
+    os.makedirs(settings.ATTENDANCE_PHOTO_SPOOL_DIR, exist_ok=True)
+
+    fd, path = tempfile.mkstemp(prefix="photo-", dir=settings.ATTENDANCE_PHOTO_SPOOL_DIR)
+
+    if hasattr(uploaded_file, "temporary_file_path"):
+        os.close(fd)
+        shutil.move(uploaded_file.temporary_file_path(), path)
+        return path
+
+    with os.fdopen(fd, "wb") as out:
+        for chunk in uploaded_file.chunks():
+            out.write(chunk)
+
+    return path
+
+
+def ingest_photo(attendance_id, kind, uploaded_file):
+    """
+    Dipanggil dari view: spool upload lalu enqueue pemrosesan.
+    """
+    from .tasks import process_attendance_photo
+
+    if not uploaded_file or not hasattr(uploaded_file, "chunks"):
+        return
+
+    spool_path = spool_upload(uploaded_file)
+    enqueue(process_attendance_photo, attendance_id, kind, spool_path)
+
+
+def encode_jpeg(image, max_size):
+    image = image.copy()
+    image.thumbnail((max_size, max_size), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    # tanpa parameter exif -> metadata EXIF tidak ikut tersimpan
+    image.save(buffer, format="JPEG", quality=settings.ATTENDANCE_PHOTO_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def process_photo(attendance_id, kind, spool_path):
+    photo_field, thumb_field = PHOTO_FIELDS[kind]
+
+    attendance = Attendance.objects.filter(pk=attendance_id).only("id").first()
+    if not attendance:
+        return
+
+    try:
+        with Image.open(spool_path) as source:
+            image = ImageOps.exif_transpose(source).convert("RGB")
+    except (UnidentifiedImageError, OSError):
+        logger.warning("Foto %s attendance %s tidak valid", kind, attendance_id)
+        return
+
+    photo = encode_jpeg(image, settings.ATTENDANCE_PHOTO_MAX_SIZE)
+    thumb = encode_jpeg(image, settings.ATTENDANCE_PHOTO_THUMB_SIZE)
+
+    name = f"{attendance_id}_{uuid.uuid4().hex[:8]}.jpg"
+    getattr(attendance, photo_field).save(name, ContentFile(photo), save=False)
+    getattr(attendance, thumb_field).save(name, ContentFile(thumb), save=False)
+
+    # update kolom foto saja, supaya tidak menimpa perubahan lain (mis. check-out)
+    Attendance.objects.filter(pk=attendance_id).update(
+        **{
+            photo_field: getattr(attendance, photo_field).name,
+            thumb_field: getattr(attendance, thumb_field).name,
+        }
+    )
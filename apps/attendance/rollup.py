@@ -0,0 +1,141 @@
+"""
+Maintenance tabel rollup AttendanceMonthlySummary.
+
+- record_check_in / record_check_out : increment (F()) dari fast path
+- rebuild_employee_month             : hitung ulang 1 employee-bulan
+                                       (edit HR / admin, row yang sudah ada)
+- rebuild_month                      : hitung ulang 1 bulan penuh
+                                       (command rebuild & job batch)
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from apps.core.dates import month_bounds
+
+from .models import Attendance, AttendanceMonthlySummary
+
+STATUS_COUNT_FIELDS = {
+    "on_time": "on_time_count",
+    "late": "late_count",
+    "alpha": "alpha_count",
+}
+
+ROLLUP_METRICS = {
+    "total_days": Count("id"),
+    "on_time_count": Count("id", filter=Q(status="on_time")),
+    "late_count": Count("id", filter=Q(status="late")),
+    "alpha_count": Count("id", filter=Q(status="alpha")),
+    "total_working_minutes": Sum("working_minutes"),
+}
+
+
+def increment(employee_id, year, month, **amounts):
+    lookup = {"employee_id": employee_id, "year": year, "month": month}
+    changes = {field: F(field) + value for field, value in amounts.items()}
+
+    updated = AttendanceMonthlySummary.objects.filter(**lookup).update(
+        updated_at=timezone.now(), **changes
+    )
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            AttendanceMonthlySummary.objects.create(**lookup, **amounts)
+    except IntegrityError:
+        # row dibuat request lain di antara UPDATE dan INSERT
+        AttendanceMonthlySummary.objects.filter(**lookup).update(
+            updated_at=timezone.now(), **changes
+        )
+
+
+def record_check_in(attendance):
+    """
+    Attendance baru (INSERT) -> +1 hari & +1 status.
+    """
+    increment(
+        attendance.employee_id,
+        attendance.date.year,
+        attendance.date.month,
+        total_days=1,
+        **{STATUS_COUNT_FIELDS[attendance.status]: 1},
+    )
+
+
+def record_check_out(attendance):
+    if attendance.working_minutes:
+        increment(
+            attendance.employee_id,
+            attendance.date.year,
+            attendance.date.month,
+            total_working_minutes=attendance.working_minutes,
+        )
+
+
+def rebuild_employee_month(employee_id, year, month):
+    start, end = month_bounds(year, month)
+
+    totals = Attendance.objects.filter(
+        employee_id=employee_id,
+        date__gte=start,
+        date__lt=end,
+    ).aggregate(**ROLLUP_METRICS)
+    totals["total_working_minutes"] = totals["total_working_minutes"] or 0
+
+    lookup = {"employee_id": employee_id, "year": year, "month": month}
+
+    if not totals["total_days"]:
+        AttendanceMonthlySummary.objects.filter(**lookup).delete()
+        return
+
+    AttendanceMonthlySummary.objects.update_or_create(defaults=totals, **lookup)
+
+
+@transaction.atomic
+def rebuild_month(year, month, employee_ids=None, batch_size=1000):
+    """
+    Hitung ulang rollup 1 bulan dengan 1 query GROUP BY employee,
+    lalu delete + bulk_create. employee_ids=None -> semua employee.
+    Return jumlah row rollup yang ditulis.
+    """
+    start, end = month_bounds(year, month)
+
+    attendance_qs = Attendance.objects.filter(date__gte=start, date__lt=end)
+    summary_qs = AttendanceMonthlySummary.objects.filter(year=year, month=month)
+
+    if employee_ids is not None:
+        attendance_qs = attendance_qs.filter(employee_id__in=employee_ids)
+        summary_qs = summary_qs.filter(employee_id__in=employee_ids)
+
+    rows = (
+        attendance_qs.order_by()
+        .values("employee_id")
+        .annotate(**ROLLUP_METRICS)
+    )
+
+    summaries = [
+        AttendanceMonthlySummary(
+            year=year,
+            month=month,
+            employee_id=row["employee_id"],
+            total_days=row["total_days"],
+            on_time_count=row["on_time_count"],
+            late_count=row["late_count"],
+            alpha_count=row["alpha_count"],
+            total_working_minutes=row["total_working_minutes"] or 0,
+        )
+        for row in rows
+    ]
+
+    summary_qs.delete()
+    AttendanceMonthlySummary.objects.bulk_create(summaries, batch_size=batch_size)
+
+    return len(summaries)
+
+
+def iter_months(start_year, start_month, end_year, end_month):
+    year, month = start_year, start_month
+    while (year, month) <= (end_year, end_month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
@@ -35,10 +35,13 @@ class AttendanceSerializer(serializers.ModelSerializer):
 
             "check_in_photo",
             "check_out_photo",
+            "check_in_photo_thumb",
+            "check_out_photo_thumb",
 
             "status",
             "working_minutes",
             "working_hours",
+            "auto_checked_out",
             "notes",
 
             "created_at",
@@ -49,6 +52,8 @@ class AttendanceSerializer(serializers.ModelSerializer):
             "date",
             "check_in_time",
             "check_out_time",
+            "check_in_photo_thumb",
+            "check_out_photo_thumb",
             "status",
             "working_minutes",
             "working_hours",
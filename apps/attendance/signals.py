@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import AttendanceSetting
+from .utils import invalidate_active_setting
+
+
+@receiver(post_save, sender=AttendanceSetting, dispatch_uid="attendance_setting_saved")
+@receiver(post_delete, sender=AttendanceSetting, dispatch_uid="attendance_setting_deleted")
+def invalidate_attendance_setting_cache(sender, **kwargs):
+    # setelah commit: sebelum itu request lain bisa meng-cache row lama
+    transaction.on_commit(invalidate_active_setting)
@@ -0,0 +1,34 @@
+import os
+
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def process_attendance_photo(attendance_id, kind, spool_path):
+    from .photos import process_photo
+
+    try:
+        process_photo(attendance_id, kind, spool_path)
+    finally:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+
+
+@shared_task(ignore_result=True)
+def materialize_alpha():
+    """
+    Dijadwalkan Celery beat (CELERY_BEAT_SCHEDULE) setiap malam untuk hari kemarin.
+    """
+    from .alpha import materialize_yesterday
+
+    materialize_yesterday()
+
+
+@shared_task(ignore_result=True)
+def auto_check_out():
+    """
+    Dijadwalkan Celery beat: tutup attendance yang lupa check-out.
+    """
+    from .autocheckout import close_open_attendances
+
+    close_open_attendances()
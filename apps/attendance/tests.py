@@ -1,3 +1,457 @@
 from django.test import TestCase
 
 # Create your tests here.
+import csv
+import io
+import tempfile
+from datetime import date, datetime, time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+
+from django.contrib import admin
+from django.db import connection
+from django.db.models import F
+from django.test import override_settings
+from django.utils import timezone
+from openpyxl import load_workbook
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.accounts.models import User
+from apps.core import workdays
+from apps.core.models import Holiday
+from apps.employees.models import Department, Employee
+from apps.leave.models import LeaveRequest, LeaveType
+from .admin import AttendanceAdmin
+from .alpha import materialize_day, materialize_range
+from .autocheckout import MinutesBetween, close_open_attendances
+from .exports import escape_formula
+from .models import Attendance, AttendanceMonthlySummary, AttendanceSetting
+from .rollup import rebuild_month
+from .utils import get_active_setting
+from .views import AttendanceViewSet
+
+SQLITE_EXPLAIN = skipUnless(connection.vendor == "sqlite", "format EXPLAIN khusus SQLite")
+
+
+class AttendanceListingIndexTest(TestCase):
+    """
+    Listing attendance per periode harus memakai index, bukan full scan.
+    Test EXPLAIN hanya jalan di SQLite (planner DB test). Nama index sama
+    di MySQL, tetapi format & pilihan plan-nya berbeda, jadi di engine lain
+    test EXPLAIN di-skip; test range half-open tidak bergantung engine.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user(
+            email="hr@example.com",
+            password="secret",
+            full_name="HR",
+            is_staff=True,
+        )
+        employee_user = User.objects.create_user(
+            email="emp@example.com",
+            password="secret",
+            full_name="Employee",
+        )
+        cls.employee = Employee.objects.create(user=employee_user, employee_number="20260001")
+
+        Attendance.objects.bulk_create([
+            Attendance(employee=cls.employee, date=date(2026, 1, day), status="on_time")
+            for day in range(1, 29)
+        ])
+
+    def get_listing_queryset(self, user, **params):
+        request = Request(APIRequestFactory().get("/api/attendance/attendances/", params))
+        request.user = user
+
+        view = AttendanceViewSet()
+        view.request = request
+        view.format_kwarg = None
+        return view.get_queryset()
+
+    def test_period_filter_is_half_open_range(self):
+        qs = self.get_listing_queryset(self.hr, year=2026, month=1)
+        sql = str(qs.query)
+
+        self.assertNotIn("django_date_extract", sql)
+        self.assertNotIn("EXTRACT", sql.upper())
+        self.assertEqual(qs.count(), 28)
+
+    @SQLITE_EXPLAIN
+    def test_hr_period_listing_uses_date_status_index(self):
+        qs = self.get_listing_queryset(self.hr, year=2026, month=1)
+        self.assertIn("att_date_status_idx", qs.explain())
+
+    @SQLITE_EXPLAIN
+    def test_employee_listing_uses_employee_date_index(self):
+        qs = self.get_listing_queryset(self.employee.user, year=2026, month=1)
+        plan = qs.explain()
+
+        # index dari unique_together (employee, date)
+        self.assertRegex(plan, r"employee_id_date_\w+_uniq|attendance_attendance_employee_id_date")
+
+
+class ActiveSettingCacheTest(TestCase):
+    """
+    Edit AttendanceSetting langsung dipakai check-in di semua worker.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.setting = AttendanceSetting.objects.create(work_start_time=time(8, 0))
+
+    def edit_elsewhere(self, **values):
+        # UPDATE tanpa signal = edit oleh worker lain
+        AttendanceSetting.objects.filter(id=self.setting.id).update(**values)
+
+    def test_process_local_cache_is_not_used(self):
+        self.assertEqual(get_active_setting().work_start_time, time(8, 0))
+
+        self.edit_elsewhere(work_start_time=time(9, 0))
+
+        self.assertEqual(get_active_setting().work_start_time, time(9, 0))
+
+    def test_shared_cache_invalidated_on_commit(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            },
+        }):
+            self.assertEqual(get_active_setting().work_start_time, time(8, 0))
+
+            with self.captureOnCommitCallbacks(execute=True):
+                setting = AttendanceSetting.objects.get(id=self.setting.id)
+                setting.work_start_time = time(9, 0)
+                setting.save()
+                # belum commit -> cache lama masih dipakai
+                self.assertEqual(get_active_setting().work_start_time, time(8, 0))
+
+            self.assertEqual(get_active_setting().work_start_time, time(9, 0))
+
+
+@override_settings(ATTENDANCE_DEVICE_ENFORCEMENT="off")
+class AttendanceRollupTest(TestCase):
+    """
+    Rollup AttendanceMonthlySummary yang di-update incremental (check-in,
+    check-out, edit HR) harus sama dengan hitung ulang penuh, dan summary
+    dari rollup sama dengan summary dari Attendance langsung.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        AttendanceSetting.objects.create(work_start_time=time(8, 0), late_tolerance_minutes=10)
+
+        cls.hr = User.objects.create_user(email="hr@example.com", password="secret", full_name="HR", is_staff=True)
+
+        engineering = Department.objects.create(name="Engineering", code="ENG")
+        finance = Department.objects.create(name="Finance", code="FIN")
+        cls.employees = [
+            Employee.objects.create(
+                user=User.objects.create_user(email=f"emp{index}@example.com", password="secret", full_name="Emp"),
+                employee_number=f"2026000{index}",
+                department=department,
+            )
+            for index, department in enumerate((engineering, engineering, finance))
+        ]
+
+    def at(self, day, hour, minute=0):
+        return timezone.make_aware(datetime(2026, 3, day, hour, minute))
+
+    def act(self, employee, action, now):
+        client = APIClient()
+        client.force_authenticate(employee.user)
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            response = client.post(f"/api/attendance/attendance-actions/{action}/", {})
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def admin_save(self, attendance, change=False):
+        form = SimpleNamespace(initial={"employee": attendance.employee_id, "date": attendance.date})
+        AttendanceAdmin(Attendance, admin.site).save_model(None, attendance, form, change)
+
+    def rollup(self):
+        return list(
+            AttendanceMonthlySummary.objects.order_by("employee_id", "year", "month").values_list(
+                "employee_id",
+                "year",
+                "month",
+                "total_days",
+                "on_time_count",
+                "late_count",
+                "alpha_count",
+                "total_working_minutes",
+            )
+        )
+
+    def summary(self, **params):
+        client = APIClient()
+        client.force_authenticate(self.hr)
+        response = client.get("/api/attendance/attendance-actions/summary/", params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_incremental_rollup_matches_full_recompute(self):
+        first, second, third = self.employees
+
+        self.assertEqual(self.act(first, "check_in", self.at(2, 7, 55))["status"], "on_time")
+        self.assertEqual(self.act(second, "check_in", self.at(2, 9, 0))["status"], "late")
+        self.act(first, "check_out", self.at(2, 17, 0))
+        self.act(second, "check_out", self.at(2, 17, 30))
+        self.act(first, "check_in", self.at(3, 8, 5))
+
+        # edit status oleh HR (admin) + row alpha yang sudah ada lalu diisi check-in
+        late = Attendance.objects.get(employee=second, date=date(2026, 3, 2))
+        late.status = "on_time"
+        self.admin_save(late, change=True)
+
+        self.admin_save(Attendance(employee=third, date=date(2026, 3, 2), status="alpha"))
+        self.admin_save(Attendance(employee=third, date=date(2026, 3, 3), status="alpha"))
+        self.assertEqual(self.act(third, "check_in", self.at(3, 9, 0))["status"], "late")
+
+        incremental = self.rollup()
+        self.assertEqual(incremental, [
+            (first.id, 2026, 3, 2, 2, 0, 0, 545),
+            (second.id, 2026, 3, 1, 1, 0, 0, 510),
+            (third.id, 2026, 3, 2, 0, 1, 1, 0),
+        ])
+
+        rebuild_month(2026, 3)
+        self.assertEqual(self.rollup(), incremental)
+
+        # summary per department & status: rollup == Attendance langsung
+        from_rollup = self.summary(year=2026, month=3, group_by="department")
+        from_attendance = self.summary(year=2026, month=3, group_by="department", auto_checked_out="false")
+        self.assertEqual(from_rollup["results"], from_attendance["results"])
+        self.assertEqual(
+            [(row["department_name"], row["on_time"], row["late"], row["alpha"]) for row in from_rollup["results"]],
+            [("Engineering", 3, 0, 0), ("Finance", 0, 1, 1)],
+        )
+
+
+class AlphaMaterializationTest(TestCase):
+    """
+    Row alpha hanya untuk hari kerja, employee aktif tanpa attendance &
+    tanpa leave approved; dijalankan ulang tidak membuat duplikat.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Holiday.objects.create(date=date(2026, 3, 3), name="Libur")
+
+        def employee(index, **fields):
+            user = User.objects.create_user(email=f"emp{index}@example.com", password="secret", full_name="Emp")
+            return Employee.objects.create(user=user, employee_number=f"2026000{index}", **fields)
+
+        cls.present = employee(1)
+        cls.absent = employee(2)
+        cls.on_leave = employee(3)
+        cls.inactive = employee(4, is_active_employee=False)
+        cls.not_joined = employee(5, join_date=date(2026, 3, 10))
+        cls.resigned = employee(6, resign_date=date(2026, 3, 1))
+
+        Attendance.objects.create(employee=cls.present, date=date(2026, 3, 2), status="on_time")
+        LeaveRequest.objects.create(
+            employee=cls.on_leave,
+            leave_type=LeaveType.objects.create(code="ANNUAL", name="Annual Leave"),
+            start_date=date(2026, 3, 2),
+            end_date=date(2026, 3, 2),
+            total_days=1,
+            status="approved",
+        )
+
+    def setUp(self):
+        workdays.invalidate()
+        self.addCleanup(workdays.invalidate)
+
+    def alpha_employees(self, day):
+        return set(Attendance.objects.filter(date=day, status="alpha").values_list("employee_id", flat=True))
+
+    def test_only_absent_employees_on_workdays(self):
+        self.assertEqual(materialize_day(date(2026, 3, 2)), 1)
+        self.assertEqual(self.alpha_employees(date(2026, 3, 2)), {self.absent.id})
+
+        # rollup ikut dihitung ulang
+        summary = AttendanceMonthlySummary.objects.get(employee=self.absent, year=2026, month=3)
+        self.assertEqual((summary.total_days, summary.alpha_count), (1, 1))
+
+    def test_holiday_and_weekend_are_skipped(self):
+        self.assertEqual(materialize_day(date(2026, 3, 3)), 0)
+        self.assertEqual(materialize_day(date(2026, 3, 7)), 0)
+        self.assertFalse(Attendance.objects.filter(status="alpha").exists())
+
+    def test_rerun_creates_nothing_new(self):
+        materialize_range(date(2026, 3, 2), date(2026, 3, 6))
+        count = Attendance.objects.count()
+
+        self.assertEqual(materialize_range(date(2026, 3, 2), date(2026, 3, 6)), 0)
+        self.assertEqual(Attendance.objects.count(), count)
+
+        # 2, 4, 5, 6 Maret hari kerja (3 Maret libur)
+        self.assertEqual(
+            Attendance.objects.filter(employee=self.absent, status="alpha").count(),
+            4,
+        )
+
+
+@override_settings(ATTENDANCE_AUTO_CHECKOUT_GRACE_MINUTES=240)
+class AutoCheckoutTest(TestCase):
+    """
+    Auto check-out: 1 UPDATE set-based per tanggal dengan MinutesBetween.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        AttendanceSetting.objects.create(work_end_time=time(17, 0))
+        cls.employees = [
+            Employee.objects.create(
+                user=User.objects.create_user(email=f"emp{index}@example.com", password="secret", full_name="Emp"),
+                employee_number=f"2026000{index}",
+            )
+            for index in range(4)
+        ]
+
+    def at(self, day, hour, minute=0, second=0):
+        return timezone.make_aware(datetime(2026, 3, day, hour, minute, second))
+
+    def attendance(self, employee, day, check_in, check_out=None, **fields):
+        return Attendance.objects.create(
+            employee=employee,
+            date=date(2026, 3, day),
+            status="on_time",
+            check_in_time=check_in,
+            check_out_time=check_out,
+            **fields,
+        )
+
+    def test_closes_open_rows_at_work_end(self):
+        forgot = self.attendance(self.employees[0], 2, self.at(2, 7, 58, 30))
+        after_hours = self.attendance(self.employees[1], 2, self.at(2, 18, 30))
+        done = self.attendance(
+            self.employees[2], 2, self.at(2, 8, 0), self.at(2, 16, 0),
+            working_minutes=480,
+            working_hours=8,
+        )
+        today = self.attendance(self.employees[3], 4, self.at(4, 8, 0))
+
+        closed = close_open_attendances(now=self.at(4, 10, 0))
+        self.assertEqual(closed, 2)
+
+        forgot.refresh_from_db()
+        self.assertEqual(forgot.check_out_time, self.at(2, 17, 0))
+        self.assertEqual(forgot.working_minutes, 541)
+        self.assertEqual(forgot.working_hours, Decimal("9.02"))
+        self.assertTrue(forgot.auto_checked_out)
+
+        # check-in setelah jam pulang -> check-out = check-in, 0 menit
+        after_hours.refresh_from_db()
+        self.assertEqual(after_hours.check_out_time, after_hours.check_in_time)
+        self.assertEqual(after_hours.working_minutes, 0)
+
+        done.refresh_from_db()
+        self.assertEqual((done.check_out_time, done.working_minutes), (self.at(2, 16, 0), 480))
+        self.assertFalse(done.auto_checked_out)
+
+        # hari ini belum lewat jam pulang + grace
+        today.refresh_from_db()
+        self.assertIsNone(today.check_out_time)
+
+        summary = AttendanceMonthlySummary.objects.get(employee=self.employees[0], year=2026, month=3)
+        self.assertEqual(summary.total_working_minutes, 541)
+
+        self.assertEqual(close_open_attendances(now=self.at(4, 10, 0)), 0)
+
+    def test_minutes_between_matches_python(self):
+        check_in = self.at(2, 7, 58, 30)
+        check_outs = [
+            self.at(2, 7, 58, 59),
+            self.at(2, 7, 59, 30),
+            self.at(2, 17, 0),
+            self.at(3, 1, 15, 45),
+        ]
+        for employee, check_out in zip(self.employees, check_outs):
+            self.attendance(employee, 2, check_in, check_out)
+
+        rows = Attendance.objects.annotate(
+            minutes=MinutesBetween(F("check_in_time"), F("check_out_time")),
+        ).values_list("check_in_time", "check_out_time", "minutes")
+
+        for start, end, minutes in rows:
+            with self.subTest(end=end):
+                self.assertEqual(minutes, int((end - start).total_seconds() // 60))
+
+
+class AttendanceExportTest(TestCase):
+    """
+    Teks bebas di export CSV / XLSX tidak boleh terbaca sebagai formula.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user(
+            email="hr@example.com",
+            password="secret",
+            full_name="HR",
+            is_staff=True,
+        )
+        employee_user = User.objects.create_user(
+            email="emp@example.com",
+            password="secret",
+            full_name="@Employee",
+        )
+        employee = Employee.objects.create(user=employee_user, employee_number="20260001")
+
+        Attendance.objects.create(
+            employee=employee,
+            date=date(2026, 1, 5),
+            status="on_time",
+            working_minutes=480,
+            check_in_location_name="+62 Kantor",
+            check_out_location_name="-Gudang",
+            notes='=HYPERLINK("http://example.com","klik")',
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.hr)
+
+    def export(self, file_type):
+        response = self.client.get(
+            "/api/attendance/attendances/export/",
+            {"file_type": file_type, "year": 2026, "month": 1},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def assert_escaped(self, row):
+        self.assertEqual(row["Full Name"], "'@Employee")
+        self.assertEqual(row["Check In Location"], "'+62 Kantor")
+        self.assertEqual(row["Check Out Location"], "'-Gudang")
+        self.assertEqual(row["Notes"], '\'=HYPERLINK("http://example.com","klik")')
+        self.assertEqual(row["Employee Number"], "20260001")
+
+    def test_csv_cells_are_escaped(self):
+        content = b"".join(self.export("csv").streaming_content).decode("utf-8-sig")
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(len(rows), 1)
+        self.assert_escaped(rows[0])
+
+    def test_xlsx_cells_are_escaped(self):
+        content = b"".join(self.export("xlsx").streaming_content)
+        sheet = load_workbook(io.BytesIO(content)).active
+        header, *rows = sheet.iter_rows(values_only=True)
+
+        self.assertEqual(len(rows), 1)
+        row = dict(zip(header, rows[0]))
+        self.assert_escaped(row)
+        # angka tetap angka
+        self.assertEqual(row["Working Minutes"], 480)
+
+    def test_escape_formula_keeps_non_text(self):
+        self.assertEqual(escape_formula(-5), -5)
+        self.assertEqual(escape_formula(None), None)
+        self.assertEqual(escape_formula("Kantor = pusat"), "Kantor = pusat")
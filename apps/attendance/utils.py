@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.caches import cache_is_shared
+
+from .models import AttendanceSetting
+
+ACTIVE_SETTING_KEY = "attendance:active_setting"
+
+# penanda "tidak ada setting aktif" supaya hasil kosong juga ikut di-cache
+NO_SETTING = "none"
+
+
+def get_active_setting():
+    """
+    AttendanceSetting aktif dari cache (dipakai di setiap check-in).
+    Cache dihapus oleh signal setelah commit saat AttendanceSetting
+    disimpan / dihapus.
+
+    Cache per proses (LocMem) tidak dipakai: invalidasinya tidak terlihat
+    worker lain, sehingga status on_time / late ditulis dengan jam kerja
+    lama sampai timeout. Tanpa Redis setting dibaca dari DB (1 query).
+    """
+    if not cache_is_shared():
+        return AttendanceSetting.objects.filter(is_active=True).first()
+
+    setting = cache.get(ACTIVE_SETTING_KEY)
+
+    if setting is None:
+        setting = AttendanceSetting.objects.filter(is_active=True).first() or NO_SETTING
+        cache.set(
+            ACTIVE_SETTING_KEY,
+            setting,
+            timeout=settings.ATTENDANCE_SETTING_CACHE_TIMEOUT,
+        )
+
+    if isinstance(setting, AttendanceSetting):
+        return setting
+    return None
+
+
+def invalidate_active_setting():
+    if cache_is_shared():
+        cache.delete(ACTIVE_SETTING_KEY)
@@ -1,61 +1,194 @@
 from django.shortcuts import render
 
 # Create your views here.
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
 from django.utils import timezone
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 
+from apps.employee_devices.trust import check_attendance_device
 from apps.employees.models import Employee
 from apps.accounts.models import user_has_permission
-from .models import Attendance, AttendanceSetting
+from apps.core.dates import filter_period, get_period_params
+from apps.core.pagination import HybridPagination
+from .models import Attendance, AttendanceMonthlySummary
 from .serializers import AttendanceSerializer
+from .exports import FILE_TYPES as EXPORT_FILE_TYPES, export_response
+from .photos import ingest_photo
+from .rollup import rebuild_employee_month, record_check_in, record_check_out
+from .utils import get_active_setting
+
+
+def scope_attendance_queryset(request, qs):
+    """
+    Access control + filter employee_number.
+    Berlaku untuk queryset apa pun yang punya FK "employee"
+    (Attendance maupun AttendanceMonthlySummary).
+    """
+    user = request.user
+
+    if user_has_permission(user, "attendance.view_all") or user.is_staff:
+        base_qs = qs
+        can_view_all = True
+    else:
+        employee = getattr(user, "employee_profile", None)
+        if not employee:
+            return qs.none()
+
+        base_qs = qs.filter(employee=employee)
+        can_view_all = False
+
+    employee_number = request.query_params.get("employee_number")
+
+    if employee_number and can_view_all:
+        base_qs = base_qs.filter(employee__employee_number=employee_number)
+
+    return base_qs
+
+
+def filter_attendance_queryset(request, qs):
+    """
+    Access control + filter query param (employee_number, month, year,
+    auto_checked_out).
+    Dipakai list attendance dan summary supaya hasilnya konsisten.
+    """
+    base_qs = scope_attendance_queryset(request, qs)
+    month, year = get_period_params(request)
+
+    # ?auto_checked_out=true -> antrean review auto check-out
+    auto_checked_out = request.query_params.get("auto_checked_out")
+    if auto_checked_out:
+        base_qs = base_qs.filter(auto_checked_out=auto_checked_out.lower() in ("1", "true", "yes"))
+
+    return filter_period(base_qs, "date", month=month, year=year)
+
+
+# group_by summary -> kolom yang di-GROUP BY (alias: lookup)
+SUMMARY_GROUPS = {
+    "employee": {
+        "employee_number": F("employee__employee_number"),
+        "full_name": F("employee__user__full_name"),
+    },
+    "department": {
+        "department_id": F("employee__department_id"),
+        "department_name": F("employee__department__name"),
+    },
+    "day": {
+        "day": F("date"),
+    },
+}
+
+SUMMARY_METRICS = {
+    "total": Count("id"),
+    "on_time": Count("id", filter=Q(status="on_time")),
+    "late": Count("id", filter=Q(status="late")),
+    "alpha": Count("id", filter=Q(status="alpha")),
+    "total_working_minutes": Sum("working_minutes"),
+}
+
+# metrik yang sama, dibaca dari tabel rollup AttendanceMonthlySummary
+ROLLUP_SUMMARY_METRICS = {
+    "total": Sum("total_days"),
+    "on_time": Sum("on_time_count"),
+    "late": Sum("late_count"),
+    "alpha": Sum("alpha_count"),
+    "total_working_minutes": Sum("total_working_minutes"),
+}
+
+
+# filter filter_attendance_queryset yang tidak bisa dijawab tabel rollup
+# (rollup hanya per employee x bulan) -> summary membaca Attendance langsung
+ROLLUP_UNSUPPORTED_PARAMS = ("auto_checked_out",)
+
+
+def can_use_rollup(request, year, group_by):
+    if not year or group_by == "day":
+        return False
+    return not any(request.query_params.get(name) for name in ROLLUP_UNSUPPORTED_PARAMS)
+
+
+def format_summary_row(row):
+    for key in ("total", "on_time", "late", "alpha"):
+        row[key] = row[key] or 0
+
+    total_minutes = row["total_working_minutes"] or 0
+    avg_minutes = total_minutes / row["total"] if row["total"] else 0
+
+    row["total_working_minutes"] = total_minutes
+    row["total_working_hours"] = round(total_minutes / 60, 2)
+    row["avg_working_minutes"] = round(avg_minutes, 2)
+    row["avg_working_hours"] = round(avg_minutes / 60, 2)
+    return row
+
+
+def rebuild_rollup_for(*attendances):
+    """
+    Hitung ulang rollup employee-bulan yang tersentuh edit HR.
+    Param berupa tuple (employee_id, date).
+    """
+    for employee_id, day in {a for a in attendances if a}:
+        rebuild_employee_month(employee_id, day.year, day.month)
 
 
 class AttendanceViewSet(viewsets.ModelViewSet):
     serializer_class = AttendanceSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = HybridPagination
+    cursor_ordering = ("-date", "-id")
     queryset = Attendance.objects.select_related(
         "employee",
         "employee__user",
     ).all()
 
     def get_queryset(self):
-        qs = super().get_queryset()
-        user = self.request.user
-
-        from apps.accounts.utils import user_has_permission
+        return filter_attendance_queryset(self.request, super().get_queryset())
 
-        if user_has_permission(user, "attendance.view_all") or user.is_staff:
-            base_qs = qs
-            can_view_all = True
-        else:
-            employee = getattr(user, "employee_profile", None)
-            if not employee:
-                return qs.none()
+    # edit HR lewat API -> rollup bulan terkait dihitung ulang
+    def perform_create(self, serializer):
+        attendance = serializer.save()
+        rebuild_rollup_for((attendance.employee_id, attendance.date))
 
-            base_qs = qs.filter(employee=employee)
-            can_view_all = False
+    def perform_update(self, serializer):
+        before = (serializer.instance.employee_id, serializer.instance.date)
+        attendance = serializer.save()
+        rebuild_rollup_for(before, (attendance.employee_id, attendance.date))
 
-        employee_number = self.request.query_params.get("employee_number")
-        month = self.request.query_params.get("month")
-        year = self.request.query_params.get("year")
-
-        if employee_number and can_view_all:
-            base_qs = base_qs.filter(employee__employee_number=employee_number)
-
-        if month:
-            base_qs = base_qs.filter(date__month=month)
+    def perform_destroy(self, instance):
+        before = (instance.employee_id, instance.date)
+        instance.delete()
+        rebuild_rollup_for(before)
 
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Export attendance (CSV stream / XLSX) dengan filter yang sama
+        seperti list: employee_number, month, year.
+
+        Query params: file_type = csv (default) | xlsx
+        """
+        file_type = request.query_params.get("file_type", "csv")
+        if file_type not in EXPORT_FILE_TYPES:
+            return Response(
+                {"detail": f"file_type harus salah satu dari: {', '.join(EXPORT_FILE_TYPES)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        qs = filter_attendance_queryset(request, Attendance.objects.all())
+
+        month, year = get_period_params(request)
+        filename = "attendance"
         if year:
-            base_qs = base_qs.filter(date__year=year)
+            filename += f"_{year}"
+        if month:
+            filename += f"-{month:02d}"
 
-        return base_qs
+        return export_response(qs, file_type, filename)
     
 class AttendanceActionViewSet(viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated]
@@ -65,41 +198,77 @@ class AttendanceActionViewSet(viewsets.GenericViewSet):
     def get_employee(self):
         return getattr(self.request.user, "employee_profile", None)
 
+    def check_device(self, employee):
+        """
+        Enforcement device (ATTENDANCE_DEVICE_ENFORCEMENT), dibaca dari
+        cache trust device. Return Response error atau None.
+        """
+        device_id = self.request.data.get("device_id") or self.request.headers.get("X-Device-Id")
+        error = check_attendance_device(employee, device_id)
+        if error:
+            return Response({"detail": error}, status=403)
+        return None
+
     @action(detail=False, methods=["post"])
-    @transaction.atomic
     def check_in(self, request):
+        """
+        Fast path: setting dari cache + 1 INSERT.
+        Jika row hari ini sudah ada (dibuat admin / job), diisi dengan
+        1 UPDATE bersyarat check_in_time IS NULL.
+        """
         employee = self.get_employee()
         if not employee:
             return Response({"detail": "Employee profile tidak ditemukan."}, status=400)
 
-        today = timezone.localdate()
-
-        attendance, _ = Attendance.objects.get_or_create(
-            employee=employee,
-            date=today,
-        )
+        device_error = self.check_device(employee)
+        if device_error:
+            return device_error
 
-        if attendance.check_in_time:
-            return Response({"detail": "Sudah check-in hari ini."}, status=400)
+        today = timezone.localdate()
+        now = timezone.now()
 
-        setting = AttendanceSetting.objects.filter(is_active=True).first()
+        setting = get_active_setting()
 
         work_start = setting.work_start_time if setting else time(8, 0)
         tolerance = setting.late_tolerance_minutes if setting else 10
 
-        now = timezone.now()
         start_dt = timezone.make_aware(datetime.combine(today, work_start))
         late_limit = start_dt + timedelta(minutes=tolerance)
 
-        attendance.status = "late" if now > late_limit else "on_time"
-        attendance.check_in_time = now
-        attendance.check_in_lat = request.data.get("lat")
-        attendance.check_in_lng = request.data.get("lng")
-        attendance.check_in_photo = request.data.get("image")
-        attendance.check_in_location_name = request.data.get("location_name")
-        attendance.notes = request.data.get("notes")
+        values = {
+            "status": "late" if now > late_limit else "on_time",
+            "check_in_time": now,
+            "check_in_lat": request.data.get("lat"),
+            "check_in_lng": request.data.get("lng"),
+            "check_in_location_name": request.data.get("location_name"),
+            "notes": request.data.get("notes"),
+        }
+        try:
+            # savepoint hanya untuk INSERT: IntegrityError tidak merusak
+            # transaksi luar (ATOMIC_REQUESTS / test)
+            with transaction.atomic():
+                attendance = Attendance.objects.create(
+                    employee=employee,
+                    date=today,
+                    **values,
+                )
+        except IntegrityError:
+            updated = Attendance.objects.filter(
+                employee=employee,
+                date=today,
+                check_in_time__isnull=True,
+            ).update(**values)
+
+            if not updated:
+                return Response({"detail": "Sudah check-in hari ini."}, status=400)
+
+            attendance = Attendance.objects.get(employee=employee, date=today)
+            rebuild_rollup_for((employee.id, today))
+        else:
+            record_check_in(attendance)
 
-        attendance.save()
+        # foto diproses di background (resize, thumbnail, strip EXIF)
+        ingest_photo(attendance.id, "check_in", request.data.get("image"))
 
         return Response(self.get_serializer(attendance).data)
 
@@ -110,6 +279,10 @@ class AttendanceActionViewSet(viewsets.GenericViewSet):
         if not employee:
             return Response({"detail": "Employee profile tidak ditemukan."}, status=400)
 
+        device_error = self.check_device(employee)
+        if device_error:
+            return device_error
+
         today = timezone.localdate()
         now = timezone.now()
 
@@ -127,7 +300,6 @@ class AttendanceActionViewSet(viewsets.GenericViewSet):
         attendance.check_out_time = timezone.now()
         attendance.check_out_lat = request.data.get("lat")
         attendance.check_out_lng = request.data.get("lng")
-        attendance.check_out_photo = request.data.get("image")
         attendance.check_out_location_name = request.data.get("location_name")
         
         delta = now - attendance.check_in_time
@@ -137,46 +309,52 @@ class AttendanceActionViewSet(viewsets.GenericViewSet):
         attendance.working_hours = round(attendance.working_minutes / 60, 2)
 
         attendance.save()
+        record_check_out(attendance)
+
+        ingest_photo(attendance.id, "check_out", request.data.get("image"))
 
         return Response(self.get_serializer(attendance).data)
     
     @action(detail=False, methods=["get"])
     def summary(self, request):
-        employee_number = request.query_params.get("employee_number")
-        month = request.query_params.get("month")
-        year = request.query_params.get("year")
-
-        # qss = self.get_queryset()
-        qs = super().get_queryset()
-        user = self.request.user
-        
-        from apps.accounts.utils import user_has_permission
-
-        if user_has_permission(user, "attendance.view_all") or user.is_staff:
-            base_qs = qs
-            can_view_all = True
+        """
+        Rekap attendance dalam 1 query (conditional aggregation).
+        Jika year diisi (dan bukan group_by=day / filter yang tidak ada di
+        rollup, mis. auto_checked_out), dibaca dari rollup
+        AttendanceMonthlySummary.
+
+        Query params: employee_number, month, year, auto_checked_out,
+        group_by = employee | department | day (opsional)
+        """
+        group_by = request.query_params.get("group_by")
+        if group_by and group_by not in SUMMARY_GROUPS:
+            return Response(
+                {"detail": f"group_by harus salah satu dari: {', '.join(SUMMARY_GROUPS)}."},
+                status=400,
+            )
+
+        month, year = get_period_params(request)
+
+        if can_use_rollup(request, year, group_by):
+            # periode bulanan/tahunan -> baca dari tabel rollup
+            qs = scope_attendance_queryset(request, AttendanceMonthlySummary.objects.all())
+            qs = qs.filter(year=year, **({"month": month} if month else {}))
+            metrics = ROLLUP_SUMMARY_METRICS
         else:
-            employee = getattr(user, "employee_profile", None)
-            if not employee:
-                return qs.none()
+            qs = filter_attendance_queryset(request, Attendance.objects.all())
+            metrics = SUMMARY_METRICS
 
-            base_qs = qs.filter(employee=employee)
-            can_view_all = False
+        qs = qs.order_by()
 
-        if employee_number:
-            qs = base_qs.filter(employee__employee_number=employee_number)
+        if not group_by:
+            return Response(format_summary_row(qs.aggregate(**metrics)))
 
-        if month:
-            qs = base_qs.filter(date__month=month)
-
-        if year:
-            qs = base_qs.filter(date__year=year)
+        fields = SUMMARY_GROUPS[group_by]
+        rows = qs.values(**fields).annotate(**metrics).order_by(*fields)
 
         return Response({
-            "total": base_qs.count(),
-            "on_time": base_qs.filter(status="on_time").count(),
-            "late": base_qs.filter(status="late").count(),
-            "alpha": base_qs.filter(status="alpha").count(),
+            "group_by": group_by,
+            "results": [format_summary_row(row) for row in rows],
         })
 
 
@@ -1,3 +1,15 @@
 from django.contrib import admin
 
 # Register your models here.
+from .models import Holiday
+
+
+@admin.register(Holiday)
+class HolidayAdmin(admin.ModelAdmin):
+    list_display = ("id", "date", "name", "is_active", "updated_at")
+    list_filter = ("is_active", "date")
+    search_fields = ("name",)
+    ordering = ("-date",)
+    date_hierarchy = "date"
+    readonly_fields = ("created_at", "updated_at")
+
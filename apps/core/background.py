@@ -0,0 +1,56 @@
+"""
+Dispatch task background.
+
+- CELERY_BROKER_URL di-set -> task.delay() ke worker Celery
+- tidak di-set (local/dev)  -> dijalankan di thread pool lokal
+
+Task selalu di-dispatch setelah transaksi commit, supaya worker tidak
+membaca row yang belum tersimpan.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BACKGROUND_THREAD_WORKERS,
+                thread_name_prefix="hris-bg",
+            )
+    return _executor
+
+
+def _run_local(task, args, kwargs):
+    try:
+        task(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s gagal", getattr(task, "name", task))
+    finally:
+        # koneksi DB per thread harus ditutup manual
+        connections.close_all()
+
+
+def enqueue(task, *args, **kwargs):
+    """
+    Jalankan task (Celery shared_task) di background setelah commit.
+    """
+
+    def dispatch():
+        if settings.CELERY_BROKER_URL:
+            task.delay(*args, **kwargs)
+        else:
+            get_executor().submit(_run_local, task, args, kwargs)
+
+    transaction.on_commit(dispatch)
@@ -0,0 +1,18 @@
+"""
+Helper cache Django.
+"""
+from django.conf import settings
+
+# backend yang isinya hanya terlihat oleh proses itu sendiri
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def cache_is_shared(alias="default"):
+    """
+    True jika cache dipakai bersama antar proses (Redis, Memcached, DB,
+    file), sehingga invalidasi berbasis versi terlihat oleh semua worker.
+    """
+    return settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
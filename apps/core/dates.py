@@ -0,0 +1,73 @@
+"""
+Helper periode tanggal.
+
+Filter periode memakai range half-open (date >= awal AND date < akhir)
+supaya index di kolom date tetap terpakai. Lookup __year / __month
+membungkus kolom dengan fungsi (EXTRACT / YEAR()) sehingga MySQL
+terpaksa full scan.
+"""
+from datetime import date
+
+from rest_framework import serializers
+
+# batas atas 9998: month_bounds / year_bounds membuat date(year + 1, 1, 1)
+MIN_YEAR = 1900
+MAX_YEAR = 9998
+
+
+def month_bounds(year, month):
+    """
+    Return (awal bulan, awal bulan berikutnya) -> range half-open.
+    """
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def year_bounds(year):
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def get_period_params(request):
+    """
+    Ambil query param month & year sebagai int (None jika tidak diisi).
+    """
+    period = {}
+    for name, low, high in (("month", 1, 12), ("year", MIN_YEAR, MAX_YEAR)):
+        value = request.query_params.get(name)
+        if not value:
+            period[name] = None
+            continue
+
+        try:
+            value = int(value)
+        except ValueError:
+            value = None
+
+        if value is None or not low <= value <= high:
+            raise serializers.ValidationError({name: f"{name} tidak valid."})
+
+        period[name] = value
+
+    return period["month"], period["year"]
+
+
+def filter_period(qs, field, month=None, year=None):
+    """
+    Filter queryset berdasarkan month/year pada kolom tanggal `field`.
+
+    - year + month : range 1 bulan
+    - year saja    : range 1 tahun
+    - month saja   : tidak bisa dijadikan range (lintas tahun),
+                     tetap pakai lookup __month
+    """
+    if year and month:
+        start, end = month_bounds(year, month)
+    elif year:
+        start, end = year_bounds(year)
+    elif month:
+        return qs.filter(**{f"{field}__month": month})
+    else:
+        return qs
+
+    return qs.filter(**{f"{field}__gte": start, f"{field}__lt": end})
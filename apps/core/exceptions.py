@@ -0,0 +1,18 @@
+"""
+Exception handler DRF.
+
+Django ValidationError yang lolos dari serializer (mis. dari signal /
+model.clean, seperti cek siklus manager di apps.employees.hierarchy)
+dikembalikan sebagai 400, bukan 500.
+"""
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import exception_handler as drf_exception_handler
+
+
+def exception_handler(exc, context):
+    if isinstance(exc, DjangoValidationError):
+        detail = exc.message_dict if hasattr(exc, "error_dict") else {"detail": " ".join(exc.messages)}
+        exc = ValidationError(detail)
+
+    return drf_exception_handler(exc, context)
@@ -1,3 +1,24 @@
 from django.db import models
 
 # Create your models here.
+
+
+class Holiday(models.Model):
+    """
+    Kalender libur perusahaan (libur nasional, cuti bersama, dll).
+    Dipakai index hari kerja di apps.core.workdays.
+    """
+    date = models.DateField(unique=True)
+    name = models.CharField(max_length=150)
+    description = models.TextField(null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "holidays"
+        ordering = ["date"]
+
+    def __str__(self):
+        return f"{self.date} {self.name}"
@@ -0,0 +1,345 @@
+"""
+Pagination API.
+
+- default              : page number (?page=), sama seperti sebelumnya.
+                         ?count=false melewati COUNT(*) per halaman.
+- ?pagination=cursor   : keyset pagination. Posisi disimpan di cursor
+                         (nilai kolom ordering terakhir), query berikutnya
+                         memakai WHERE (date, id) < (...) tanpa OFFSET dan
+                         tanpa COUNT(*), jadi kecepatan halaman ke-1 dan
+                         ke-10.000 sama. Dipakai job sync yang menelusuri
+                         seluruh histori.
+- ?page_size=          : ukuran halaman, dibatasi settings.API_MAX_PAGE_SIZE.
+
+CursorPagination bawaan DRF hanya memakai kolom ordering pertama + OFFSET
+untuk baris dengan nilai sama (mis. ribuan attendance di tanggal yang
+sama), jadi di sini dipakai keyset penuh dengan tie-breaker id.
+"""
+import base64
+import json
+from datetime import date, datetime
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+def get_page_size(request, query_param="page_size"):
+    """
+    ?page_size= dengan batas atas API_MAX_PAGE_SIZE.
+    """
+    value = request.query_params.get(query_param)
+    if value:
+        try:
+            size = int(value)
+        except ValueError:
+            size = 0
+        if size > 0:
+            return min(size, settings.API_MAX_PAGE_SIZE)
+    return api_settings.PAGE_SIZE
+
+
+def keyset_filter(ordering, position):
+    """
+    Baris "setelah" posisi (x, y, z) untuk ordering (a, b, c):
+    a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+    dengan > diganti < untuk field descending.
+    """
+    condition = Q()
+    equal = Q()
+
+    for field, value in zip(ordering, position):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+
+    return condition
+
+
+def iterate_keyset(queryset, ordering, fields, chunk_size=2000):
+    """
+    Iterasi seluruh queryset sebagai dict (.values) per batch keyset.
+    Memori konstan di semua backend: mysqlclient mem-buffer seluruh
+    result set di client walaupun memakai .iterator().
+    Field terakhir di ordering harus unik (id).
+    """
+    keys = [field.lstrip("-") for field in ordering]
+    columns = list(dict.fromkeys([*fields, *keys]))
+    queryset = queryset.order_by(*ordering).values(*columns)
+
+    position = None
+    while True:
+        batch = queryset
+        if position is not None:
+            batch = batch.filter(keyset_filter(ordering, position))
+
+        rows = list(batch[:chunk_size])
+        yield from rows
+
+        if len(rows) < chunk_size:
+            return
+        position = [rows[-1][key] for key in keys]
+
+
+class StandardPageNumberPagination(PageNumberPagination):
+    """
+    Page number + ?page_size= (dibatasi) + ?count=false.
+    """
+    page_size_query_param = "page_size"
+    count_query_param = "count"
+
+    @property
+    def max_page_size(self):
+        return settings.API_MAX_PAGE_SIZE
+
+    def skip_count(self, request):
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() in FALSE_VALUES
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_skipped = self.skip_count(request)
+        if not self.count_skipped:
+            return super().paginate_queryset(queryset, request, view)
+
+        # tanpa COUNT(*): ambil 1 baris ekstra untuk tahu ada halaman berikutnya
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            self.page_number = 0
+        if self.page_number < 1:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=request.query_params.get(self.page_query_param),
+                message="Invalid page.",
+            ))
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if not self.count_skipped:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if not self.count_skipped:
+            return super().get_previous_link()
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data):
+        if not self.count_skipped:
+            return super().get_paginated_response(data)
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination berdasarkan `cursor_ordering` milik view,
+    contoh ("-date", "-id"). Field terakhir harus unik (id).
+    """
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering = ("-id",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = get_page_size(request, self.page_size_query_param)
+        self.ordering = tuple(getattr(view, "cursor_ordering", self.ordering))
+
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = self.invert(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(keyset_filter(ordering, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.first_position = self.get_position(rows[0]) if rows else position
+        self.last_position = self.get_position(rows[-1]) if rows else position
+        return rows
+
+    # -------------------------
+    # ordering / filter
+    # -------------------------
+    @staticmethod
+    def invert(ordering):
+        return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+    def get_position(self, obj):
+        return [getattr(obj, field.lstrip("-")) for field in self.ordering]
+
+    # -------------------------
+    # cursor encode / decode
+    # -------------------------
+    def encode_cursor(self, position, reverse=False):
+        values = [
+            value.isoformat() if isinstance(value, (date, datetime)) else value
+            for value in position
+        ]
+        payload = json.dumps({"p": values, "r": int(reverse)}, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, model):
+        """
+        Return (position, reverse). Nilai posisi dikonversi lewat field model
+        (str ISO -> date/datetime, dst.) supaya cursor rusak / hasil edit
+        manual jadi 404 "Invalid cursor", bukan 500 saat query.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            position = payload["p"]
+            reverse = bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            position = [
+                self.to_python(model, field, value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (FieldDoesNotExist, ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    @staticmethod
+    def to_python(model, field, value):
+        # kolom keyset tidak boleh NULL, perbandingan < / > dengan NULL kosong
+        if value is None or isinstance(value, (list, dict)):
+            raise ValueError(value)
+        return model._meta.get_field(field.lstrip("-")).to_python(value)
+
+    # -------------------------
+    # response
+    # -------------------------
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first_position is None:
+            return None
+        return self.encode_cursor(self.first_position, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor dari link next / previous.",
+                "schema": {"type": "string"},
+            },
+        ]
+
+
+class HybridPagination(BasePagination):
+    """
+    Page number secara default, keyset jika ?pagination=cursor.
+    View mendefinisikan `cursor_ordering` (ordering stabil + id).
+    Pada mode cursor, ?ordering= diabaikan karena urutan harus tetap.
+    """
+    mode_query_param = "pagination"
+
+    def __init__(self):
+        self.paginator = StandardPageNumberPagination()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.mode_query_param) == "cursor":
+            self.paginator = KeysetPagination()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.paginator.get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *StandardPageNumberPagination().get_schema_operation_parameters(view),
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Isi 'cursor' untuk keyset pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            *KeysetPagination().get_schema_operation_parameters(view),
+            {
+                "name": StandardPageNumberPagination.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Isi 'false' untuk melewati COUNT(*).",
+                "schema": {"type": "boolean"},
+            },
+        ]
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Holiday
+from .workdays import invalidate
+
+
+@receiver(post_save, sender=Holiday, dispatch_uid="holiday_saved")
+@receiver(post_delete, sender=Holiday, dispatch_uid="holiday_deleted")
+def invalidate_workday_index(sender, **kwargs):
+    # setelah commit: worker lain yang melihat versi baru membangun ulang
+    # index dari row Holiday yang sudah committed
+    transaction.on_commit(invalidate)
@@ -1,3 +1,153 @@
 from django.test import TestCase
 
 # Create your tests here.
+from datetime import date
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.accounts.models import User
+from apps.attendance.models import Attendance
+from apps.employees.models import Employee
+from . import workdays
+from .dates import MAX_YEAR, get_period_params, month_bounds
+from .pagination import iterate_keyset
+from .models import Holiday
+
+
+class WorkdayIndexInvalidationTest(TestCase):
+    """
+    Index hari kerja baru dibangun ulang setelah perubahan Holiday commit.
+    """
+
+    def setUp(self):
+        workdays.invalidate()
+        # rollback test tidak memicu on_commit -> index in-process dibersihkan manual
+        self.addCleanup(workdays.invalidate)
+
+    def test_holiday_invalidates_after_commit(self):
+        # Senin-Jumat 2 s/d 6 Maret 2026
+        self.assertEqual(workdays.count_working_days(date(2026, 3, 2), date(2026, 3, 6)), 5)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Holiday.objects.create(date=date(2026, 3, 3), name="Libur")
+            # belum commit -> index belum diinvalidasi
+            self.assertEqual(workdays.count_working_days(date(2026, 3, 2), date(2026, 3, 6)), 5)
+
+        self.assertEqual(len(callbacks), 1)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(workdays.count_working_days(date(2026, 3, 2), date(2026, 3, 6)), 4)
+
+
+class PeriodParamsTest(TestCase):
+    """
+    ?month= / ?year= di luar batas -> 400, bukan ValueError (500).
+    """
+
+    def get_period(self, **params):
+        return get_period_params(Request(APIRequestFactory().get("/", params)))
+
+    def test_last_supported_year(self):
+        self.assertEqual(self.get_period(year=MAX_YEAR, month=12), (12, MAX_YEAR))
+        self.assertEqual(month_bounds(MAX_YEAR, 12)[1], date(MAX_YEAR + 1, 1, 1))
+
+    def test_out_of_range_is_validation_error(self):
+        for params in ({"year": 9999}, {"year": 1899}, {"year": "x"}, {"month": 13}, {"month": 0}):
+            with self.subTest(params=params), self.assertRaises(ValidationError):
+                self.get_period(**params)
+
+    def test_listing_returns_400(self):
+        user = User.objects.create_user(email="hr@example.com", password="secret", full_name="HR", is_staff=True)
+        client = APIClient()
+        client.force_authenticate(user)
+
+        for url in ("/api/attendance/attendances/", "/api/leave/leave-requests/"):
+            with self.subTest(url=url):
+                response = client.get(url, {"year": 9999, "month": 12})
+                self.assertEqual(response.status_code, 400)
+
+
+@override_settings(API_MAX_PAGE_SIZE=5)
+class PaginationTest(TestCase):
+    """
+    HybridPagination lewat listing attendance (cursor_ordering = -date, -id).
+    Banyak baris dengan tanggal sama -> tie di kolom ordering pertama.
+    """
+
+    url = "/api/attendance/attendances/"
+
+    @classmethod
+    def setUpTestData(cls):
+        hr = User.objects.create_user(email="hr@example.com", password="secret", full_name="HR", is_staff=True)
+        cls.hr = hr
+
+        employees = [
+            Employee.objects.create(
+                user=User.objects.create_user(email=f"emp{index}@example.com", password="secret", full_name="Emp"),
+                employee_number=f"2026000{index}",
+            )
+            for index in range(4)
+        ]
+        Attendance.objects.bulk_create([
+            Attendance(employee=employee, date=date(2026, 3, day), status="on_time")
+            for day in (2, 3, 4)
+            for employee in employees
+        ])
+        cls.expected = list(Attendance.objects.order_by("-date", "-id").values_list("id", flat=True))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.hr)
+
+    def get(self, url=None, **params):
+        response = self.client.get(url or self.url, params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def walk(self, data, link):
+        pages = [[row["id"] for row in data["results"]]]
+        while data[link]:
+            data = self.get(data[link])
+            pages.append([row["id"] for row in data["results"]])
+        return pages, data
+
+    def test_cursor_pages_cover_ties_without_gaps(self):
+        pages, last = self.walk(self.get(pagination="cursor", page_size=5), "next")
+
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+        self.assertEqual(sum(pages, []), self.expected)
+
+        # kembali lewat link previous dari halaman terakhir
+        back, first = self.walk(last, "previous")
+        self.assertEqual(sum(reversed(back), []), self.expected)
+        self.assertIsNone(first["previous"])
+
+    def test_invalid_cursor_is_404(self):
+        for cursor in ("!!!", "e30", "eyJwIjpbIngiLDFdfQ"):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(self.url, {"pagination": "cursor", "cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_page_size_is_capped(self):
+        self.assertEqual(len(self.get(page_size=100)["results"]), 5)
+        self.assertEqual(len(self.get(pagination="cursor", page_size=100)["results"]), 5)
+
+    def test_count_false_skips_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get(count="false", page_size=5, page=2)
+
+        self.assertNotIn("count", data)
+        self.assertEqual([row["id"] for row in data["results"]], self.expected[5:10])
+        self.assertIsNotNone(data["next"])
+        self.assertFalse([query for query in queries if "COUNT(" in query["sql"].upper()])
+
+        self.assertEqual(self.get(page_size=5)["count"], 12)
+
+    def test_iterate_keyset(self):
+        rows = iterate_keyset(Attendance.objects.all(), ("-date", "-id"), ["id"], chunk_size=5)
+        self.assertEqual([row["id"] for row in rows], self.expected)
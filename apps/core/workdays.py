@@ -0,0 +1,149 @@
+"""
+Index hari kerja (weekday kerja dikurangi Holiday aktif).
+
+Per tahun disimpan array kumulatif:
+    cumulative[i] = jumlah hari kerja dari 1 Januari s/d hari ke-i (exclusive)
+sehingga jumlah hari kerja range [start, end] dihitung dengan 2 lookup
+per tahun, tanpa iterasi per hari.
+
+Index di-cache in-process. Saat Holiday berubah, signal memanggil
+invalidate() -> cache proses ini dikosongkan dan versi kalender di cache
+Django dinaikkan. Proses lain mengecek versi paling lama tiap
+WORKDAY_INDEX_CHECK_INTERVAL detik:
+- cache shared (Redis)    : versi dari cache
+- cache per proses (LocMem): versi = (jumlah Holiday, max updated_at)
+                             dari DB, 1 query agregat per interval
+"""
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .caches import cache_is_shared
+from .dates import month_bounds
+from .models import Holiday
+
+VERSION_KEY = "core:holiday_calendar_version"
+
+_lock = threading.Lock()
+_indexes = {}  # year -> list kumulatif
+_version = None
+_checked_at = 0.0
+
+
+def build_year(year):
+    holidays = set(
+        Holiday.objects.filter(is_active=True, date__year=year).values_list("date", flat=True)
+    )
+    weekdays = set(settings.WORKING_WEEKDAYS)
+
+    cumulative = [0]
+    day = date(year, 1, 1)
+    while day.year == year:
+        is_working = day.weekday() in weekdays and day not in holidays
+        cumulative.append(cumulative[-1] + is_working)
+        day += timedelta(days=1)
+
+    return cumulative
+
+
+def current_version():
+    if cache_is_shared():
+        return cache.get(VERSION_KEY)
+
+    # LocMem tidak terlihat proses lain -> sidik jari tabel Holiday
+    # (count ikut berubah saat row dihapus)
+    stats = Holiday.objects.aggregate(count=Count("id"), updated=Max("updated_at"))
+    return (stats["count"], stats["updated"])
+
+
+def check_version():
+    """
+    Kosongkan index lokal jika kalender diubah oleh proses lain.
+    """
+    global _version, _checked_at
+
+    now = time.monotonic()
+    if now - _checked_at < settings.WORKDAY_INDEX_CHECK_INTERVAL:
+        return
+
+    version = current_version()
+    with _lock:
+        if version != _version:
+            _indexes.clear()
+            _version = version
+        _checked_at = now
+
+
+def get_year(year):
+    check_version()
+
+    cumulative = _indexes.get(year)
+    if cumulative is None:
+        cumulative = build_year(year)
+        with _lock:
+            _indexes[year] = cumulative
+    return cumulative
+
+
+def invalidate():
+    global _version, _checked_at
+
+    if cache_is_shared():
+        cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+    with _lock:
+        _indexes.clear()
+        # dibaca ulang pada get_year berikutnya
+        _version = None
+        _checked_at = 0.0
+
+
+def count_working_days(start, end):
+    """
+    Jumlah hari kerja di [start, end] (inclusive). 0 jika end < start.
+    """
+    total = 0
+
+    for year in range(start.year, end.year + 1):
+        cumulative = get_year(year)
+
+        first = start if start.year == year else date(year, 1, 1)
+        last = end if end.year == year else date(year, 12, 31)
+        if last < first:
+            continue
+
+        first_index = first.timetuple().tm_yday - 1
+        last_index = last.timetuple().tm_yday
+        total += cumulative[last_index] - cumulative[first_index]
+
+    return total
+
+
+def month_working_days(year, month):
+    """
+    Jumlah hari kerja 1 bulan (dasar PayrollRun.working_days).
+    """
+    start, end = month_bounds(year, month)
+    return count_working_days(start, end - timedelta(days=1))
+
+
+def is_working_day(day):
+    index = day.timetuple().tm_yday
+    cumulative = get_year(day.year)
+    return cumulative[index] != cumulative[index - 1]
+
+
+def working_dates(start, end):
+    """
+    Tanggal hari kerja di [start, end] (inclusive), mis. untuk deteksi alpha.
+    """
+    day = start
+    while day <= end:
+        if is_working_day(day):
+            yield day
+        day += timedelta(days=1)
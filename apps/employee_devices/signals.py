@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .models import EmployeeDevice
+from .trust import invalidate_device
+
+
+@receiver(post_init, sender=EmployeeDevice, dispatch_uid="employee_device_init")
+def remember_device_id(sender, instance, **kwargs):
+    # device_id bisa diedit -> entry cache device_id lama juga harus dihapus
+    instance._loaded_device_id = instance.__dict__.get("device_id")
+
+
+@receiver(post_save, sender=EmployeeDevice, dispatch_uid="employee_device_saved")
+@receiver(post_delete, sender=EmployeeDevice, dispatch_uid="employee_device_deleted")
+def invalidate_device_trust(sender, instance, **kwargs):
+    device_ids = {instance.device_id}
+
+    loaded_device_id = getattr(instance, "_loaded_device_id", None)
+    if loaded_device_id:
+        device_ids.add(loaded_device_id)
+
+    # setelah commit: sebelum itu request lain bisa mengisi ulang cache
+    # dari row lama
+    for device_id in device_ids:
+        transaction.on_commit(lambda device_id=device_id: invalidate_device(device_id))
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def flush_device_touches():
+    """
+    Dijadwalkan Celery beat tiap DEVICE_TOUCH_FLUSH_INTERVAL detik.
+    Hanya berarti untuk buffer Redis; buffer memori di-flush oleh proses
+    web pemiliknya sendiri.
+    """
+    from .touches import flush_touches, get_buffer
+
+    if get_buffer().shared:
+        flush_touches()
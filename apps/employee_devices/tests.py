@@ -1,3 +1,153 @@
 from django.test import TestCase
 
 # Create your tests here.
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.employees.models import Employee
+from . import touches, trust
+from .models import EmployeeDevice
+
+
+# interval panjang: thread flusher MemoryTouchBuffer tidak ikut jalan selama test
+@override_settings(REDIS_URL=None, DEVICE_TOUCH_FLUSH_SIZE=3, DEVICE_TOUCH_FLUSH_INTERVAL=3600)
+class DeviceTouchBufferTest(TestCase):
+    """
+    last_used_at ditulis lewat write-behind buffer, bukan per ping.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.employee = Employee.objects.create(user=user, employee_number="20260001")
+        cls.devices = [
+            EmployeeDevice.objects.create(
+                employee=cls.employee,
+                device_id=f"device-{index}",
+                device_name="Phone",
+                os_name="Android",
+                os_version="14",
+            )
+            for index in range(3)
+        ]
+
+    def setUp(self):
+        patcher = mock.patch.object(touches, "_buffer", touches.MemoryTouchBuffer())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def last_used(self):
+        return dict(EmployeeDevice.objects.values_list("device_id", "last_used_at"))
+
+    def test_touch_is_buffered_until_flush(self):
+        first = datetime(2026, 3, 2, 8, 0, tzinfo=dt_timezone.utc)
+        touches.touch_device("device-0", first)
+        touches.touch_device("device-0", first + timedelta(minutes=5))
+
+        self.assertIsNone(self.last_used()["device-0"])
+
+        self.assertEqual(touches.flush_touches(), 1)
+        self.assertEqual(self.last_used()["device-0"], first + timedelta(minutes=5))
+        self.assertEqual(touches.flush_touches(), 0)
+
+    def test_flush_when_size_reached(self):
+        used_at = datetime(2026, 3, 2, 8, 0, tzinfo=dt_timezone.utc)
+        for device in self.devices:
+            touches.touch_device(device.device_id, used_at)
+
+        self.assertEqual(set(self.last_used().values()), {used_at})
+
+    def test_flush_when_interval_elapsed(self):
+        used_at = datetime(2026, 3, 2, 8, 0, tzinfo=dt_timezone.utc)
+        touches.get_buffer().drained_at -= 3600
+
+        touches.touch_device("device-1", used_at)
+
+        self.assertEqual(self.last_used()["device-1"], used_at)
+
+    def test_flusher_thread_writes_without_new_touch(self):
+        used_at = datetime(2026, 3, 2, 8, 0, tzinfo=dt_timezone.utc)
+        touches.touch_device("device-2", used_at)
+
+        # 1 putaran flush_loop, lalu hentikan loop
+        with mock.patch.object(touches.time, "sleep", side_effect=[None, StopIteration]), \
+                mock.patch.object(touches.connections, "close_all"):
+            with self.assertRaises(StopIteration):
+                touches.get_buffer().flush_loop()
+
+        self.assertEqual(self.last_used()["device-2"], used_at)
+
+    def test_unchanged_ping_does_not_update_row(self):
+        device = self.devices[0]
+        client = APIClient()
+        client.force_authenticate(self.employee.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.patch(f"/api/device/devices/{device.id}/", {"device_name": "Phone"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries if query["sql"].startswith("UPDATE")])
+        self.assertIn(device.device_id, touches.get_buffer().touched)
+
+
+@override_settings(ATTENDANCE_DEVICE_ENFORCEMENT="registered")
+class DeviceTrustTest(TestCase):
+    """
+    Device yang dinonaktifkan HR langsung ditolak di semua worker.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.employee = Employee.objects.create(user=user, employee_number="20260001")
+        cls.device = EmployeeDevice.objects.create(
+            employee=cls.employee,
+            device_id="device-0",
+            device_name="Phone",
+            os_name="Android",
+            os_version="14",
+        )
+
+    def setUp(self):
+        patcher = mock.patch.object(trust, "touch_device")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def deactivate_elsewhere(self):
+        # UPDATE tanpa signal = perubahan oleh worker lain
+        EmployeeDevice.objects.filter(id=self.device.id).update(is_active=False)
+
+    def test_process_local_cache_is_not_used(self):
+        self.assertIsNone(trust.check_attendance_device(self.employee, "device-0"))
+
+        self.deactivate_elsewhere()
+
+        self.assertEqual(trust.check_attendance_device(self.employee, "device-0"), "Device tidak aktif.")
+
+    def test_shared_cache_invalidated_on_commit(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            },
+        }):
+            self.assertIsNone(trust.check_attendance_device(self.employee, "device-0"))
+
+            # shared cache: entry lama dipakai sampai invalidasi
+            self.deactivate_elsewhere()
+            self.assertIsNone(trust.check_attendance_device(self.employee, "device-0"))
+
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                device = EmployeeDevice.objects.get(id=self.device.id)
+                device.save()
+                self.assertIsNone(trust.check_attendance_device(self.employee, "device-0"))
+
+            self.assertEqual(len(callbacks), 1)
+            self.assertEqual(trust.check_attendance_device(self.employee, "device-0"), "Device tidak aktif.")
@@ -0,0 +1,166 @@
+"""
+Write-behind buffer EmployeeDevice.last_used_at.
+
+touch_device hanya mencatat waktu pemakaian terakhir per device_id;
+flush_touches menulis semuanya dengan UPDATE ... CASE per batch.
+
+- REDIS_URL di-set : buffer di hash Redis (shared antar proses/host),
+                     di-flush task Celery beat tiap
+                     DEVICE_TOUCH_FLUSH_INTERVAL detik
+- tanpa Redis      : buffer di memori proses web itu sendiri, di-flush
+                     saat DEVICE_TOUCH_FLUSH_SIZE device tercapai dan oleh
+                     thread flusher tiap DEVICE_TOUCH_FLUSH_INTERVAL detik
+                     (task beat tidak bisa melihat buffer proses lain)
+
+Keduanya juga di-flush saat proses berhenti (atexit).
+"""
+import atexit
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+from .models import EmployeeDevice
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "hris:devices:touches"
+BATCH_SIZE = 500
+
+
+class MemoryTouchBuffer:
+    shared = False
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.touched = {}
+        self.drained_at = time.monotonic()
+
+        # flush berbasis waktu di proses ini, tidak menunggu touch berikutnya
+        threading.Thread(target=self.flush_loop, name="hris-device-touches", daemon=True).start()
+
+    def flush_loop(self):
+        while True:
+            time.sleep(settings.DEVICE_TOUCH_FLUSH_INTERVAL)
+            try:
+                flush_touches()
+            except Exception:
+                logger.exception("Flush last_used_at device gagal")
+            finally:
+                connections.close_all()
+
+    def add(self, device_id, used_at):
+        with self.lock:
+            self.touched[device_id] = used_at
+            return len(self.touched)
+
+    def is_due(self, size):
+        return (
+            size >= settings.DEVICE_TOUCH_FLUSH_SIZE
+            or time.monotonic() - self.drained_at >= settings.DEVICE_TOUCH_FLUSH_INTERVAL
+        )
+
+    def drain(self):
+        with self.lock:
+            touched, self.touched = self.touched, {}
+            self.drained_at = time.monotonic()
+        return touched
+
+
+class RedisTouchBuffer:
+    shared = True
+
+    def __init__(self, url):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.response_error = redis.exceptions.ResponseError
+
+    def add(self, device_id, used_at):
+        self.client.hset(REDIS_KEY, device_id, used_at.isoformat())
+        return None
+
+    def is_due(self, size):
+        # flush oleh task periodik, bukan di jalur request
+        return False
+
+    def drain(self):
+        # RENAME atomik: touch baru masuk ke hash baru selama flush berjalan
+        draining_key = f"{REDIS_KEY}:flush:{uuid.uuid4().hex}"
+        try:
+            self.client.rename(REDIS_KEY, draining_key)
+        except self.response_error:
+            # hash belum ada = tidak ada touch sejak flush terakhir
+            return {}
+
+        pipe = self.client.pipeline()
+        pipe.hgetall(draining_key)
+        pipe.delete(draining_key)
+        raw, _ = pipe.execute()
+
+        return {
+            device_id.decode(): datetime.fromisoformat(used_at.decode())
+            for device_id, used_at in raw.items()
+        }
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    global _buffer
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = RedisTouchBuffer(settings.REDIS_URL) if settings.REDIS_URL else MemoryTouchBuffer()
+    return _buffer
+
+
+def touch_device(device_id, used_at=None):
+    buffer = get_buffer()
+    size = buffer.add(device_id, used_at or timezone.now())
+
+    if buffer.is_due(size):
+        flush_touches()
+
+
+def write_touches(touched):
+    items = list(touched.items())
+
+    for start in range(0, len(items), BATCH_SIZE):
+        batch = items[start:start + BATCH_SIZE]
+        EmployeeDevice.objects.filter(device_id__in=[device_id for device_id, _ in batch]).update(
+            last_used_at=Case(
+                *[When(device_id=device_id, then=Value(used_at)) for device_id, used_at in batch],
+                output_field=DateTimeField(),
+            )
+        )
+
+
+def flush_touches():
+    """
+    Tulis buffer ke DB. Return jumlah device.
+    """
+    touched = get_buffer().drain()
+    if touched:
+        write_touches(touched)
+    return len(touched)
+
+
+@atexit.register
+def flush_on_exit():
+    if _buffer is None:
+        return
+    try:
+        flush_touches()
+    except Exception:
+        # DB / Redis bisa sudah tidak tersedia saat proses dimatikan
+        logger.exception("Flush last_used_at device saat shutdown gagal")
@@ -0,0 +1,114 @@
+"""
+Cache trust device (keyed device_id) untuk check-device & check-in/out.
+
+Entry cache berisi data yang dibutuhkan validasi dan response
+check-device, sehingga request berikutnya tidak query DB. Entry dihapus
+oleh signal setelah commit saat EmployeeDevice disimpan / dihapus
+(update-status, edit, admin) dan kedaluwarsa setelah
+DEVICE_TRUST_CACHE_TIMEOUT.
+
+Cache hanya dipakai jika shared (Redis). Cache per proses (LocMem) tidak
+ikut terhapus di worker lain, sehingga device yang baru dinonaktifkan HR
+masih lolos sampai timeout; tanpa Redis setiap validasi membaca DB
+(1 query indexed by device_id).
+
+last_used_at tidak ditulis per request, lihat touches.py.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.caches import cache_is_shared
+
+from .models import EmployeeDevice
+from .touches import touch_device
+
+KEY_PREFIX = "devices:trust:"
+
+# penanda "device tidak terdaftar" supaya hasil kosong juga ikut di-cache
+NO_DEVICE = "none"
+
+
+def trust_key(device_id):
+    return f"{KEY_PREFIX}{device_id}"
+
+
+def load_device(device_id):
+    device = (
+        EmployeeDevice.objects.filter(device_id=device_id)
+        .values(
+            "id",
+            "device_id",
+            "device_name",
+            "employee_id",
+            "employee__employee_number",
+            "employee__user__full_name",
+            "is_active",
+            "is_verified",
+        )
+        .first()
+    )
+    if not device:
+        return None
+
+    return {
+        "id": device["id"],
+        "device_id": device["device_id"],
+        "device_name": device["device_name"],
+        "employee_id": device["employee_id"],
+        "employee_number": device["employee__employee_number"],
+        "employee_name": device["employee__user__full_name"],
+        "is_active": device["is_active"],
+        "is_verified": device["is_verified"],
+    }
+
+
+def get_device_trust(device_id):
+    """
+    Dict data device dari cache, None jika device tidak terdaftar.
+    """
+    if not cache_is_shared():
+        return load_device(device_id)
+
+    key = trust_key(device_id)
+    trust = cache.get(key)
+
+    if trust is None:
+        trust = load_device(device_id) or NO_DEVICE
+        cache.set(key, trust, timeout=settings.DEVICE_TRUST_CACHE_TIMEOUT)
+
+    if trust == NO_DEVICE:
+        return None
+    return trust
+
+
+def invalidate_device(device_id):
+    if cache_is_shared():
+        cache.delete(trust_key(device_id))
+
+
+def check_attendance_device(employee, device_id):
+    """
+    Validasi device untuk check-in / check-out sesuai
+    ATTENDANCE_DEVICE_ENFORCEMENT:
+    - "off"        : tidak dicek
+    - "registered" : device terdaftar atas employee & aktif
+    - "verified"   : seperti "registered" + sudah diverifikasi HR
+    Return pesan error (str) atau None jika lolos.
+    """
+    mode = settings.ATTENDANCE_DEVICE_ENFORCEMENT
+    if mode == "off":
+        return None
+
+    if not device_id:
+        return "device_id wajib diisi."
+
+    trust = get_device_trust(device_id)
+    if not trust or trust["employee_id"] != employee.id:
+        return "Device tidak terdaftar untuk employee ini."
+    if not trust["is_active"]:
+        return "Device tidak aktif."
+    if mode == "verified" and not trust["is_verified"]:
+        return "Device belum diverifikasi."
+
+    touch_device(device_id)
+    return None
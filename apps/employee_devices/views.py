@@ -6,10 +6,11 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from apps.accounts.permissions import HasPermission
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.utils import timezone
 
 from .models import EmployeeDevice
 from .serializers import EmployeeDeviceSerializer
+from .touches import touch_device
+from .trust import get_device_trust
 
 
 class EmployeeDeviceViewSet(viewsets.ModelViewSet):
@@ -38,7 +39,17 @@ class EmployeeDeviceViewSet(viewsets.ModelViewSet):
         serializer.save(employee=employee)
 
     def perform_update(self, serializer):
-        serializer.save(last_used_at=timezone.now())
+        device = serializer.instance
+
+        # ping tanpa perubahan data -> tidak ada UPDATE row sama sekali
+        changed = any(
+            getattr(device, name) != value for name, value in serializer.validated_data.items()
+        )
+        if changed:
+            device = serializer.save()
+
+        # last_used_at lewat write-behind buffer (touches.py)
+        touch_device(device.device_id)
         
 
     @action(detail=False, methods=["post"], url_path="check-device",
@@ -54,12 +65,10 @@ class EmployeeDeviceViewSet(viewsets.ModelViewSet):
                 "data": None
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        device = EmployeeDevice.objects.filter(
-            device_id=device_id,
-            is_active=True
-        ).select_related("employee__user").first()
+        # dari cache trust device (tanpa query DB jika sudah ter-cache)
+        device = get_device_trust(device_id)
 
-        if not device:
+        if not device or not device["is_active"]:
             return Response({
                 "status": "error",
                 "code": 404,
@@ -72,13 +81,13 @@ class EmployeeDeviceViewSet(viewsets.ModelViewSet):
             "code": 200,
             "message": "Data berhasil diambil",
             "data": {
-                "id": device.id,
-                "employee_number": device.employee.employee_number,
-                "employee_name": device.employee.user.full_name,
-                "device_name": device.device_name,
-                "device_id": device.device_id,
-                "verified": device.is_verified,
-                "is_active": device.is_active
+                "id": device["id"],
+                "employee_number": device["employee_number"],
+                "employee_name": device["employee_name"],
+                "device_name": device["device_name"],
+                "device_id": device["device_id"],
+                "verified": device["is_verified"],
+                "is_active": device["is_active"]
             }
         }, status=status.HTTP_200_OK)
     
@@ -127,7 +136,7 @@ class EmployeeDeviceViewSet(viewsets.ModelViewSet):
 
         device.is_active = is_active
         device.is_verified = is_verified
-        device.save()
+        device.save()  # signal -> cache trust device dihapus
 
         return Response({
             "status": "success",
@@ -7,6 +7,7 @@ from .models import (
     Position,
     Grade,
     EmploymentStatus,
+    EmployeeImportJob,
 )
 
 
@@ -134,3 +135,14 @@ class EmployeeAdmin(admin.ModelAdmin):
     @admin.display(description="Email")
     def email(self, obj):
         return obj.user.email if obj.user else "-"
+
+
+# ================================
+# IMPORT JOB
+# ================================
+
+@admin.register(EmployeeImportJob)
+class EmployeeImportJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "file_type", "dry_run", "status", "total_rows", "created_count", "requested_by", "created_at")
+    list_filter = ("status", "file_type", "dry_run")
+    readonly_fields = ("created_at", "started_at", "finished_at")
@@ -0,0 +1,183 @@
+"""
+Pemeliharaan closure table EmployeeHierarchy.
+
+Setiap employee punya row (diri sendiri, depth 0) ditambah 1 row per
+atasan di rantainya. Semua bawahan (langsung + tidak langsung) seorang
+manager cukup 1 query indexed:
+
+    EmployeeHierarchy.objects.filter(ancestor=manager, depth__gte=1)
+
+Pindah manager = hapus link subtree ke atasan lama lalu sambungkan
+subtree ke rantai atasan baru (jumlah query tetap, tidak bergantung
+kedalaman org). Operasi bulk yang melewati signal (bulk_create / update)
+perlu diikuti command rebuild_employee_hierarchy.
+"""
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from .models import Employee, EmployeeHierarchy
+
+BATCH_SIZE = 2000
+
+
+def subtree_ids(employee_id):
+    """
+    Employee + semua bawahannya.
+    """
+    return list(
+        EmployeeHierarchy.objects.filter(ancestor_id=employee_id).values_list("descendant_id", flat=True)
+    )
+
+
+def subordinate_ids(manager_id, max_depth=None):
+    """
+    Queryset id bawahan (untuk dipakai sebagai subquery __in).
+    """
+    qs = EmployeeHierarchy.objects.filter(ancestor_id=manager_id, depth__gte=1)
+    if max_depth:
+        qs = qs.filter(depth__lte=max_depth)
+    return qs.values("descendant_id")
+
+
+def is_subordinate(employee_id, manager_id):
+    return EmployeeHierarchy.objects.filter(
+        ancestor_id=manager_id,
+        descendant_id=employee_id,
+        depth__gte=1,
+    ).exists()
+
+
+def check_manager(employee_id, manager_id):
+    """
+    Manager tidak boleh diri sendiri atau bawahannya (siklus).
+    """
+    if not manager_id or not employee_id:
+        return
+    if manager_id == employee_id or is_subordinate(manager_id, employee_id):
+        raise ValidationError("Manager tidak boleh diri sendiri atau bawahan employee tersebut.")
+
+
+def link(employee_ids_depths, manager_id):
+    """
+    Sambungkan subtree [(descendant_id, depth dari root subtree)] ke
+    rantai atasan manager_id.
+    """
+    if not manager_id:
+        return
+
+    ancestors = list(
+        EmployeeHierarchy.objects.filter(descendant_id=manager_id).values_list("ancestor_id", "depth")
+    )
+    EmployeeHierarchy.objects.bulk_create(
+        [
+            EmployeeHierarchy(
+                ancestor_id=ancestor_id,
+                descendant_id=descendant_id,
+                depth=ancestor_depth + depth + 1,
+            )
+            for ancestor_id, ancestor_depth in ancestors
+            for descendant_id, depth in employee_ids_depths
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+@transaction.atomic
+def add_employee(employee):
+    EmployeeHierarchy.objects.create(ancestor=employee, descendant=employee, depth=0)
+    link([(employee.id, 0)], employee.manager_id)
+
+
+def add_employees_bulk(manager_ids):
+    """
+    Closure row untuk employee baru hasil bulk_create (tanpa signal).
+    manager_ids: dict employee_id -> manager_id (manager sudah ada di tabel).
+    """
+    ancestors = {}
+    referenced = {manager_id for manager_id in manager_ids.values() if manager_id}
+    for ancestor_id, descendant_id, depth in EmployeeHierarchy.objects.filter(
+        descendant_id__in=referenced
+    ).values_list("ancestor_id", "descendant_id", "depth"):
+        ancestors.setdefault(descendant_id, []).append((ancestor_id, depth))
+
+    rows = []
+    for employee_id, manager_id in manager_ids.items():
+        rows.append(EmployeeHierarchy(ancestor_id=employee_id, descendant_id=employee_id, depth=0))
+        rows.extend(
+            EmployeeHierarchy(ancestor_id=ancestor_id, descendant_id=employee_id, depth=depth + 1)
+            for ancestor_id, depth in ancestors.get(manager_id, [])
+        )
+
+    EmployeeHierarchy.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+def unlink_from_ancestors(employee_id):
+    """
+    Putus link subtree employee ke semua atasannya (subtree jadi root).
+    Return [(descendant_id, depth)] subtree tersebut.
+    """
+    subtree = list(
+        EmployeeHierarchy.objects.filter(ancestor_id=employee_id).values_list("descendant_id", "depth")
+    )
+    ids = [descendant_id for descendant_id, _ in subtree]
+
+    # id dimaterialisasi dulu: MySQL menolak DELETE dengan subquery ke tabel yang sama
+    ancestor_ids = list(
+        EmployeeHierarchy.objects.filter(descendant_id=employee_id, depth__gte=1)
+        .values_list("ancestor_id", flat=True)
+    )
+    if ancestor_ids:
+        EmployeeHierarchy.objects.filter(descendant_id__in=ids, ancestor_id__in=ancestor_ids).delete()
+
+    return subtree
+
+
+@transaction.atomic
+def move_employee(employee_id, manager_id):
+    subtree = unlink_from_ancestors(employee_id)
+    link(subtree, manager_id)
+
+
+@transaction.atomic
+def detach_subordinates(employee_id):
+    """
+    Dipanggil sebelum employee dihapus: manager bawahan langsung akan
+    di-SET_NULL, jadi subtree mereka diputus dari rantai atasan.
+    """
+    for subordinate_id in Employee.objects.filter(manager_id=employee_id).values_list("id", flat=True):
+        unlink_from_ancestors(subordinate_id)
+
+
+def closure_rows(parents):
+    """
+    parents: dict employee_id -> manager_id. Yield (ancestor, descendant, depth).
+    """
+    for employee_id in parents:
+        yield employee_id, employee_id, 0
+
+        seen = {employee_id}
+        ancestor_id = parents.get(employee_id)
+        depth = 1
+        while ancestor_id and ancestor_id in parents and ancestor_id not in seen:
+            yield ancestor_id, employee_id, depth
+            seen.add(ancestor_id)
+            ancestor_id = parents[ancestor_id]
+            depth += 1
+
+
+@transaction.atomic
+def rebuild_hierarchy():
+    """
+    Bangun ulang seluruh closure table dari Employee.manager (1 query baca).
+    Return jumlah row yang ditulis.
+    """
+    parents = dict(Employee.objects.values_list("id", "manager_id"))
+
+    EmployeeHierarchy.objects.all().delete()
+
+    rows = [
+        EmployeeHierarchy(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth)
+        for ancestor_id, descendant_id, depth in closure_rows(parents)
+    ]
+    EmployeeHierarchy.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
@@ -0,0 +1,432 @@
+"""
+Import employee massal dari CSV / XLSX.
+
+Alur:
+1. baca file baris per baris (csv.DictReader / openpyxl read_only)
+2. validasi per baris; kode Department / Position / Grade /
+   EmploymentStatus di-resolve dari dict yang dimuat 1x di awal
+3. validasi set-based: email sudah terdaftar & manager (employee_number)
+   dicek dengan query IN per chunk
+4. ada error -> tidak ada yang ditulis, return error per baris
+5. tulis: nomor pegawai dialokasikan sekaligus (allocate_employee_numbers),
+   User + UserRole lewat apps.accounts.services (hash password paralel
+   sebelum transaksi), lalu Employee & closure hierarchy di-bulk_create
+"""
+import csv
+import io
+import logging
+from datetime import date, datetime
+
+from django.conf import settings
+from django.core.validators import validate_email
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import Role, User
+from apps.accounts.services import build_users, insert_users
+from apps.core.background import enqueue
+
+from .hierarchy import add_employees_bulk
+from .models import Department, Employee, EmployeeImportJob, EmploymentStatus, Grade, Position
+from .utils import allocate_employee_numbers
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+FILE_TYPES = ("csv", "xlsx")
+
+COLUMNS = (
+    "email",
+    "full_name",
+    "password",
+    "nik",
+    "phone",
+    "address",
+    "birth_date",
+    "gender",
+    "join_date",
+    "department",
+    "position",
+    "grade",
+    "employment_status",
+    "manager",
+    "is_active_employee",
+)
+
+# kolom kode master -> (field FK di Employee, model)
+CODE_COLUMNS = {
+    "department": ("department_id", Department),
+    "position": ("position_id", Position),
+    "grade": ("grade_id", Grade),
+    "employment_status": ("employment_status_id", EmploymentStatus),
+}
+
+TEXT_COLUMNS = ("nik", "phone", "address")
+DATE_COLUMNS = ("birth_date", "join_date")
+GENDERS = ("male", "female")
+TRUE_VALUES = ("1", "true", "yes", "y", "ya")
+FALSE_VALUES = ("0", "false", "no", "n", "tidak")
+
+
+class ImportFileError(Exception):
+    """
+    File tidak bisa dibaca (format / header salah).
+    """
+
+
+# =====================================================
+# 1) READ
+# =====================================================
+def normalize_header(header):
+    return [str(name or "").strip().lower() for name in header]
+
+
+def check_header(header):
+    missing = [name for name in ("email", "full_name") if name not in header]
+    if missing:
+        raise ImportFileError(f"Kolom wajib tidak ada: {', '.join(missing)}.")
+
+
+def read_csv(file):
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+
+    header = normalize_header(next(reader, []))
+    check_header(header)
+
+    for row_number, values in enumerate(reader, start=2):
+        if any(value.strip() for value in values):
+            yield row_number, dict(zip(header, values))
+
+
+def read_xlsx(file):
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFileError("File XLSX tidak valid.")
+
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = normalize_header(next(rows, []))
+        check_header(header)
+
+        for row_number, values in enumerate(rows, start=2):
+            if any(value not in (None, "") for value in values):
+                yield row_number, dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def read_rows(file, file_type):
+    if file_type == "xlsx":
+        return read_xlsx(file)
+    return read_csv(file)
+
+
+# =====================================================
+# 2) VALIDATE
+# =====================================================
+def load_lookups():
+    """
+    Kode master -> id, 1 query per tabel.
+    """
+    return {
+        column: dict(model.objects.values_list("code", "id"))
+        for column, (_, model) in CODE_COLUMNS.items()
+    }
+
+
+def text(value):
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(text(value))
+
+
+def clean_row(raw, lookups):
+    """
+    Return (data, errors) untuk 1 baris.
+    """
+    data = {}
+    errors = {}
+
+    email = text(raw.get("email"))
+    try:
+        validate_email(email)
+        data["email"] = User.objects.normalize_email(email)
+    except ValidationError:
+        errors["email"] = "Email tidak valid."
+
+    data["full_name"] = text(raw.get("full_name"))
+    if not data["full_name"]:
+        errors["full_name"] = "full_name wajib diisi."
+
+    password = text(raw.get("password"))
+    if password and len(password) < 6:
+        errors["password"] = "Password minimal 6 karakter."
+    data["password"] = password or None
+
+    for column in TEXT_COLUMNS:
+        data[column] = text(raw.get(column)) or None
+
+    for column in DATE_COLUMNS:
+        value = raw.get(column)
+        if value in (None, ""):
+            data[column] = None
+            continue
+        try:
+            data[column] = parse_date(value)
+        except ValueError:
+            errors[column] = "Format tanggal harus YYYY-MM-DD."
+
+    gender = text(raw.get("gender")).lower() or None
+    if gender and gender not in GENDERS:
+        errors["gender"] = f"gender harus salah satu dari: {', '.join(GENDERS)}."
+    data["gender"] = gender
+
+    for column, (field, _) in CODE_COLUMNS.items():
+        code = text(raw.get(column))
+        data[field] = None
+        if code:
+            data[field] = lookups[column].get(code)
+            if data[field] is None:
+                errors[column] = f"Kode {column} '{code}' tidak ditemukan."
+
+    data["manager"] = text(raw.get("manager")) or None
+
+    active = text(raw.get("is_active_employee")).lower()
+    if active and active not in TRUE_VALUES + FALSE_VALUES:
+        errors["is_active_employee"] = "is_active_employee harus true/false."
+    data["is_active_employee"] = active not in FALSE_VALUES
+
+    return data, errors
+
+
+def existing_values(queryset, field, values):
+    found = set()
+    values = list(values)
+    for start in range(0, len(values), CHUNK_SIZE):
+        found.update(
+            queryset.filter(**{f"{field}__in": values[start:start + CHUNK_SIZE]})
+            .values_list(field, flat=True)
+        )
+    return found
+
+
+def id_map(queryset, key, values):
+    mapping = {}
+    values = list(values)
+    for start in range(0, len(values), CHUNK_SIZE):
+        mapping.update(
+            queryset.filter(**{f"{key}__in": values[start:start + CHUNK_SIZE]}).values_list(key, "id")
+        )
+    return mapping
+
+
+def validate_rows(rows):
+    """
+    Return (list baris valid, list error per baris).
+    """
+    lookups = load_lookups()
+    cleaned = []
+    errors = {}
+    seen_emails = {}
+
+    for row_number, raw in rows:
+        if len(cleaned) >= settings.EMPLOYEE_IMPORT_MAX_ROWS:
+            raise ImportFileError(f"Maksimal {settings.EMPLOYEE_IMPORT_MAX_ROWS} baris per import.")
+
+        data, row_errors = clean_row(raw, lookups)
+
+        email_key = (data.get("email") or "").lower()
+        if email_key and email_key in seen_emails:
+            row_errors["email"] = f"Email duplikat dengan baris {seen_emails[email_key]}."
+        elif email_key:
+            seen_emails[email_key] = row_number
+
+        if row_errors:
+            errors[row_number] = row_errors
+        cleaned.append((row_number, data))
+
+    # validasi set-based (query IN per chunk)
+    emails = [data["email"] for _, data in cleaned if data.get("email")]
+    registered = {email.lower() for email in existing_values(User.objects.all(), "email", emails)}
+
+    managers = {data["manager"] for _, data in cleaned if data["manager"]}
+    manager_ids = id_map(Employee.objects.all(), "employee_number", managers)
+
+    for row_number, data in cleaned:
+        if data.get("email") and data["email"].lower() in registered:
+            errors.setdefault(row_number, {})["email"] = "Email sudah digunakan."
+
+        if data["manager"]:
+            data["manager_id"] = manager_ids.get(data["manager"])
+            if data["manager_id"] is None:
+                errors.setdefault(row_number, {})["manager"] = (
+                    f"Manager '{data['manager']}' tidak ditemukan."
+                )
+        else:
+            data["manager_id"] = None
+
+    valid = [data for row_number, data in cleaned if row_number not in errors]
+    error_list = [{"row": row_number, "errors": errors[row_number]} for row_number in sorted(errors)]
+    return valid, error_list
+
+
+# =====================================================
+# 3) WRITE
+# =====================================================
+def write_rows(rows):
+    # hash password paralel di luar transaksi (lama, CPU-bound)
+    users = build_users([
+        {
+            "email": row["email"],
+            "full_name": row["full_name"],
+            "password": row["password"],
+            "is_active": True,
+        }
+        for row in rows
+    ])
+
+    # default role = Employee (sama seperti EmployeeCreateSerializer)
+    role_employee = Role.objects.filter(name="Employee").first()
+
+    with transaction.atomic():
+        numbers = allocate_employee_numbers(len(rows))
+        for user, number in zip(users, numbers):
+            user.employee_id = number
+
+        user_ids = insert_users(users, role_ids=[role_employee.id] if role_employee else ())
+        user_ids = {user.employee_id: user_ids[user.email] for user in users}
+
+        Employee.objects.bulk_create(
+            [
+                Employee(
+                    user_id=user_ids[number],
+                    employee_number=number,
+                    nik=row["nik"],
+                    phone=row["phone"],
+                    address=row["address"],
+                    birth_date=row["birth_date"],
+                    gender=row["gender"],
+                    join_date=row["join_date"],
+                    department_id=row["department_id"],
+                    position_id=row["position_id"],
+                    grade_id=row["grade_id"],
+                    employment_status_id=row["employment_status_id"],
+                    manager_id=row["manager_id"],
+                    is_active_employee=row["is_active_employee"],
+                )
+                for row, number in zip(rows, numbers)
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+        employee_ids = id_map(Employee.objects.all(), "employee_number", numbers)
+
+        # bulk_create tidak mengirim signal -> closure hierarchy diisi di sini
+        add_employees_bulk({
+            employee_ids[number]: row["manager_id"] for row, number in zip(rows, numbers)
+        })
+
+    return numbers
+
+
+def import_employees(file, file_type="csv", dry_run=False):
+    """
+    Return dict hasil: total, created, errors (list per baris), employee_numbers.
+    Raise ImportFileError jika file tidak bisa dibaca.
+    """
+    if file_type not in FILE_TYPES:
+        raise ImportFileError(f"file_type harus salah satu dari: {', '.join(FILE_TYPES)}.")
+
+    try:
+        valid, errors = validate_rows(read_rows(file, file_type))
+    except UnicodeDecodeError:
+        raise ImportFileError("File CSV harus UTF-8.")
+
+    result = {
+        "total": len(valid) + len(errors),
+        "created": 0,
+        "errors": errors,
+        "employee_numbers": [],
+    }
+    if errors or dry_run or not valid:
+        return result
+
+    numbers = write_rows(valid)
+    result["created"] = len(numbers)
+    result["employee_numbers"] = numbers
+    return result
+
+
+# =====================================================
+# 4) JOB BACKGROUND (endpoint upload)
+# =====================================================
+def create_import_job(user, file, file_type, dry_run=False):
+    """
+    Simpan file upload + enqueue. Hash password & INSERT ribuan baris
+    terlalu lama untuk dikerjakan di dalam request HTTP.
+    """
+    from .tasks import import_employees_job
+
+    job = EmployeeImportJob.objects.create(
+        file=file,
+        file_type=file_type,
+        dry_run=dry_run,
+        requested_by=user,
+    )
+    enqueue(import_employees_job, job.id)
+    return job
+
+
+def run_import_job(job_id):
+    """
+    Kerjakan 1 EmployeeImportJob. Job yang sudah diambil worker lain
+    (status bukan pending) dilewati.
+    """
+    claimed = EmployeeImportJob.objects.filter(id=job_id, status="pending").update(
+        status="running",
+        started_at=timezone.now(),
+    )
+    if not claimed:
+        return
+
+    job = EmployeeImportJob.objects.get(id=job_id)
+
+    try:
+        with job.file.open("rb") as file:
+            result = import_employees(file, file_type=job.file_type, dry_run=job.dry_run)
+    except ImportFileError as exc:
+        EmployeeImportJob.objects.filter(id=job.id).update(
+            status="failed",
+            error=str(exc),
+            finished_at=timezone.now(),
+        )
+        return
+    except Exception as exc:
+        logger.exception("EmployeeImportJob %s gagal", job.id)
+        EmployeeImportJob.objects.filter(id=job.id).update(
+            status="failed",
+            error=str(exc),
+            finished_at=timezone.now(),
+        )
+        return
+
+    EmployeeImportJob.objects.filter(id=job.id).update(
+        status="failed" if result["errors"] else "done",
+        total_rows=result["total"],
+        created_count=result["created"],
+        errors=result["errors"],
+        error="Import dibatalkan, perbaiki baris yang error." if result["errors"] else None,
+        finished_at=timezone.now(),
+    )
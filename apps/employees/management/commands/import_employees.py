@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.employees.imports import ImportFileError, import_employees
+
+
+class Command(BaseCommand):
+    help = "Import employee massal dari file CSV / XLSX"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path file .csv / .xlsx")
+        parser.add_argument("--dry-run", action="store_true", help="Hanya validasi, tidak menyimpan")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_type = path.rsplit(".", 1)[-1].lower()
+
+        self.stdout.write(self.style.WARNING(f"🚀 Import employee dari {path}..."))
+        try:
+            with open(path, "rb") as file:
+                result = import_employees(file, file_type=file_type, dry_run=options["dry_run"])
+        except (OSError, ImportFileError) as exc:
+            raise CommandError(str(exc))
+
+        for item in result["errors"]:
+            errors = "; ".join(f"{field}: {message}" for field, message in item["errors"].items())
+            self.stdout.write(self.style.ERROR(f"Baris {item['row']}: {errors}"))
+
+        if result["errors"]:
+            raise CommandError(f"{len(result['errors'])} baris error, tidak ada yang disimpan.")
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"✅ {result['total']} baris valid (dry run)."))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f"🎉 {result['created']} employee berhasil diimport."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.employees.hierarchy import rebuild_hierarchy
+
+
+class Command(BaseCommand):
+    help = "Rebuild closure table EmployeeHierarchy dari Employee.manager"
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING("🚀 Rebuild employee hierarchy..."))
+        written = rebuild_hierarchy()
+        self.stdout.write(self.style.SUCCESS(f"🎉 Rebuild selesai, {written} row hierarchy ditulis."))
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_hierarchy(apps, schema_editor):
+    Employee = apps.get_model("employees", "Employee")
+    EmployeeHierarchy = apps.get_model("employees", "EmployeeHierarchy")
+
+    parents = dict(Employee.objects.values_list("id", "manager_id"))
+
+    rows = []
+    for employee_id in parents:
+        rows.append(EmployeeHierarchy(ancestor_id=employee_id, descendant_id=employee_id, depth=0))
+
+        seen = {employee_id}
+        ancestor_id = parents.get(employee_id)
+        depth = 1
+        while ancestor_id and ancestor_id in parents and ancestor_id not in seen:
+            rows.append(EmployeeHierarchy(ancestor_id=ancestor_id, descendant_id=employee_id, depth=depth))
+            seen.add(ancestor_id)
+            ancestor_id = parents[ancestor_id]
+            depth += 1
+
+    EmployeeHierarchy.objects.bulk_create(rows, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0002_alter_employee_employee_number"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmployeeHierarchy",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="employees.employee",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="employees.employee",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "employee_hierarchy",
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "depth"], name="emp_hier_desc_depth_idx"
+                    )
+                ],
+                "unique_together": {("ancestor", "descendant")},
+            },
+        ),
+        migrations.RunPython(backfill_hierarchy, migrations.RunPython.noop),
+    ]
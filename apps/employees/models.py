@@ -197,3 +197,104 @@ class Employee(TimeStampedModel):
 
     def __str__(self):
         return f"{self.employee_number} - {self.user.full_name}"
+
+    def clean(self):
+        from .hierarchy import check_manager
+
+        check_manager(self.pk, self.manager_id)
+
+
+class EmployeeHierarchy(models.Model):
+    """
+    Closure table rantai atasan (Employee.manager).
+    1 row per pasangan (atasan, bawahan) langsung maupun tidak langsung,
+    termasuk row diri sendiri (depth 0). Dipelihara oleh signal
+    (apps.employees.hierarchy) setiap manager berubah.
+    """
+    ancestor = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+    )
+    descendant = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+    )
+    depth = models.PositiveSmallIntegerField()  # 1 = bawahan langsung
+
+    class Meta:
+        db_table = "employee_hierarchy"
+        # unique (ancestor, descendant) sekaligus jadi index "semua bawahan X"
+        unique_together = ("ancestor", "descendant")
+        indexes = [
+            models.Index(fields=["descendant", "depth"], name="emp_hier_desc_depth_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
+
+class EmployeeNumberSequence(models.Model):
+    """
+    Counter nomor pegawai (YYYYNNNN) per tahun.
+    Dinaikkan atomik dengan F() oleh apps.employees.utils.
+    """
+    year = models.PositiveSmallIntegerField(unique=True)
+    last_number = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "employee_number_sequences"
+
+    def __str__(self):
+        return f"{self.year}: {self.last_number}"
+
+
+class EmployeeImportJob(models.Model):
+    """
+    Job import employee massal (CSV / XLSX). Dibuat oleh endpoint upload,
+    dikerjakan di background (apps.employees.imports.run_import_job).
+    """
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    FILE_TYPE_CHOICES = [
+        ("csv", "CSV"),
+        ("xlsx", "XLSX"),
+    ]
+
+    file = models.FileField(upload_to="employee-imports/%Y/%m/")
+    file_type = models.CharField(max_length=10, choices=FILE_TYPE_CHOICES, default="csv")
+    dry_run = models.BooleanField(default=False)
+
+    # failed = file tidak bisa dibaca / ada baris error (lihat errors)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    total_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)  # [{"row": n, "errors": {...}}]
+    error = models.TextField(null=True, blank=True)
+
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="employee_import_jobs",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "employee_import_jobs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Import employee #{self.pk} ({self.status})"
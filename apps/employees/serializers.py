@@ -1,14 +1,20 @@
 from rest_framework import serializers
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 
 from apps.accounts.models import User, Role, UserRole
+from apps.accounts.services import sync_links
 from .models import (
     Department,
     Position,
     Grade,
     EmploymentStatus,
     Employee,
+    EmployeeImportJob,
 )
+from .hierarchy import check_manager
+from .imports import FILE_TYPES
 from .utils import generate_employee_number
 
 
@@ -239,14 +245,18 @@ class EmployeeCreateSerializer(serializers.Serializer):
         password = validated_data.pop("password")
         email = validated_data.pop("email")
         # employee_id = validated_data.pop("employee_id")
-        employee_number = generate_employee_number()
         full_name = validated_data.pop("full_name")
 
-        user = User.objects.create_user(
-            email=email,
+        # hash (lambat) sebelum ambil nomor: row counter nomor pegawai
+        # ter-lock sampai transaksi ini commit, jadi dibuat sesingkat mungkin
+        password_hash = make_password(password)
+        employee_number = generate_employee_number()
+
+        user = User.objects.create(
+            email=User.objects.normalize_email(email),
             employee_id=employee_number,
             full_name=full_name,
-            password=password,
+            password=password_hash,
             is_active=True,
         )
 
@@ -274,7 +284,7 @@ class EmployeeCreateSerializer(serializers.Serializer):
         # assign default role = Employee
         role_employee = Role.objects.filter(name="Employee").first()
         if role_employee:
-            UserRole.objects.get_or_create(user=user, role=role_employee)
+            sync_links(UserRole, "user", [user.id], "role", [role_employee.id])
 
         return employee
 
@@ -301,3 +311,53 @@ class EmployeeUpdateSerializer(serializers.ModelSerializer):
             "manager",
             "is_active_employee",
         ]
+
+    def validate_manager(self, value):
+        if value and self.instance:
+            try:
+                check_manager(self.instance.pk, value.pk)
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError(exc.messages)
+        return value
+
+
+# ============================================================
+# IMPORT JOB
+# ============================================================
+class EmployeeImportJobSerializer(serializers.ModelSerializer):
+    requested_by_email = serializers.CharField(source="requested_by.email", read_only=True)
+
+    class Meta:
+        model = EmployeeImportJob
+        fields = [
+            "id",
+            "file_type",
+            "dry_run",
+            "status",
+            "total_rows",
+            "created_count",
+            "errors",
+            "error",
+            "requested_by_email",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
+class EmployeeImportJobCreateSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    file_type = serializers.ChoiceField(choices=FILE_TYPES, required=False)
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        # file_type default dari ekstensi file
+        if not attrs.get("file_type"):
+            extension = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if extension not in FILE_TYPES:
+                raise serializers.ValidationError(
+                    {"file_type": f"file_type harus salah satu dari: {', '.join(FILE_TYPES)}."}
+                )
+            attrs["file_type"] = extension
+        return attrs
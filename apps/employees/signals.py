@@ -0,0 +1,36 @@
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .hierarchy import add_employee, check_manager, detach_subordinates, move_employee
+from .models import Employee
+
+
+@receiver(pre_save, sender=Employee, dispatch_uid="employee_manager_pre_save")
+def remember_old_manager(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and "manager" not in update_fields):
+        instance._old_manager_id = instance.manager_id
+        return
+
+    instance._old_manager_id = None
+    if instance.pk:
+        instance._old_manager_id = (
+            Employee.objects.filter(pk=instance.pk).values_list("manager_id", flat=True).first()
+        )
+        if instance.manager_id != instance._old_manager_id:
+            check_manager(instance.pk, instance.manager_id)
+
+
+@receiver(post_save, sender=Employee, dispatch_uid="employee_hierarchy_post_save")
+def sync_hierarchy(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        add_employee(instance)
+    elif instance.manager_id != getattr(instance, "_old_manager_id", instance.manager_id):
+        move_employee(instance.pk, instance.manager_id)
+
+
+@receiver(pre_delete, sender=Employee, dispatch_uid="employee_hierarchy_pre_delete")
+def detach_hierarchy(sender, instance, **kwargs):
+    detach_subordinates(instance.pk)
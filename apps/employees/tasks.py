@@ -0,0 +1,8 @@
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def import_employees_job(job_id):
+    from .imports import run_import_job
+
+    run_import_job(job_id)
@@ -1,3 +1,313 @@
 from django.test import TestCase
 
 # Create your tests here.
+import io
+import shutil
+import tempfile
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Role, User
+from .hierarchy import closure_rows, rebuild_hierarchy, subordinate_ids
+from .imports import ImportFileError, create_import_job, import_employees, run_import_job
+from .models import Department, Employee, EmployeeHierarchy, EmployeeImportJob, EmployeeNumberSequence
+from .utils import allocate_employee_numbers
+
+HEADER = "email,full_name,password,department,manager\n"
+
+
+def csv_file(*rows):
+    return io.BytesIO((HEADER + "".join(f"{row}\n" for row in rows)).encode())
+
+
+class EmployeeImportTest(TestCase):
+    """
+    Import massal: semua baris divalidasi dulu, ada error -> tidak ada
+    yang disimpan.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name="Engineering", code="ENG")
+        cls.role = Role.objects.create(name="Employee")
+
+        user = User.objects.create_user(email="mgr@example.com", password="secret", full_name="Manager")
+        cls.manager = Employee.objects.create(user=user, employee_number="20260001")
+
+    def test_row_errors_abort_whole_import(self):
+        result = import_employees(csv_file(
+            "new@example.com,New,secret123,ENG,20260001",
+            "not-an-email,Bad,secret123,,",
+            "mgr@example.com,Taken,secret123,,",
+            "dup@example.com,Dup 1,secret123,XXX,",
+            "DUP@example.com,Dup 2,secret123,,99999999",
+        ))
+
+        self.assertEqual(result["total"], 5)
+        self.assertEqual(result["created"], 0)
+        self.assertEqual(
+            {item["row"]: sorted(item["errors"]) for item in result["errors"]},
+            {
+                3: ["email"],
+                4: ["email"],
+                5: ["department"],
+                6: ["email", "manager"],
+            },
+        )
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+
+    def test_valid_rows_are_written(self):
+        result = import_employees(csv_file(
+            "one@example.com,One,secret123,ENG,20260001",
+            "two@example.com,Two,,,",
+        ))
+
+        self.assertEqual(result["errors"], [])
+        self.assertEqual(result["created"], 2)
+
+        one = Employee.objects.select_related("user").get(user__email="one@example.com")
+        self.assertEqual(one.department, self.department)
+        self.assertEqual(one.manager, self.manager)
+        self.assertEqual(one.user.employee_id, one.employee_number)
+        self.assertTrue(one.user.check_password("secret123"))
+        self.assertTrue(one.user.user_roles.filter(role=self.role).exists())
+
+        # closure hierarchy ikut terisi walau lewat bulk_create
+        self.assertIn(one.id, {row["descendant_id"] for row in subordinate_ids(self.manager.id)})
+
+        two = User.objects.get(email="two@example.com")
+        self.assertFalse(two.has_usable_password())
+
+    def test_dry_run_writes_nothing(self):
+        result = import_employees(csv_file("one@example.com,One,secret123,,"), dry_run=True)
+
+        self.assertEqual((result["total"], result["created"]), (1, 0))
+        self.assertFalse(User.objects.filter(email="one@example.com").exists())
+
+    @override_settings(EMPLOYEE_IMPORT_MAX_ROWS=2)
+    def test_row_cap_counts_each_row_once(self):
+        # baris error tidak dihitung dua kali
+        result = import_employees(csv_file("not-an-email,Bad,,,", "two@example.com,Two,,,"))
+        self.assertEqual(result["total"], 2)
+
+        with self.assertRaises(ImportFileError):
+            import_employees(csv_file("a@example.com,A,,,", "b@example.com,B,,,", "c@example.com,C,,,"))
+
+
+class EmployeeImportJobTest(TestCase):
+    """
+    Upload import -> job background (202), diproses run_import_job.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user(
+            email="hr@example.com",
+            password="secret",
+            full_name="HR",
+            is_staff=True,
+        )
+        cls.user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = APIClient()
+
+    def upload(self, *rows, name="employees.csv"):
+        content = (HEADER + "".join(f"{row}\n" for row in rows)).encode()
+        return SimpleUploadedFile(name, content)
+
+    def test_upload_returns_202_and_job_runs(self):
+        self.client.force_authenticate(self.hr)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                "/api/employee-imports/",
+                {"file": self.upload("one@example.com,One,secret123,,")},
+                format="multipart",
+            )
+
+        self.assertEqual(response.status_code, 202, response.data)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(User.objects.filter(email="one@example.com").exists())
+
+        run_import_job(response.data["id"])
+
+        job = EmployeeImportJob.objects.get(id=response.data["id"])
+        self.assertEqual((job.status, job.total_rows, job.created_count), ("done", 1, 1))
+        self.assertTrue(Employee.objects.filter(user__email="one@example.com").exists())
+
+    def test_row_errors_fail_job(self):
+        job = create_import_job(self.hr, self.upload("not-an-email,Bad,,,"), "csv")
+        run_import_job(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.errors, [{"row": 2, "errors": {"email": "Email tidak valid."}}])
+
+    def test_job_is_claimed_once(self):
+        job = create_import_job(self.hr, self.upload("one@example.com,One,,,"), "csv")
+        run_import_job(job.id)
+        run_import_job(job.id)
+
+        self.assertEqual(User.objects.filter(email="one@example.com").count(), 1)
+
+    def test_file_type_from_extension(self):
+        self.client.force_authenticate(self.hr)
+
+        response = self.client.post(
+            "/api/employee-imports/",
+            {"file": self.upload("one@example.com,One,,,", name="employees.txt")},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file_type", response.data)
+
+    def test_requires_create_permission(self):
+        self.client.force_authenticate(self.user)
+
+        response = self.client.post(
+            "/api/employee-imports/",
+            {"file": self.upload("one@example.com,One,,,")},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(EmployeeImportJob.objects.exists())
+
+
+class EmployeeHierarchyTest(TestCase):
+    """
+    Closure table EmployeeHierarchy dijaga signal Employee: pindah subtree,
+    tolak siklus, hapus employee.
+
+        ceo
+        ├── a
+        │   └── a1
+        │       └── a1x
+        └── b
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        def employee(name, manager=None):
+            user = User.objects.create_user(email=f"{name}@example.com", password="secret", full_name=name)
+            return Employee.objects.create(user=user, employee_number=name, manager=manager)
+
+        cls.ceo = employee("ceo")
+        cls.a = employee("a", cls.ceo)
+        cls.a1 = employee("a1", cls.a)
+        cls.a1x = employee("a1x", cls.a1)
+        cls.b = employee("b", cls.ceo)
+
+    def closure(self):
+        return set(EmployeeHierarchy.objects.values_list("ancestor_id", "descendant_id", "depth"))
+
+    def expected_closure(self):
+        return set(closure_rows(dict(Employee.objects.values_list("id", "manager_id"))))
+
+    def ancestors(self, employee):
+        return dict(
+            EmployeeHierarchy.objects.filter(descendant=employee, depth__gte=1)
+            .values_list("ancestor__employee_number", "depth")
+        )
+
+    def test_create_builds_chain(self):
+        self.assertEqual(self.ancestors(self.a1x), {"a1": 1, "a": 2, "ceo": 3})
+        self.assertEqual(self.closure(), self.expected_closure())
+
+    def test_move_subtree(self):
+        self.a.manager = self.b
+        self.a.save()
+
+        self.assertEqual(self.ancestors(self.a), {"b": 1, "ceo": 2})
+        self.assertEqual(self.ancestors(self.a1x), {"a1": 1, "a": 2, "b": 3, "ceo": 4})
+        self.assertEqual(
+            {row["descendant_id"] for row in subordinate_ids(self.b.id)},
+            {self.a.id, self.a1.id, self.a1x.id},
+        )
+        self.assertEqual(self.closure(), self.expected_closure())
+
+        # jadi root
+        self.a1.manager = None
+        self.a1.save()
+        self.assertEqual(self.ancestors(self.a1x), {"a1": 1})
+        self.assertEqual(self.closure(), self.expected_closure())
+
+    def test_cycle_is_rejected(self):
+        for employee, manager in ((self.a, self.a), (self.a, self.a1x), (self.ceo, self.b)):
+            with self.subTest(employee=employee.employee_number, manager=manager.employee_number):
+                employee.refresh_from_db()
+                employee.manager = manager
+                with self.assertRaises(ValidationError):
+                    employee.save()
+
+        self.assertEqual(self.closure(), self.expected_closure())
+
+    def test_delete_detaches_subordinates(self):
+        self.a1.delete()
+
+        self.a1x.refresh_from_db()
+        self.assertIsNone(self.a1x.manager_id)
+        self.assertEqual(self.ancestors(self.a1x), {})
+        self.assertEqual(self.closure(), self.expected_closure())
+
+    def test_rebuild_matches_incremental(self):
+        self.a.manager = self.b
+        self.a.save()
+        incremental = self.closure()
+
+        rebuild_hierarchy()
+        self.assertEqual(self.closure(), incremental)
+
+
+class EmployeeNumberAllocationTest(TestCase):
+    """
+    Nomor pegawai YYYYNNNN dialokasikan per blok dari EmployeeNumberSequence.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="old@example.com", password="secret", full_name="Old")
+        Employee.objects.create(user=user, employee_number="20260007")
+
+        user = User.objects.create_user(email="prev@example.com", password="secret", full_name="Prev")
+        Employee.objects.create(user=user, employee_number="20250042")
+
+    def test_missing_sequence_is_seeded_from_employees(self):
+        self.assertFalse(EmployeeNumberSequence.objects.filter(year=2026).exists())
+
+        self.assertEqual(allocate_employee_numbers(3, year=2026), ["20260008", "20260009", "20260010"])
+        self.assertEqual(EmployeeNumberSequence.objects.get(year=2026).last_number, 10)
+
+        # tahun tanpa pegawai mulai dari 0001
+        self.assertEqual(allocate_employee_numbers(2, year=2027), ["20270001", "20270002"])
+
+    def test_blocks_are_contiguous_and_unique(self):
+        first = allocate_employee_numbers(5, year=2026)
+        second = allocate_employee_numbers(3, year=2026)
+        numbers = first + second
+
+        self.assertEqual(len(set(numbers)), 8)
+        self.assertEqual([int(number) for number in numbers], list(range(20260008, 20260016)))
+        for number in numbers:
+            self.assertRegex(number, r"^2026\d{4}$")
+
+        self.assertEqual(allocate_employee_numbers(0, year=2026), [])
+        self.assertEqual(EmployeeNumberSequence.objects.get(year=2026).last_number, 15)
+
+    def test_number_past_9999_keeps_growing(self):
+        EmployeeNumberSequence.objects.create(year=2026, last_number=9999)
+
+        self.assertEqual(allocate_employee_numbers(1, year=2026), ["202610000"])
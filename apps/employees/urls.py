@@ -7,12 +7,14 @@ from .views import (
     GradeViewSet,
     EmploymentStatusViewSet,
     EmployeeViewSet,
+    EmployeeImportJobViewSet,
 )
 
 
 router = DefaultRouter()
 
 router.register(r"employee", EmployeeViewSet, basename="employee")
+router.register(r"employee-imports", EmployeeImportJobViewSet, basename="employee-imports")
 router.register(r"departments", DepartmentViewSet, basename="departments")
 router.register(r"positions", PositionViewSet, basename="positions")
 router.register(r"grades", GradeViewSet, basename="grades")
@@ -1,31 +1,67 @@
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.utils import timezone
 
-from .models import Employee
+from .models import Employee, EmployeeNumberSequence
 
 
-def generate_employee_number():
-    """
-    Format: YYYYNNNN
-    Contoh: 20260001
+def format_employee_number(year, number):
+    return f"{year}{number:04d}"
+
 
-    Aman dari race condition dengan select_for_update.
+def current_max_number(year):
+    """
+    Nomor terbesar yang sudah dipakai di tahun tersebut (seed counter).
+    Dibandingkan sebagai angka: 2026#10000 > 20269999.
     """
-    year = timezone.now().year
     prefix = str(year)
+    numbers = Employee.objects.filter(employee_number__startswith=prefix).values_list(
+        "employee_number", flat=True
+    )
+    suffixes = [int(number[len(prefix):]) for number in numbers if number[len(prefix):].isdigit()]
+    return max(suffixes, default=0)
+
+
+def ensure_sequence(year):
+    if EmployeeNumberSequence.objects.filter(year=year).exists():
+        return
+
+    try:
+        with transaction.atomic():
+            EmployeeNumberSequence.objects.create(year=year, last_number=current_max_number(year))
+    except IntegrityError:
+        # counter tahun ini dibuat proses lain bersamaan
+        pass
+
+
+def allocate_employee_numbers(count, year=None):
+    """
+    Ambil `count` nomor pegawai berurutan sekaligus (mis. import massal).
+
+    1 UPDATE last_number = last_number + count pada row counter tahun
+    tersebut; tidak ada lock ke tabel employees. Di dalam transaksi luar,
+    nomor ikut di-rollback bila transaksi gagal.
+    """
+    if count < 1:
+        return []
+
+    year = year or timezone.now().year
+    ensure_sequence(year)
 
     with transaction.atomic():
-        last_employee = (
-            Employee.objects.select_for_update()
-            .filter(employee_number__startswith=prefix)
-            .order_by("-employee_number")
-            .first()
+        EmployeeNumberSequence.objects.filter(year=year).update(
+            last_number=F("last_number") + count,
+            updated_at=timezone.now(),
         )
+        last_number = EmployeeNumberSequence.objects.values_list("last_number", flat=True).get(year=year)
 
-        if not last_employee or not last_employee.employee_number:
-            return f"{prefix}0001"
+    first_number = last_number - count + 1
+    return [format_employee_number(year, number) for number in range(first_number, last_number + 1)]
 
-        last_number = int(last_employee.employee_number[-4:])
-        next_number = last_number + 1
 
-        return f"{prefix}{next_number:04d}"
+def generate_employee_number():
+    """
+    Format: YYYYNNNN
+    Contoh: 20260001
+    """
+    return allocate_employee_numbers(1)[0]
@@ -3,16 +3,21 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import viewsets, status
+from rest_framework import mixins
+from rest_framework.parsers import MultiPartParser
 
-from apps.accounts.models import User
+from apps.accounts.models import User, user_has_permission
 from apps.accounts.permissions import HasPermission
+from apps.core.pagination import HybridPagination
 
+from .imports import create_import_job
 from .models import (
     Department,
     Position,
     Grade,
     EmploymentStatus,
     Employee,
+    EmployeeImportJob,
 )
 
 from .serializers import (
@@ -24,6 +29,8 @@ from .serializers import (
     EmployeeDetailSerializer,
     EmployeeCreateSerializer,
     EmployeeUpdateSerializer,
+    EmployeeImportJobSerializer,
+    EmployeeImportJobCreateSerializer,
 )
 
 
@@ -59,6 +66,8 @@ class EmploymentStatusViewSet(viewsets.ModelViewSet):
 # ============================================================
 class EmployeeViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
+    pagination_class = HybridPagination
+    cursor_ordering = ("-created_at", "-id")
     queryset = Employee.objects.select_related(
         "user",
         "department",
@@ -92,3 +101,48 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             EmployeeDetailSerializer(employee).data,
             status=status.HTTP_201_CREATED,
         )
+
+
+# ============================================================
+# IMPORT EMPLOYEE MASSAL (background job)
+# ============================================================
+class EmployeeImportJobViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    POST /employee-imports/      -> upload CSV / XLSX (field "file", opsional
+                                    file_type, dry_run), 202, dikerjakan di background
+    GET  /employee-imports/      -> daftar job
+    GET  /employee-imports/{id}/ -> status, jumlah dibuat & error per baris
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+    queryset = EmployeeImportJob.objects.select_related("requested_by").all()
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return EmployeeImportJobCreateSerializer
+        return EmployeeImportJobSerializer
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        user = self.request.user
+
+        if user.is_staff or user_has_permission(user, "employees.create"):
+            return qs
+        return qs.filter(requested_by=user)
+
+    def create(self, request, *args, **kwargs):
+        user = request.user
+        if not (user_has_permission(user, "employees.create") or user.is_staff):
+            return Response({"detail": "Tidak punya akses import employee."}, status=403)
+
+        serializer = EmployeeImportJobCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        job = create_import_job(user, **serializer.validated_data)
+
+        return Response(EmployeeImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
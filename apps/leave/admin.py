@@ -1,19 +1,34 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
 # Register your models here.
-from django.utils import timezone
-
-from .models import LeaveType, LeaveRequest
+from . import services
+from .models import LeaveBalance, LeaveType, LeaveRequest
+from .services import LeaveError
 
 
 @admin.register(LeaveType)
 class LeaveTypeAdmin(admin.ModelAdmin):
-    list_display = ("id", "code", "name", "is_active", "created_at", "updated_at")
+    list_display = (
+        "id",
+        "code",
+        "name",
+        "quota_period",
+        "quota_days",
+        "quota_requests",
+        "max_consecutive_days",
+        "is_active",
+        "updated_at",
+    )
     list_filter = ("is_active",)
     search_fields = ("code", "name")
     ordering = ("name",)
     readonly_fields = ("created_at", "updated_at")
 
+    def save_model(self, request, obj, form, change):
+        old_period = form.initial.get("quota_period") if change else None
+        super().save_model(request, obj, form, change)
+        services.quota_period_changed(obj, old_period)
+
 
 @admin.register(LeaveRequest)
 class LeaveRequestAdmin(admin.ModelAdmin):
@@ -51,8 +66,10 @@ class LeaveRequestAdmin(admin.ModelAdmin):
 
     ordering = ("-created_at",)
 
+    # status diubah lewat action approve / reject (services.py) supaya ledger konsisten
     readonly_fields = (
         "total_days",
+        "status",
         "approved_at",
         "rejected_at",
         "created_at",
@@ -87,31 +104,45 @@ class LeaveRequestAdmin(admin.ModelAdmin):
             return obj.approved_by.user.full_name
         return "-"
 
+    # =========================
+    # Sinkron ledger LeaveBalance
+    # =========================
+    def save_model(self, request, obj, form, change):
+        employee_ids = {obj.employee_id}
+        if change:
+            employee_ids.add(form.initial.get("employee"))
+
+        super().save_model(request, obj, form, change)
+        services.rebuild_balances(employee_ids=[pk for pk in employee_ids if pk])
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        services.rebuild_balances(employee_ids=[obj.employee_id])
+
+    def delete_queryset(self, request, queryset):
+        employee_ids = set(queryset.values_list("employee_id", flat=True))
+        super().delete_queryset(request, queryset)
+        services.rebuild_balances(employee_ids=list(employee_ids))
+
     # =========================
     # Admin actions
     # =========================
     @admin.action(description="Approve selected leave requests")
     def approve_selected(self, request, queryset):
         """
-        Approve massal (yang masih pending).
+        Approve massal (yang masih pending), lewat services supaya
+        LeaveBalance ikut ter-update & kuota dicek.
         approved_by = employee dari admin yang login (jika punya profile employee).
         """
         approver_employee = getattr(request.user, "employee_profile", None)
 
         updated = 0
-        for leave in queryset:
-            if leave.status != "pending":
+        for leave_id in queryset.filter(status="pending").values_list("id", flat=True):
+            try:
+                services.approve_leave(leave_id, approver_employee)
+            except LeaveError as exc:
+                self.message_user(request, f"Leave #{leave_id}: {exc}", level=messages.WARNING)
                 continue
-
-            leave.status = "approved"
-            leave.approved_at = timezone.now()
-            leave.rejected_at = None
-            leave.rejection_reason = None
-
-            if approver_employee:
-                leave.approved_by = approver_employee
-
-            leave.save()
             updated += 1
 
         self.message_user(request, f"{updated} leave request berhasil di-approve.")
@@ -124,18 +155,35 @@ class LeaveRequestAdmin(admin.ModelAdmin):
         rejector_employee = getattr(request.user, "employee_profile", None)
 
         updated = 0
-        for leave in queryset:
-            if leave.status != "pending":
+        for leave_id in queryset.filter(status="pending").values_list("id", flat=True):
+            try:
+                services.reject_leave(leave_id, rejector_employee, None)
+            except LeaveError:
                 continue
-
-            leave.status = "rejected"
-            leave.rejected_at = timezone.now()
-            leave.approved_at = None
-
-            if rejector_employee:
-                leave.rejected_by = rejector_employee
-
-            leave.save()
             updated += 1
 
         self.message_user(request, f"{updated} leave request berhasil di-reject.")
+
+
+@admin.register(LeaveBalance)
+class LeaveBalanceAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "employee",
+        "leave_type",
+        "period_year",
+        "period_month",
+        "used_days",
+        "used_requests",
+        "pending_days",
+        "pending_requests",
+        "updated_at",
+    )
+    list_filter = ("leave_type", "period_year", "period_month")
+    search_fields = ("employee__employee_number", "employee__user__full_name")
+    list_select_related = ("employee", "leave_type")
+    # ledger diubah lewat services.py / command rebuild_leave_balances
+    readonly_fields = [field.name for field in LeaveBalance._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from apps.employees.models import Employee
+from apps.leave.services import rebuild_balances
+
+
+class Command(BaseCommand):
+    help = "Rebuild ledger LeaveBalance dari data LeaveRequest"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--employee",
+            dest="employee_numbers",
+            action="append",
+            help="Batasi ke employee_number tertentu (boleh diulang)",
+        )
+
+    def handle(self, *args, **options):
+        employee_ids = None
+        if options["employee_numbers"]:
+            employee_ids = list(
+                Employee.objects.filter(
+                    employee_number__in=options["employee_numbers"]
+                ).values_list("id", flat=True)
+            )
+
+        self.stdout.write(self.style.WARNING("🚀 Rebuild leave balance..."))
+        written = rebuild_balances(employee_ids=employee_ids)
+        self.stdout.write(self.style.SUCCESS(f"🎉 Rebuild selesai, {written} row balance ditulis."))
@@ -6,19 +6,23 @@ class Command(BaseCommand):
     help = "Seed default leave types"
 
     def handle(self, *args, **options):
+        # code, name, description, aturan kuota
         data = [
-            ("ANNUAL", "Annual Leave", "Cuti tahunan (maks 3 hari beruntun, 12 hari per tahun)"),
-            ("SICK", "Sick Leave", "Cuti sakit (tidak terbatas)"),
-            ("HALF_DAY", "Half Day", "Izin setengah hari (maks 4 kali per bulan)"),
+            ("ANNUAL", "Annual Leave", "Cuti tahunan (maks 3 hari beruntun, 12 hari per tahun)",
+             {"quota_period": "year", "quota_days": 12, "max_consecutive_days": 3}),
+            ("SICK", "Sick Leave", "Cuti sakit (tidak terbatas)", {}),
+            ("HALF_DAY", "Half Day", "Izin setengah hari (maks 4 kali per bulan)",
+             {"quota_period": "month", "quota_requests": 4, "max_consecutive_days": 1}),
         ]
 
-        for code, name, desc in data:
+        for code, name, desc, quota in data:
             created = LeaveType.objects.get_or_create(
                 code=code,
                 defaults={
                     "name": name,
                     "description": desc,
                     "is_active": True,
+                    **quota,
                 },
             )
 
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0002_alter_employee_employee_number"),
+        ("leave", "0002_leaverequest_return_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="leaverequest",
+            index=models.Index(
+                fields=["employee", "status", "start_date"],
+                name="leave_emp_status_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="leaverequest",
+            index=models.Index(
+                fields=["status", "created_at"], name="leave_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,138 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+# aturan yang sebelumnya hard-coded di LeaveRequestCreateSerializer
+DEFAULT_QUOTAS = {
+    "ANNUAL": {"quota_period": "year", "quota_days": 12, "max_consecutive_days": 3},
+    "HALF_DAY": {"quota_period": "month", "quota_requests": 4, "max_consecutive_days": 1},
+}
+
+
+def set_default_quotas(apps, schema_editor):
+    LeaveType = apps.get_model("leave", "LeaveType")
+
+    for code, quota in DEFAULT_QUOTAS.items():
+        LeaveType.objects.filter(code=code).update(**quota)
+
+
+def backfill_balances(apps, schema_editor):
+    LeaveType = apps.get_model("leave", "LeaveType")
+    LeaveRequest = apps.get_model("leave", "LeaveRequest")
+    LeaveBalance = apps.get_model("leave", "LeaveBalance")
+
+    balances = []
+    for leave_type in LeaveType.objects.all():
+        period = ["employee_id", "start_date__year"]
+        if leave_type.quota_period == "month":
+            period.append("start_date__month")
+
+        rows = (
+            LeaveRequest.objects.filter(leave_type=leave_type, status__in=["pending", "approved"])
+            .order_by()
+            .values(*period)
+            .annotate(
+                used_days=Sum("total_days", filter=Q(status="approved")),
+                used_requests=Count("id", filter=Q(status="approved")),
+                pending_days=Sum("total_days", filter=Q(status="pending")),
+                pending_requests=Count("id", filter=Q(status="pending")),
+            )
+        )
+        balances.extend(
+            LeaveBalance(
+                employee_id=row["employee_id"],
+                leave_type=leave_type,
+                period_year=row["start_date__year"],
+                period_month=row.get("start_date__month", 0),
+                used_days=row["used_days"] or 0,
+                used_requests=row["used_requests"],
+                pending_days=row["pending_days"] or 0,
+                pending_requests=row["pending_requests"],
+            )
+            for row in rows
+        )
+
+    LeaveBalance.objects.bulk_create(balances, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0002_alter_employee_employee_number"),
+        ("leave", "0003_leaverequest_leave_emp_status_start_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="leavetype",
+            name="max_consecutive_days",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="leavetype",
+            name="quota_days",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="leavetype",
+            name="quota_period",
+            field=models.CharField(
+                choices=[("year", "Per Tahun"), ("month", "Per Bulan")],
+                default="year",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="leavetype",
+            name="quota_requests",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="LeaveBalance",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("period_year", models.PositiveSmallIntegerField()),
+                ("period_month", models.PositiveSmallIntegerField(default=0)),
+                ("used_days", models.PositiveIntegerField(default=0)),
+                ("used_requests", models.PositiveIntegerField(default=0)),
+                ("pending_days", models.PositiveIntegerField(default=0)),
+                ("pending_requests", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leave_balances",
+                        to="employees.employee",
+                    ),
+                ),
+                (
+                    "leave_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balances",
+                        to="leave.leavetype",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "leave_balances",
+                "ordering": ["-period_year", "-period_month"],
+                "unique_together": {
+                    ("employee", "leave_type", "period_year", "period_month")
+                },
+            },
+        ),
+        migrations.RunPython(set_default_quotas, migrations.RunPython.noop),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
@@ -8,13 +8,24 @@ from apps.employees.models import Employee
 
 class LeaveType(models.Model):
     """
-    Master jenis leave.
+    Master jenis leave + aturan kuota.
+    Kosongkan quota_days / quota_requests / max_consecutive_days = tidak dibatasi.
     """
+    QUOTA_PERIOD_CHOICES = [
+        ("year", "Per Tahun"),
+        ("month", "Per Bulan"),
+    ]
+
     code = models.CharField(max_length=50, unique=True)
     name = models.CharField(max_length=100)
     description = models.TextField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
 
+    quota_period = models.CharField(max_length=10, choices=QUOTA_PERIOD_CHOICES, default="year")
+    quota_days = models.PositiveIntegerField(null=True, blank=True)  # maks hari approved per periode
+    quota_requests = models.PositiveIntegerField(null=True, blank=True)  # maks request approved per periode
+    max_consecutive_days = models.PositiveIntegerField(null=True, blank=True)  # maks hari per request
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -70,6 +81,44 @@ class LeaveRequest(models.Model):
     class Meta:
         db_table = "leave_requests"
         ordering = ["-created_at"]
+        indexes = [
+            # listing leave milik employee per status & periode
+            models.Index(
+                fields=["employee", "status", "start_date"],
+                name="leave_emp_status_start_idx",
+            ),
+            # inbox approval HR (status=pending, urut created_at)
+            models.Index(fields=["status", "created_at"], name="leave_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.employee.employee_number} {self.leave_type.code} {self.start_date}"
+
+
+class LeaveBalance(models.Model):
+    """
+    Ledger pemakaian leave per employee x leave type x periode.
+    period_month = 0 untuk leave type dengan kuota tahunan.
+    Di-update (dengan select_for_update) oleh services.py setiap
+    status LeaveRequest berubah.
+    """
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="leave_balances")
+    leave_type = models.ForeignKey(LeaveType, on_delete=models.CASCADE, related_name="balances")
+
+    period_year = models.PositiveSmallIntegerField()
+    period_month = models.PositiveSmallIntegerField(default=0)
+
+    used_days = models.PositiveIntegerField(default=0)
+    used_requests = models.PositiveIntegerField(default=0)
+    pending_days = models.PositiveIntegerField(default=0)
+    pending_requests = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "leave_balances"
+        unique_together = ("employee", "leave_type", "period_year", "period_month")
+        ordering = ["-period_year", "-period_month"]
+
+    def __str__(self):
+        return f"{self.employee.employee_number} {self.leave_type.code} {self.period_year}/{self.period_month}"
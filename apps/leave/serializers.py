@@ -1,11 +1,11 @@
-from django.db.models import Sum
 from django.utils import timezone
 from rest_framework import serializers
 from django.db import transaction
 
 from apps.employees.models import Employee
-from .models import LeaveType, LeaveRequest
-from .utils import count_days_inclusive
+from .models import LeaveBalance, LeaveType, LeaveRequest
+from .services import LeaveError, check_consecutive, check_quota, get_balance, record_new_request
+from .utils import count_leave_days
 
 
 class LeaveTypeSerializer(serializers.ModelSerializer):
@@ -14,6 +14,45 @@ class LeaveTypeSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class LeaveBalanceSerializer(serializers.ModelSerializer):
+    leave_type_code = serializers.CharField(source="leave_type.code", read_only=True)
+    leave_type_name = serializers.CharField(source="leave_type.name", read_only=True)
+    quota_period = serializers.CharField(source="leave_type.quota_period", read_only=True)
+    quota_days = serializers.IntegerField(source="leave_type.quota_days", read_only=True)
+    quota_requests = serializers.IntegerField(source="leave_type.quota_requests", read_only=True)
+    remaining_days = serializers.SerializerMethodField()
+    remaining_requests = serializers.SerializerMethodField()
+
+    class Meta:
+        model = LeaveBalance
+        fields = [
+            "leave_type",
+            "leave_type_code",
+            "leave_type_name",
+            "quota_period",
+            "period_year",
+            "period_month",
+            "quota_days",
+            "used_days",
+            "pending_days",
+            "remaining_days",
+            "quota_requests",
+            "used_requests",
+            "pending_requests",
+            "remaining_requests",
+        ]
+
+    def get_remaining_days(self, obj):
+        if obj.leave_type.quota_days is None:
+            return None
+        return max(0, obj.leave_type.quota_days - obj.used_days)
+
+    def get_remaining_requests(self, obj):
+        if obj.leave_type.quota_requests is None:
+            return None
+        return max(0, obj.leave_type.quota_requests - obj.used_requests)
+
+
 class LeaveRequestSerializer(serializers.ModelSerializer):
     leave_type_name = serializers.CharField(source="leave_type.name", read_only=True)
     employee_number = serializers.CharField(source="employee.employee_number", read_only=True)
@@ -84,57 +123,18 @@ class LeaveRequestCreateSerializer(serializers.Serializer):
         if return_date <= end_date:
             raise serializers.ValidationError("return_date tidak boleh lebih kecil dari end_date.")
 
-        total_days = count_days_inclusive(start_date, end_date)
+        total_days = count_leave_days(start_date, end_date)
+        if total_days == 0:
+            raise serializers.ValidationError("Tidak ada hari kerja di rentang tanggal tersebut.")
 
         # =========================
-        # RULE 1: max 3 days in a row (Annual leave only)
+        # RULE kuota (konfigurasi di LeaveType, baca 1 row LeaveBalance)
         # =========================
-        if leave_type.code == "ANNUAL" and total_days > 3:
-            raise serializers.ValidationError("Cuti tahunan maksimal 3 hari berturut-turut.")
-
-        # =========================
-        # RULE 2: annual leave max 12 days per year
-        # =========================
-        if leave_type.code == "ANNUAL":
-            year = start_date.year
-
-            used = (
-                LeaveRequest.objects.filter(
-                    employee=employee,
-                    leave_type__code="ANNUAL",
-                    status="approved",
-                    start_date__year=year,
-                )
-                .aggregate(total=Sum("total_days"))
-                .get("total")
-                or 0
-            )
-
-            if used + total_days > 12:
-                raise serializers.ValidationError(
-                    f"Jatah cuti tahunan tidak cukup. Sudah terpakai {used} hari, sisa {max(0, 12-used)} hari."
-                )
-
-        # =========================
-        # RULE 3: half_day max 4 times per month
-        # =========================
-        if leave_type.code == "HALF_DAY":
-            if total_days != 1:
-                raise serializers.ValidationError("Half day hanya boleh 1 hari.")
-
-            month = start_date.month
-            year = start_date.year
-
-            used_half = LeaveRequest.objects.filter(
-                employee=employee,
-                leave_type__code="HALF_DAY",
-                status="approved",
-                start_date__year=year,
-                start_date__month=month,
-            ).count()
-
-            if used_half >= 4:
-                raise serializers.ValidationError("Half day maksimal 4 kali dalam 1 bulan.")
+        try:
+            check_consecutive(leave_type, total_days)
+            check_quota(leave_type, get_balance(employee, leave_type, start_date), total_days)
+        except LeaveError as exc:
+            raise serializers.ValidationError(str(exc))
 
         attrs["employee"] = employee
         attrs["leave_type_obj"] = leave_type
@@ -156,5 +156,19 @@ class LeaveRequestCreateSerializer(serializers.Serializer):
             reason=validated_data.get("reason"),
             status="pending",
         )
+        record_new_request(leave_request)
 
         return leave_request
+
+
+class LeaveBulkActionSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500,
+    )
+    rejection_reason = serializers.CharField(required=False, allow_blank=False)
+
+    def validate_ids(self, value):
+        # buang duplikat, urutan dipertahankan
+        return list(dict.fromkeys(value))
@@ -0,0 +1,388 @@
+"""
+Ledger LeaveBalance + transisi status LeaveRequest.
+
+Setiap perubahan status dikerjakan di 1 transaksi:
+1. lock row LeaveRequest (select_for_update) & validasi status asal
+2. lock row LeaveBalance periode tersebut
+3. pindahkan hari/request dari bucket status lama ke status baru
+4. simpan LeaveRequest
+
+Validasi kuota cukup membaca 1 row LeaveBalance, tanpa SUM / COUNT
+ke seluruh LeaveRequest.
+"""
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from .models import LeaveBalance, LeaveRequest
+
+# status -> (field hari, field jumlah request) di LeaveBalance
+STATUS_BUCKETS = {
+    "pending": ("pending_days", "pending_requests"),
+    "approved": ("used_days", "used_requests"),
+}
+
+
+class LeaveError(Exception):
+    """
+    Transisi / kuota leave tidak valid. Pesan ditampilkan ke user.
+    """
+
+
+def balance_period(leave_type, day):
+    if leave_type.quota_period == "month":
+        return day.year, day.month
+    return day.year, 0
+
+
+def get_balance(employee, leave_type, day):
+    """
+    Balance periode (tanpa lock). None jika belum ada pemakaian.
+    """
+    year, month = balance_period(leave_type, day)
+    return LeaveBalance.objects.filter(
+        employee=employee,
+        leave_type=leave_type,
+        period_year=year,
+        period_month=month,
+    ).first()
+
+
+def lock_balance(employee_id, leave_type, day):
+    year, month = balance_period(leave_type, day)
+    lookup = {
+        "employee_id": employee_id,
+        "leave_type": leave_type,
+        "period_year": year,
+        "period_month": month,
+    }
+
+    LeaveBalance.objects.get_or_create(**lookup)
+    return LeaveBalance.objects.select_for_update().get(**lookup)
+
+
+def check_consecutive(leave_type, total_days):
+    limit = leave_type.max_consecutive_days
+    if limit and total_days > limit:
+        raise LeaveError(f"{leave_type.name} maksimal {limit} hari berturut-turut.")
+
+
+def check_quota(leave_type, balance, total_days):
+    """
+    Kuota dihitung dari leave yang sudah approved (used_*).
+    """
+    used_days = balance.used_days if balance else 0
+    used_requests = balance.used_requests if balance else 0
+    period = "bulan" if leave_type.quota_period == "month" else "tahun"
+
+    if leave_type.quota_days is not None and used_days + total_days > leave_type.quota_days:
+        remaining = max(0, leave_type.quota_days - used_days)
+        raise LeaveError(
+            f"Jatah {leave_type.name} tidak cukup. Sudah terpakai {used_days} hari, sisa {remaining} hari."
+        )
+
+    if leave_type.quota_requests is not None and used_requests >= leave_type.quota_requests:
+        raise LeaveError(
+            f"{leave_type.name} maksimal {leave_type.quota_requests} kali dalam 1 {period}."
+        )
+
+
+def move(balance, leave, status, sign):
+    bucket = STATUS_BUCKETS.get(status)
+    if not bucket:
+        return
+
+    days_field, requests_field = bucket
+    setattr(balance, days_field, max(0, getattr(balance, days_field) + sign * leave.total_days))
+    setattr(balance, requests_field, max(0, getattr(balance, requests_field) + sign))
+
+
+def record_new_request(leave):
+    """
+    LeaveRequest baru (pending) -> tambah bucket pending.
+    Dipanggil di dalam transaksi pembuatan request.
+    """
+    balance = lock_balance(leave.employee_id, leave.leave_type, leave.start_date)
+    move(balance, leave, leave.status, +1)
+    balance.save()
+
+
+def release(leave):
+    """
+    Keluarkan kontribusi leave dari ledger (dipakai sebelum delete / edit).
+    """
+    balance = lock_balance(leave.employee_id, leave.leave_type, leave.start_date)
+    move(balance, leave, leave.status, -1)
+    balance.save()
+
+
+def apply_transition(leave, new_status, **fields):
+    """
+    Transisi leave yang SUDAH di-lock (select_for_update) oleh pemanggil.
+    """
+    balance = lock_balance(leave.employee_id, leave.leave_type, leave.start_date)
+
+    if new_status == "approved":
+        check_quota(leave.leave_type, balance, leave.total_days)
+
+    move(balance, leave, leave.status, -1)
+    move(balance, leave, new_status, +1)
+    balance.save()
+
+    leave.status = new_status
+    for name, value in fields.items():
+        setattr(leave, name, value)
+    leave.save()
+    return leave
+
+
+def lock_leave(leave_id):
+    return (
+        LeaveRequest.objects.select_for_update(of=("self",))
+        .select_related("leave_type")
+        .get(id=leave_id)
+    )
+
+
+@transaction.atomic
+def approve_leave(leave_id, approver):
+    leave = lock_leave(leave_id)
+    if leave.status != "pending":
+        raise LeaveError("Leave sudah diproses.")
+
+    return apply_transition(
+        leave,
+        "approved",
+        approved_by=approver,
+        approved_at=timezone.now(),
+        rejected_at=None,
+        rejection_reason=None,
+    )
+
+
+@transaction.atomic
+def reject_leave(leave_id, rejector, rejection_reason):
+    leave = lock_leave(leave_id)
+    if leave.status != "pending":
+        raise LeaveError("Leave sudah diproses.")
+
+    return apply_transition(
+        leave,
+        "rejected",
+        rejected_by=rejector,
+        rejected_at=timezone.now(),
+        rejection_reason=rejection_reason,
+        approved_at=None,
+    )
+
+
+@transaction.atomic
+def cancel_leave(leave_id):
+    """
+    Pending -> cancelled kapan saja.
+    Approved -> cancelled hanya jika leave belum dimulai.
+    """
+    leave = lock_leave(leave_id)
+
+    if leave.status == "approved" and leave.start_date <= timezone.localdate():
+        raise LeaveError("Leave yang sudah berjalan tidak bisa dibatalkan.")
+    if leave.status not in ("pending", "approved"):
+        raise LeaveError("Leave sudah diproses.")
+
+    return apply_transition(leave, "cancelled")
+
+
+def lock_balances(leaves):
+    """
+    Lock semua LeaveBalance yang dipakai leaves dengan 1 SELECT ... FOR UPDATE.
+    Row yang belum ada dibuat dulu. Return dict key -> LeaveBalance,
+    key = (employee_id, leave_type_id, period_year, period_month).
+    """
+    keys = {
+        (leave.employee_id, leave.leave_type_id, *balance_period(leave.leave_type, leave.start_date))
+        for leave in leaves
+    }
+    if not keys:
+        return {}
+
+    LeaveBalance.objects.bulk_create(
+        [
+            LeaveBalance(
+                employee_id=employee_id,
+                leave_type_id=leave_type_id,
+                period_year=year,
+                period_month=month,
+            )
+            for employee_id, leave_type_id, year, month in keys
+        ],
+        ignore_conflicts=True,
+    )
+
+    # superset (employee x leave type x tahun), diurutkan id supaya urutan lock konsisten
+    rows = LeaveBalance.objects.select_for_update().filter(
+        employee_id__in={key[0] for key in keys},
+        leave_type_id__in={key[1] for key in keys},
+        period_year__in={key[2] for key in keys},
+    ).order_by("id")
+
+    balances = {}
+    for balance in rows:
+        key = (balance.employee_id, balance.leave_type_id, balance.period_year, balance.period_month)
+        if key in keys:
+            balances[key] = balance
+    return balances
+
+
+@transaction.atomic
+def bulk_transition(leave_ids, new_status, **fields):
+    """
+    Approve / reject banyak leave sekaligus.
+
+    - 1 SELECT ... FOR UPDATE untuk semua LeaveRequest, 1 untuk LeaveBalance
+    - leave yang tidak pending / melebihi kuota dilewati (dilaporkan per item)
+    - simpan dengan bulk_update
+
+    Return list {"id", "success", "detail"} sesuai urutan leave_ids.
+    """
+    leaves = {
+        leave.id: leave
+        for leave in LeaveRequest.objects.select_for_update(of=("self",))
+        .select_related("leave_type")
+        .filter(id__in=leave_ids)
+        .order_by("id")
+    }
+    pending = [leave for leave in leaves.values() if leave.status == "pending"]
+    balances = lock_balances(pending)
+
+    results = {}
+    changed = []
+
+    # urut tanggal mulai -> leave yang lebih awal didahulukan memakai kuota
+    for leave in sorted(pending, key=lambda item: (item.start_date, item.id)):
+        key = (leave.employee_id, leave.leave_type_id, *balance_period(leave.leave_type, leave.start_date))
+        balance = balances[key]
+
+        if new_status == "approved":
+            try:
+                check_quota(leave.leave_type, balance, leave.total_days)
+            except LeaveError as exc:
+                results[leave.id] = {"id": leave.id, "success": False, "detail": str(exc)}
+                continue
+
+        move(balance, leave, leave.status, -1)
+        move(balance, leave, new_status, +1)
+
+        leave.status = new_status
+        for name, value in fields.items():
+            setattr(leave, name, value)
+        changed.append(leave)
+        results[leave.id] = {"id": leave.id, "success": True, "detail": None}
+
+    now = timezone.now()
+    for leave in changed:
+        leave.updated_at = now
+    for balance in balances.values():
+        balance.updated_at = now
+
+    LeaveRequest.objects.bulk_update(changed, ["status", "updated_at", *fields], batch_size=500)
+    LeaveBalance.objects.bulk_update(
+        balances.values(),
+        ["used_days", "used_requests", "pending_days", "pending_requests", "updated_at"],
+        batch_size=500,
+    )
+
+    output = []
+    for leave_id in leave_ids:
+        if leave_id in results:
+            output.append(results[leave_id])
+        elif leave_id in leaves:
+            output.append({"id": leave_id, "success": False, "detail": "Leave sudah diproses."})
+        else:
+            output.append({"id": leave_id, "success": False, "detail": "Leave tidak ditemukan."})
+    return output
+
+
+def bulk_approve(leave_ids, approver):
+    return bulk_transition(
+        leave_ids,
+        "approved",
+        approved_by=approver,
+        approved_at=timezone.now(),
+        rejected_at=None,
+        rejection_reason=None,
+    )
+
+
+def bulk_reject(leave_ids, rejector, rejection_reason):
+    return bulk_transition(
+        leave_ids,
+        "rejected",
+        rejected_by=rejector,
+        rejected_at=timezone.now(),
+        rejection_reason=rejection_reason,
+        approved_at=None,
+    )
+
+
+def quota_period_changed(leave_type, old_period):
+    """
+    quota_period LeaveType berubah -> row ledger lama masih memakai kunci
+    periode lama. Rebuild seluruh ledger setelah transaksi commit.
+    """
+    if old_period is not None and old_period != leave_type.quota_period:
+        transaction.on_commit(rebuild_balances)
+
+
+@transaction.atomic
+def rebuild_balances(employee_ids=None):
+    """
+    Hitung ulang seluruh ledger dari LeaveRequest (perbaikan data).
+    Return jumlah row LeaveBalance yang ditulis.
+    """
+    from .models import LeaveType
+
+    balances_qs = LeaveBalance.objects.all()
+    if employee_ids is not None:
+        balances_qs = balances_qs.filter(employee_id__in=employee_ids)
+    balances_qs.delete()
+
+    balances = []
+    for leave_type in LeaveType.objects.all():
+        requests_qs = LeaveRequest.objects.filter(
+            leave_type=leave_type,
+            status__in=STATUS_BUCKETS,
+        )
+        if employee_ids is not None:
+            requests_qs = requests_qs.filter(employee_id__in=employee_ids)
+
+        period = ["employee_id", "start_date__year"]
+        if leave_type.quota_period == "month":
+            period.append("start_date__month")
+
+        rows = (
+            requests_qs.order_by()
+            .values(*period)
+            .annotate(
+                used_days=Sum("total_days", filter=Q(status="approved")),
+                used_requests=Count("id", filter=Q(status="approved")),
+                pending_days=Sum("total_days", filter=Q(status="pending")),
+                pending_requests=Count("id", filter=Q(status="pending")),
+            )
+        )
+
+        balances.extend(
+            LeaveBalance(
+                employee_id=row["employee_id"],
+                leave_type=leave_type,
+                period_year=row["start_date__year"],
+                period_month=row.get("start_date__month", 0),
+                used_days=row["used_days"] or 0,
+                used_requests=row["used_requests"],
+                pending_days=row["pending_days"] or 0,
+                pending_requests=row["pending_requests"],
+            )
+            for row in rows
+        )
+
+    LeaveBalance.objects.bulk_create(balances, batch_size=1000)
+    return len(balances)
@@ -1,3 +1,358 @@
 from django.test import TestCase
 
 # Create your tests here.
+from datetime import date
+from unittest import skipUnless
+
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.accounts.models import Permission, Role, RolePermission, User, UserRole
+from apps.employees.models import Employee
+from . import services
+from .models import LeaveBalance, LeaveRequest, LeaveType
+from .views import LeaveRequestViewSet
+
+LEAVE_URL = "/api/leave/leave-requests/"
+SQLITE_EXPLAIN = skipUnless(connection.vendor == "sqlite", "format EXPLAIN khusus SQLite")
+
+
+class LeaveListingIndexTest(TestCase):
+    """
+    Listing leave (employee & inbox HR) harus memakai composite index.
+    Test EXPLAIN hanya jalan di SQLite (planner DB test). Nama index sama
+    di MySQL, tetapi format & pilihan plan-nya berbeda, jadi di engine lain
+    test EXPLAIN di-skip; test range half-open tidak bergantung engine.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user(
+            email="hr@example.com",
+            password="secret",
+            full_name="HR",
+            is_staff=True,
+        )
+        employee_user = User.objects.create_user(
+            email="emp@example.com",
+            password="secret",
+            full_name="Employee",
+        )
+        cls.employee = Employee.objects.create(user=employee_user, employee_number="20260001")
+        leave_type = LeaveType.objects.create(code="ANNUAL", name="Annual Leave")
+
+        LeaveRequest.objects.bulk_create([
+            LeaveRequest(
+                employee=cls.employee,
+                leave_type=leave_type,
+                start_date=date(2026, month, 10),
+                end_date=date(2026, month, 11),
+                total_days=2,
+                status=status,
+            )
+            for month in range(1, 13)
+            for status in ("pending", "approved")
+        ])
+
+    def get_listing_queryset(self, user, **params):
+        request = Request(APIRequestFactory().get("/api/leave/leave-requests/", params))
+        request.user = user
+
+        view = LeaveRequestViewSet()
+        view.request = request
+        view.format_kwarg = None
+        return view.get_queryset()
+
+    def test_period_filter_is_half_open_range(self):
+        qs = self.get_listing_queryset(self.hr, year=2026, month=3)
+        sql = str(qs.query)
+
+        self.assertNotIn("django_date_extract", sql)
+        self.assertNotIn("EXTRACT", sql.upper())
+        self.assertEqual(qs.count(), 2)
+
+    @SQLITE_EXPLAIN
+    def test_employee_listing_uses_employee_status_start_index(self):
+        qs = self.get_listing_queryset(self.employee.user, status="pending", year=2026, month=3)
+        self.assertIn("leave_emp_status_start_idx", qs.explain())
+
+    @SQLITE_EXPLAIN
+    def test_hr_status_listing_uses_status_created_index(self):
+        qs = self.get_listing_queryset(self.hr, status="pending")
+        self.assertIn("leave_status_created_idx", qs.explain())
+
+
+class LeaveRequestUpdateTest(TestCase):
+    """
+    Edit leave menjalankan rule yang sama dengan create (berturut-turut,
+    kuota, hari kerja) tanpa menghitung kontribusi leave itu sendiri.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.employee = Employee.objects.create(user=user, employee_number="20260001")
+        cls.leave_type = LeaveType.objects.create(
+            code="ANNUAL",
+            name="Annual Leave",
+            quota_days=3,
+            max_consecutive_days=3,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.employee.user)
+
+    def create_leave(self, start_date, end_date, return_date):
+        response = self.client.post(LEAVE_URL, {
+            "leave_type": self.leave_type.id,
+            "start_date": start_date,
+            "end_date": end_date,
+            "return_date": return_date,
+        })
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data["id"]
+
+    def update_leave(self, leave_id, **data):
+        return self.client.patch(f"{LEAVE_URL}{leave_id}/", data)
+
+    def balance(self):
+        return LeaveBalance.objects.get(employee=self.employee, leave_type=self.leave_type)
+
+    def test_extending_approved_leave_does_not_count_itself(self):
+        leave_id = self.create_leave("2026-03-02", "2026-03-03", "2026-03-04")
+        services.approve_leave(leave_id, self.employee)
+
+        response = self.update_leave(leave_id, end_date="2026-03-04", return_date="2026-03-05")
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["total_days"], 3)
+        self.assertEqual(self.balance().used_days, 3)
+
+    def test_rejected_edit_leaves_ledger_untouched(self):
+        leave_id = self.create_leave("2026-03-02", "2026-03-03", "2026-03-04")
+        services.approve_leave(leave_id, self.employee)
+
+        # 4 hari berturut-turut > max_consecutive_days
+        response = self.update_leave(leave_id, end_date="2026-03-05", return_date="2026-03-06")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(LeaveRequest.objects.get(id=leave_id).total_days, 2)
+        self.assertEqual(self.balance().used_days, 2)
+
+    def test_edit_beyond_quota_is_rejected(self):
+        approved_id = self.create_leave("2026-03-02", "2026-03-03", "2026-03-04")
+        services.approve_leave(approved_id, self.employee)
+        pending_id = self.create_leave("2026-03-09", "2026-03-09", "2026-03-10")
+
+        response = self.update_leave(pending_id, end_date="2026-03-10", return_date="2026-03-11")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.balance().pending_days, 1)
+
+    def test_edit_to_weekend_only_is_rejected(self):
+        leave_id = self.create_leave("2026-03-02", "2026-03-02", "2026-03-03")
+
+        response = self.update_leave(
+            leave_id,
+            start_date="2026-03-07",
+            end_date="2026-03-08",
+            return_date="2026-03-09",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.balance().pending_days, 1)
+
+
+class LeaveBalanceLedgerTest(TestCase):
+    """
+    Ledger LeaveBalance mengikuti setiap transisi dan sama dengan hasil
+    rebuild_balances dari LeaveRequest.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.employee = Employee.objects.create(user=user, employee_number="20260001")
+        cls.leave_type = LeaveType.objects.create(code="ANNUAL", name="Annual Leave", quota_days=5)
+
+    def create_leave(self, start_date, end_date, total_days):
+        leave = LeaveRequest.objects.create(
+            employee=self.employee,
+            leave_type=self.leave_type,
+            start_date=start_date,
+            end_date=end_date,
+            total_days=total_days,
+            status="pending",
+        )
+        services.record_new_request(leave)
+        return leave
+
+    def balance_values(self):
+        return list(
+            LeaveBalance.objects.filter(employee=self.employee)
+            .order_by("leave_type_id", "period_year", "period_month")
+            .values_list(
+                "leave_type_id",
+                "period_year",
+                "period_month",
+                "used_days",
+                "used_requests",
+                "pending_days",
+                "pending_requests",
+            )
+        )
+
+    def assertLedgerMatchesRebuild(self):
+        before = self.balance_values()
+        services.rebuild_balances()
+        # rebuild tidak membuat row kosong (semua bucket 0)
+        self.assertEqual([row for row in before if any(row[3:])], self.balance_values())
+
+    def test_create_approve_cancel(self):
+        leave = self.create_leave(date(2027, 3, 1), date(2027, 3, 2), 2)
+        self.assertEqual(self.balance_values(), [(self.leave_type.id, 2027, 0, 0, 0, 2, 1)])
+
+        services.approve_leave(leave.id, self.employee)
+        self.assertEqual(self.balance_values(), [(self.leave_type.id, 2027, 0, 2, 1, 0, 0)])
+        self.assertLedgerMatchesRebuild()
+
+        services.cancel_leave(leave.id)
+        self.assertEqual(self.balance_values(), [(self.leave_type.id, 2027, 0, 0, 0, 0, 0)])
+        self.assertLedgerMatchesRebuild()
+
+    def test_approve_over_quota_is_rejected(self):
+        first = self.create_leave(date(2027, 3, 1), date(2027, 3, 4), 4)
+        second = self.create_leave(date(2027, 4, 5), date(2027, 4, 6), 2)
+        services.approve_leave(first.id, self.employee)
+
+        with self.assertRaises(services.LeaveError):
+            services.approve_leave(second.id, self.employee)
+
+        second.refresh_from_db()
+        self.assertEqual(second.status, "pending")
+        self.assertEqual(self.balance_values(), [(self.leave_type.id, 2027, 0, 4, 1, 2, 1)])
+
+    def test_rebuild_repairs_drifted_ledger(self):
+        leave = self.create_leave(date(2027, 3, 1), date(2027, 3, 2), 2)
+        services.approve_leave(leave.id, self.employee)
+        self.create_leave(date(2027, 5, 3), date(2027, 5, 3), 1)
+        expected = self.balance_values()
+
+        LeaveBalance.objects.update(used_days=99, pending_requests=7)
+        services.rebuild_balances()
+
+        self.assertEqual(self.balance_values(), expected)
+
+    def test_quota_period_change_rebuilds_on_commit(self):
+        self.create_leave(date(2027, 3, 1), date(2027, 3, 2), 2)
+        self.create_leave(date(2027, 4, 5), date(2027, 4, 5), 1)
+
+        old_period = self.leave_type.quota_period
+        self.leave_type.quota_period = "month"
+        self.leave_type.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            services.quota_period_changed(self.leave_type, old_period)
+
+        self.assertEqual(self.balance_values(), [
+            (self.leave_type.id, 2027, 3, 0, 0, 2, 1),
+            (self.leave_type.id, 2027, 4, 0, 0, 1, 1),
+        ])
+
+
+class LeaveBulkApproveTest(TestCase):
+    """
+    Bulk approve: kuota dipakai urut tanggal mulai, sisanya gagal per item;
+    hanya leave bawahan (bukan milik sendiri) yang bisa diproses.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        manager_user = User.objects.create_user(email="mgr@example.com", password="secret", full_name="Manager")
+        cls.manager = Employee.objects.create(user=manager_user, employee_number="20260001")
+
+        staff_user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.subordinate = Employee.objects.create(
+            user=staff_user,
+            employee_number="20260002",
+            manager=cls.manager,
+        )
+
+        other_user = User.objects.create_user(email="other@example.com", password="secret", full_name="Other")
+        cls.other = Employee.objects.create(user=other_user, employee_number="20260003")
+
+        permission = Permission.objects.create(
+            module="leave",
+            action="approve",
+            name="Approve Leave",
+            code="leave.approve",
+        )
+        role = Role.objects.create(name="Manager")
+        RolePermission.objects.create(role=role, permission=permission)
+        UserRole.objects.create(user=manager_user, role=role)
+
+        cls.leave_type = LeaveType.objects.create(code="ANNUAL", name="Annual Leave", quota_days=3)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager.user)
+
+    def create_leave(self, employee, start_date, total_days):
+        leave = LeaveRequest.objects.create(
+            employee=employee,
+            leave_type=self.leave_type,
+            start_date=start_date,
+            end_date=start_date,
+            total_days=total_days,
+            status="pending",
+        )
+        services.record_new_request(leave)
+        return leave
+
+    def test_partial_quota_failure(self):
+        late = self.create_leave(self.subordinate, date(2027, 5, 3), 1)
+        early = self.create_leave(self.subordinate, date(2027, 3, 1), 2)
+        too_many = self.create_leave(self.subordinate, date(2027, 4, 5), 2)
+
+        response = self.client.post(
+            f"{LEAVE_URL}bulk-approve/",
+            {"ids": [late.id, early.id, too_many.id]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["succeeded"], 2)
+        self.assertEqual(
+            [(item["id"], item["success"]) for item in response.data["results"]],
+            [(late.id, True), (early.id, True), (too_many.id, False)],
+        )
+        self.assertEqual(
+            dict(LeaveRequest.objects.values_list("id", "status")),
+            {late.id: "approved", early.id: "approved", too_many.id: "pending"},
+        )
+
+        balance = LeaveBalance.objects.get(employee=self.subordinate)
+        self.assertEqual((balance.used_days, balance.pending_days), (3, 2))
+
+    def test_own_and_out_of_scope_leaves_are_not_found(self):
+        own = self.create_leave(self.manager, date(2027, 3, 1), 1)
+        outside = self.create_leave(self.other, date(2027, 3, 1), 1)
+
+        response = self.client.post(f"{LEAVE_URL}bulk-approve/", {"ids": [own.id, outside.id]}, format="json")
+
+        self.assertEqual(response.data["succeeded"], 0)
+        self.assertEqual(
+            [item["detail"] for item in response.data["results"]],
+            ["Leave tidak ditemukan.", "Leave tidak ditemukan."],
+        )
+        self.assertFalse(LeaveRequest.objects.filter(status="approved").exists())
+
+    def test_requires_leave_approve_permission(self):
+        leave = self.create_leave(self.other, date(2027, 3, 1), 1)
+        self.client.force_authenticate(self.subordinate.user)
+
+        response = self.client.post(f"{LEAVE_URL}bulk-approve/", {"ids": [leave.id]}, format="json")
+
+        self.assertEqual(response.status_code, 403)
@@ -1,5 +1,7 @@
 from datetime import timedelta
 
+from apps.core.workdays import count_working_days
+
 
 def count_days_inclusive(start_date, end_date):
     """
@@ -8,3 +10,10 @@ def count_days_inclusive(start_date, end_date):
     """
     delta = end_date - start_date
     return delta.days + 1
+
+
+def count_leave_days(start_date, end_date):
+    """
+    Hari leave = hari kerja di range (weekend & Holiday tidak dihitung).
+    """
+    return count_working_days(start_date, end_date)
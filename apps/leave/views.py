@@ -1,17 +1,29 @@
 from django.shortcuts import render
 
 # Create your views here.
+from django.db import transaction
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from apps.accounts.permissions import HasPermission
+from apps.accounts.models import user_has_permission
+from apps.accounts.permissions import HasPermission, HasPermissionOrStaff
 
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 
+from apps.core.dates import filter_period, get_period_params
+from apps.core.pagination import HybridPagination
+from apps.employees.hierarchy import subordinate_ids
 from apps.employees.models import Employee
-from .models import LeaveType, LeaveRequest
+from . import services
+from .models import LeaveBalance, LeaveType, LeaveRequest
+from .utils import count_leave_days
 from .serializers import (
+    LeaveBalanceSerializer,
+    LeaveBulkActionSerializer,
     LeaveTypeSerializer,
     LeaveRequestSerializer,
     LeaveRequestCreateSerializer,
@@ -19,13 +31,32 @@ from .serializers import (
 
 
 class LeaveTypeViewSet(viewsets.ModelViewSet):
-    permission_classes = [IsAuthenticated]
+    """
+    List / retrieve terbuka untuk semua user login.
+    Create / update / delete (aturan kuota) hanya HR: leave.manage atau staff.
+    """
+    permission_classes = [HasPermissionOrStaff]
+    required_permissions = ["leave.manage"]
     queryset = LeaveType.objects.all().order_by("name")
     serializer_class = LeaveTypeSerializer
 
+    def get_permissions(self):
+        if self.action in ("list", "retrieve"):
+            return [IsAuthenticated()]
+        return super().get_permissions()
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        old_period = serializer.instance.quota_period
+        leave_type = serializer.save()
+        services.quota_period_changed(leave_type, old_period)
+
 
 class LeaveRequestViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
+    required_permissions = []
+    pagination_class = HybridPagination
+    cursor_ordering = ("-created_at", "-id")
     queryset = LeaveRequest.objects.select_related(
         "employee",
         "employee__user",
@@ -68,8 +99,7 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
 
         employee_number = self.request.query_params.get("employee_number")
         status_param = self.request.query_params.get("status")
-        year = self.request.query_params.get("year")
-        month = self.request.query_params.get("month")
+        month, year = get_period_params(self.request)
 
         # ⚠️ IMPORTANT:
         # Employee biasa tidak boleh override filter employee_number
@@ -79,11 +109,8 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
         if status_param:
             base_qs = base_qs.filter(status=status_param)
 
-        if year:
-            base_qs = base_qs.filter(start_date__year=year)
-
-        if month:
-            base_qs = base_qs.filter(start_date__month=month)
+        # range half-open supaya index (employee, status, start_date) terpakai
+        base_qs = filter_period(base_qs, "start_date", month=month, year=year)
 
         return base_qs
 
@@ -136,35 +163,97 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
 
         return Response(LeaveRequestSerializer(leave_request).data, status=status.HTTP_201_CREATED)
     
-    @action(detail=True, methods=["post"], permission_classes=[HasPermission])
-    def approve(self, request, pk=None):
-        self.required_permissions = ["leave.approve"]
-
-        leave = self.get_object()
-
-        if leave.status != "pending":
-            return Response({"detail": "Leave sudah diproses."}, status=400)
+    @transaction.atomic
+    def perform_update(self, serializer):
+        # edit tanggal / leave type -> pindahkan kontribusi ke balance yang benar
+        # rule sama dengan LeaveRequestCreateSerializer; kuota dicek SETELAH
+        # release supaya kontribusi leave ini sendiri tidak terhitung dua kali
+        leave = services.lock_leave(serializer.instance.id)
+        services.release(leave)
+
+        data = serializer.validated_data
+        leave_type = data.get("leave_type", leave.leave_type)
+        start_date = data.get("start_date", leave.start_date)
+        end_date = data.get("end_date", leave.end_date)
+        return_date = data.get("return_date", leave.return_date)
+
+        if leave_type.id != leave.leave_type_id and not leave_type.is_active:
+            raise ValidationError("Leave type tidak valid.")
+        if end_date < start_date:
+            raise ValidationError("end_date tidak boleh lebih kecil dari start_date.")
+        if return_date <= end_date:
+            raise ValidationError("return_date tidak boleh lebih kecil dari end_date.")
+
+        total_days = count_leave_days(start_date, end_date)
+        if total_days == 0:
+            raise ValidationError("Tidak ada hari kerja di rentang tanggal tersebut.")
+
+        try:
+            services.check_consecutive(leave_type, total_days)
+            services.check_quota(
+                leave_type,
+                services.lock_balance(leave.employee_id, leave_type, start_date),
+                total_days,
+            )
+        except services.LeaveError as exc:
+            raise ValidationError(str(exc))
+
+        leave = serializer.save(total_days=total_days)
+        services.record_new_request(leave)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        leave = services.lock_leave(instance.id)
+        services.release(leave)
+        leave.delete()
+
+    def approval_queryset(self):
+        """
+        Leave yang boleh di-approve / reject user (pemegang leave.approve):
+        - leave.view_all (RBAC) / staff : semua leave
+        - selain itu                    : leave bawahan (langsung + tidak langsung)
+        Leave milik sendiri tidak pernah termasuk.
+        """
+        user = self.request.user
+        employee = getattr(user, "employee_profile", None)
+        qs = self.queryset
 
+        if not (user_has_permission(user, "leave.view_all") or user.is_staff):
+            if not employee:
+                return qs.none()
+            qs = qs.filter(employee_id__in=subordinate_ids(employee.id))
+
+        if employee:
+            qs = qs.exclude(employee=employee)
+        return qs
+
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[HasPermission],
+        required_permissions=["leave.approve"],
+    )
+    def approve(self, request, pk=None):
+        leave = get_object_or_404(self.approval_queryset(), pk=pk)
         approver_employee = getattr(request.user, "employee_profile", None)
 
-        leave.status = "approved"
-        leave.approved_by = approver_employee
-        leave.approved_at = timezone.now()
-        leave.rejected_at = None
-        leave.rejection_reason = None
-        leave.save()
+        # status & kuota dicek ulang di bawah lock (services.approve_leave)
+        try:
+            services.approve_leave(leave.id, approver_employee)
+        except services.LeaveError as exc:
+            return Response({"detail": str(exc)}, status=400)
 
         return Response({"detail": "Leave berhasil di-approve."})
 
 
-    @action(detail=True, methods=["post"], permission_classes=[HasPermission])
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[HasPermission],
+        required_permissions=["leave.approve"],
+    )
     def reject(self, request, pk=None):
-        self.required_permissions = ["leave.approve"]
-
-        leave = self.get_object()
-
-        if leave.status != "pending":
-            return Response({"detail": "Leave sudah diproses."}, status=400)
+        leave = get_object_or_404(self.approval_queryset(), pk=pk)
 
         rejection_reason = request.data.get("rejection_reason")
         if not rejection_reason:
@@ -175,12 +264,173 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
 
         rejector_employee = getattr(request.user, "employee_profile", None)
 
-        leave.status = "rejected"
-        leave.rejected_by = rejector_employee
-        leave.rejected_at = timezone.now()
-        leave.rejection_reason = rejection_reason
-        leave.approved_at = None
-        leave.save()
+        try:
+            services.reject_leave(leave.id, rejector_employee, rejection_reason)
+        except services.LeaveError as exc:
+            return Response({"detail": str(exc)}, status=400)
 
         return Response({"detail": "Leave berhasil di-reject."})
 
+    def bulk_leave_ids(self, request):
+        """
+        Validasi payload bulk. Return (ids, data).
+        ids di luar approval_queryset user dilaporkan "tidak ditemukan".
+        """
+        serializer = LeaveBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        visible = set(
+            self.approval_queryset().filter(id__in=data["ids"]).values_list("id", flat=True)
+        )
+        return [pk for pk in data["ids"] if pk in visible], data
+
+    def bulk_response(self, ids, results):
+        by_id = {item["id"]: item for item in results}
+        items = [
+            by_id.get(pk, {"id": pk, "success": False, "detail": "Leave tidak ditemukan."})
+            for pk in ids
+        ]
+        succeeded = sum(item["success"] for item in items)
+        return Response({
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded,
+            "results": items,
+        })
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-approve",
+        permission_classes=[HasPermission],
+        required_permissions=["leave.approve"],
+    )
+    def bulk_approve(self, request):
+        """
+        Approve banyak leave sekaligus. Body: {"ids": [1, 2, ...]}
+        """
+        leave_ids, data = self.bulk_leave_ids(request)
+
+        approver_employee = getattr(request.user, "employee_profile", None)
+        results = services.bulk_approve(leave_ids, approver_employee)
+        return self.bulk_response(data["ids"], results)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-reject",
+        permission_classes=[HasPermission],
+        required_permissions=["leave.approve"],
+    )
+    def bulk_reject(self, request):
+        """
+        Reject banyak leave sekaligus.
+        Body: {"ids": [1, 2, ...], "rejection_reason": "..."}
+        """
+        leave_ids, data = self.bulk_leave_ids(request)
+
+        if not data.get("rejection_reason"):
+            return Response({"detail": "rejection_reason wajib diisi."}, status=400)
+
+        rejector_employee = getattr(request.user, "employee_profile", None)
+        results = services.bulk_reject(leave_ids, rejector_employee, data["rejection_reason"])
+        return self.bulk_response(data["ids"], results)
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        """
+        Batalkan leave milik sendiri (atau oleh pemegang leave.approve).
+        Approved hanya bisa dibatalkan sebelum start_date.
+        """
+        leave = self.get_object()
+        user = request.user
+
+        employee = getattr(user, "employee_profile", None)
+        is_owner = employee is not None and leave.employee_id == employee.id
+        if not (is_owner or user_has_permission(user, "leave.approve")):
+            return Response({"detail": "Tidak punya akses membatalkan leave ini."}, status=403)
+
+        try:
+            services.cancel_leave(leave.id)
+        except services.LeaveError as exc:
+            return Response({"detail": str(exc)}, status=400)
+
+        return Response({"detail": "Leave berhasil dibatalkan."})
+
+    @action(detail=False, methods=["get"])
+    def inbox(self, request):
+        """
+        Leave pending milik semua bawahan (langsung + tidak langsung) user.
+        Item inbox bisa di-approve / reject (approval_queryset ikut bawahan).
+        Query params: depth (1 = bawahan langsung saja), status (default pending).
+        """
+        manager = getattr(request.user, "employee_profile", None)
+        if not manager:
+            return Response({"detail": "Employee profile tidak ditemukan."}, status=404)
+
+        try:
+            max_depth = int(request.query_params.get("depth") or 0)
+        except ValueError:
+            return Response({"detail": "depth harus angka."}, status=400)
+
+        qs = self.queryset.filter(
+            employee_id__in=subordinate_ids(manager.id, max_depth=max_depth),
+            status=request.query_params.get("status") or "pending",
+        )
+
+        page = self.paginate_queryset(qs)
+        if page is not None:
+            return self.get_paginated_response(LeaveRequestSerializer(page, many=True).data)
+        return Response(LeaveRequestSerializer(qs, many=True).data)
+
+    @action(detail=False, methods=["get"])
+    def balance(self, request):
+        """
+        Sisa jatah leave per leave type untuk 1 periode.
+        Query params: year, month (default: hari ini),
+        employee_number (HR / staff saja).
+        """
+        user = request.user
+        employee = getattr(user, "employee_profile", None)
+
+        employee_number = request.query_params.get("employee_number")
+        if employee_number and (user_has_permission(user, "leave.view_all") or user.is_staff):
+            employee = Employee.objects.filter(employee_number=employee_number).first()
+
+        if not employee:
+            return Response({"detail": "Employee tidak ditemukan."}, status=404)
+
+        month, year = get_period_params(request)
+        today = timezone.localdate()
+        year = year or today.year
+        month = month or today.month
+
+        balances = {
+            (balance.leave_type_id, balance.period_month): balance
+            for balance in LeaveBalance.objects.filter(
+                Q(period_month=0) | Q(period_month=month),
+                employee=employee,
+                period_year=year,
+            ).select_related("leave_type")
+        }
+
+        results = []
+        for leave_type in LeaveType.objects.filter(is_active=True).order_by("name"):
+            period_month = month if leave_type.quota_period == "month" else 0
+            balance = balances.get((leave_type.id, period_month))
+
+            if not balance:
+                balance = LeaveBalance(
+                    employee=employee,
+                    leave_type=leave_type,
+                    period_year=year,
+                    period_month=period_month,
+                )
+            results.append(balance)
+
+        return Response({
+            "employee_number": employee.employee_number,
+            "year": year,
+            "month": month,
+            "results": LeaveBalanceSerializer(results, many=True).data,
+        })
@@ -1,3 +1,60 @@
 from django.contrib import admin
 
 # Register your models here.
+from .models import GradeSalary, PayrollRun, Payslip, PayslipLine
+
+
+@admin.register(GradeSalary)
+class GradeSalaryAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "grade",
+        "base_salary",
+        "meal_allowance_per_day",
+        "transport_allowance_per_day",
+        "late_deduction",
+        "is_active",
+    )
+    list_filter = ("is_active",)
+    ordering = ("grade__level",)
+
+
+@admin.register(PayrollRun)
+class PayrollRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "period_year",
+        "period_month",
+        "status",
+        "employee_count",
+        "skipped_count",
+        "total_net",
+        "processed_at",
+    )
+    list_filter = ("status", "period_year")
+    ordering = ("-period_year", "-period_month")
+
+
+class PayslipLineInline(admin.TabularInline):
+    model = PayslipLine
+    extra = 0
+
+
+@admin.register(Payslip)
+class PayslipAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "run",
+        "employee",
+        "present_days",
+        "late_count",
+        "alpha_count",
+        "leave_days",
+        "gross_pay",
+        "total_deductions",
+        "net_pay",
+    )
+    list_filter = ("run",)
+    search_fields = ("employee__employee_number", "employee__user__full_name")
+    list_select_related = ("run", "employee", "employee__user")
+    inlines = [PayslipLineInline]
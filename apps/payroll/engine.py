@@ -0,0 +1,318 @@
+"""
+Engine perhitungan payroll.
+
+Alur 1 run (run_payroll):
+1. ambil data periode dengan beberapa query bulk (.values_list):
+   employee + grade, komponen GradeSalary, rekap Attendance per employee
+   (GROUP BY), leave approved yang overlap periode
+2. gabungkan jadi 1 DataFrame (1 baris = 1 employee), hitung semua
+   komponen secara vectorized (pandas / NumPy), tanpa loop per employee.
+   Uang dihitung dalam sen (int64), bukan float, lalu dikonversi ke
+   Decimal saat disimpan
+3. simpan Payslip + PayslipLine dengan bulk_create
+
+Komponen (per employee):
+- BASIC     : gaji pokok grade
+- MEAL      : uang makan/hari x hari hadir (on_time + late)
+- TRANSPORT : uang transport/hari x hari hadir
+- LATE      : potongan per telat x jumlah telat
+- ALPHA     : (gaji pokok / hari kerja run) x jumlah alpha
+"""
+import logging
+from datetime import timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from apps.attendance.models import Attendance
+from apps.core.dates import month_bounds
+from apps.core.workdays import count_working_days
+from apps.employees.models import Employee
+from apps.leave.models import LeaveRequest
+
+from .models import GradeSalary, PayrollRun, Payslip, PayslipLine
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+# code, name, kind, kolom quantity (None = 1), kolom rate
+COMPONENTS = (
+    ("BASIC", "Gaji Pokok", "earning", None, "base_salary"),
+    ("MEAL", "Uang Makan", "earning", "present_days", "meal_allowance_per_day"),
+    ("TRANSPORT", "Uang Transport", "earning", "present_days", "transport_allowance_per_day"),
+    ("LATE", "Potongan Terlambat", "deduction", "late_count", "late_deduction"),
+    ("ALPHA", "Potongan Alpha", "deduction", "alpha_count", "alpha_rate"),
+)
+
+COUNT_COLUMNS = ["present_days", "late_count", "alpha_count", "leave_days", "working_minutes"]
+
+
+def frame(rows, columns):
+    return pd.DataFrame.from_records(list(rows), columns=columns)
+
+
+# =====================================================
+# 1) LOAD (query bulk)
+# =====================================================
+def load_employees(start, end):
+    """
+    Employee yang bekerja di periode [start, end).
+    """
+    qs = Employee.objects.filter(
+        Q(join_date__isnull=True) | Q(join_date__lt=end),
+        Q(resign_date__isnull=True) | Q(resign_date__gte=start),
+    )
+    return frame(qs.values_list("id", "grade_id"), ["employee_id", "grade_id"])
+
+
+def load_grade_salaries():
+    columns = [
+        "grade_id",
+        "base_salary",
+        "meal_allowance_per_day",
+        "transport_allowance_per_day",
+        "late_deduction",
+    ]
+    salaries = frame(GradeSalary.objects.filter(is_active=True).values_list(*columns), columns)
+    for column in columns[1:]:
+        salaries[column] = to_cents(salaries[column])
+    return salaries
+
+
+def load_attendance(start, end):
+    qs = (
+        Attendance.objects.filter(date__gte=start, date__lt=end)
+        .order_by()
+        .values("employee_id")
+        .annotate(
+            present_days=Count("id", filter=Q(status__in=["on_time", "late"])),
+            late_count=Count("id", filter=Q(status="late")),
+            alpha_count=Count("id", filter=Q(status="alpha")),
+            working_minutes=Sum("working_minutes"),
+        )
+        .values_list("employee_id", "present_days", "late_count", "alpha_count", "working_minutes")
+    )
+    return frame(
+        qs,
+        ["employee_id", "present_days", "late_count", "alpha_count", "working_minutes"],
+    )
+
+
+def load_leave_days(start, end):
+    """
+    Hari kerja leave approved per employee yang jatuh di periode.
+    total_days leave = hari kerja (apps.core.workdays), jadi overlap
+    dengan periode juga dihitung dalam hari kerja, maksimal total_days.
+    """
+    qs = LeaveRequest.objects.filter(
+        status="approved",
+        start_date__lt=end,
+        end_date__gte=start,
+    ).values_list("employee_id", "start_date", "end_date", "total_days")
+
+    leaves = frame(qs, ["employee_id", "start_date", "end_date", "total_days"])
+    if leaves.empty:
+        return frame([], ["employee_id", "leave_days"])
+
+    last = end - timedelta(days=1)
+    overlap = [
+        count_working_days(max(leave_start, start), min(leave_end, last))
+        for leave_start, leave_end in zip(leaves["start_date"], leaves["end_date"])
+    ]
+
+    leaves["leave_days"] = np.minimum(overlap, leaves["total_days"]).clip(lower=0)
+    return leaves.groupby("employee_id", as_index=False)["leave_days"].sum()
+
+
+def build_frame(start, end):
+    """
+    Return (DataFrame siap hitung, jumlah employee tanpa GradeSalary).
+    """
+    employees = load_employees(start, end)
+    salaries = load_grade_salaries()
+
+    data = employees.merge(salaries, on="grade_id", how="inner")
+    skipped = len(employees) - len(data)
+
+    data = data.merge(load_attendance(start, end), on="employee_id", how="left")
+    data = data.merge(load_leave_days(start, end), on="employee_id", how="left")
+
+    data[COUNT_COLUMNS] = data[COUNT_COLUMNS].fillna(0).astype("int64")
+    return data, skipped
+
+
+# =====================================================
+# 2) CALCULATE (vectorized)
+# =====================================================
+def to_cents(values):
+    """
+    Kolom Decimal -> int64 sen (tanpa lewat float).
+    """
+    return pd.Series(
+        [int((Decimal(value) * 100).to_integral_value()) for value in values],
+        index=values.index,
+        dtype="int64",
+    )
+
+
+def div_round(numerator, denominator):
+    """
+    Pembagian integer dibulatkan half-up (nilai >= 0).
+    """
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def calculate(data, working_days):
+    """
+    Semua kolom uang dalam sen (int64).
+    """
+    data = data.copy()
+    working_days = max(working_days, 1)
+    data["alpha_rate"] = div_round(data["base_salary"], working_days)
+
+    gross = np.zeros(len(data), dtype="int64")
+    deductions = np.zeros(len(data), dtype="int64")
+
+    for code, _, kind, quantity_column, rate_column in COMPONENTS:
+        quantity = data[quantity_column] if quantity_column else 1
+
+        if code == "ALPHA":
+            # gaji pokok x alpha / hari kerja, 1x pembulatan
+            amount = div_round(data["base_salary"] * quantity, working_days)
+        else:
+            amount = data[rate_column] * quantity
+
+        # potongan tidak boleh melebihi gaji pokok
+        if kind == "deduction":
+            amount = np.minimum(amount, data["base_salary"])
+            deductions += amount
+        else:
+            gross += amount
+
+        data[f"amount_{code}"] = amount
+
+    data["gross_pay"] = gross
+    data["total_deductions"] = np.minimum(deductions, gross)
+    data["net_pay"] = data["gross_pay"] - data["total_deductions"]
+    return data
+
+
+# =====================================================
+# 3) PERSIST (bulk_create)
+# =====================================================
+def money(cents):
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def build_lines(data, payslip_ids):
+    lines = []
+    employee_ids = data["employee_id"].to_numpy()
+
+    for code, name, kind, quantity_column, rate_column in COMPONENTS:
+        quantities = data[quantity_column].to_numpy() if quantity_column else np.ones(len(data))
+        rates = data[rate_column].to_numpy()
+        amounts = data[f"amount_{code}"].to_numpy()
+
+        for employee_id, quantity, rate, amount in zip(employee_ids, quantities, rates, amounts):
+            if not amount and code != "BASIC":
+                continue
+            lines.append(PayslipLine(
+                payslip_id=payslip_ids[employee_id],
+                code=code,
+                name=name,
+                kind=kind,
+                quantity=Decimal(int(quantity)),
+                rate=money(rate),
+                amount=money(amount),
+            ))
+
+    return lines
+
+
+def delete_files(storage, names):
+    for name in names:
+        storage.delete(name)
+
+
+@transaction.atomic
+def persist(run, data):
+    # PDF payslip lama ikut dihapus (setelah commit)
+    old_files = list(
+        Payslip.objects.filter(run=run, pdf_file__gt="").values_list("pdf_file", flat=True)
+    )
+    if old_files:
+        storage = Payslip._meta.get_field("pdf_file").storage
+        transaction.on_commit(lambda: delete_files(storage, old_files))
+
+    Payslip.objects.filter(run=run).delete()
+
+    payslips = [
+        Payslip(
+            run=run,
+            employee_id=int(row.employee_id),
+            grade_id=int(row.grade_id),
+            present_days=int(row.present_days),
+            late_count=int(row.late_count),
+            alpha_count=int(row.alpha_count),
+            leave_days=int(row.leave_days),
+            working_minutes=int(row.working_minutes),
+            gross_pay=money(row.gross_pay),
+            total_deductions=money(row.total_deductions),
+            net_pay=money(row.net_pay),
+        )
+        for row in data.itertuples(index=False)
+    ]
+    Payslip.objects.bulk_create(payslips, batch_size=BATCH_SIZE)
+
+    # MySQL tidak mengembalikan pk dari bulk_create -> ambil ulang 1 query
+    payslip_ids = dict(Payslip.objects.filter(run=run).values_list("employee_id", "id"))
+
+    PayslipLine.objects.bulk_create(build_lines(data, payslip_ids), batch_size=BATCH_SIZE)
+
+
+def run_payroll(run_id):
+    """
+    Hitung (ulang) 1 PayrollRun. Run yang sedang diproses worker lain
+    dilewati.
+    """
+    claimed = (
+        PayrollRun.objects.filter(id=run_id)
+        .exclude(status="processing")
+        .update(status="processing", error=None)
+    )
+    if not claimed:
+        return
+
+    run = PayrollRun.objects.get(id=run_id)
+
+    try:
+        start, end = month_bounds(run.period_year, run.period_month)
+
+        data, skipped = build_frame(start, end)
+        data = calculate(data, run.working_days)
+        persist(run, data)
+
+        PayrollRun.objects.filter(id=run.id).update(
+            status="completed",
+            employee_count=len(data),
+            skipped_count=skipped,
+            total_gross=money(data["gross_pay"].sum()),
+            total_deductions=money(data["total_deductions"].sum()),
+            total_net=money(data["net_pay"].sum()),
+            processed_at=timezone.now(),
+            updated_at=timezone.now(),
+            # payslip baru -> PDF perlu di-render ulang
+            pdf_status="idle",
+            pdf_total=0,
+            pdf_rendered_count=0,
+            pdf_error=None,
+            pdf_finished_at=None,
+        )
+    except Exception as exc:
+        logger.exception("PayrollRun %s gagal", run.id)
+        PayrollRun.objects.filter(id=run.id).update(status="failed", error=str(exc))
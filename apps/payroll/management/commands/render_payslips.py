@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.payroll.models import PayrollRun
+from apps.payroll.payslips import start_rendering
+
+
+class Command(BaseCommand):
+    help = "Render PDF payslip 1 periode (process pool lokal / chunk Celery)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, required=True)
+        parser.add_argument("--month", type=int, required=True)
+
+    def handle(self, *args, **options):
+        run = PayrollRun.objects.filter(
+            period_year=options["year"],
+            period_month=options["month"],
+        ).first()
+
+        if not run:
+            raise CommandError("Payroll run periode tersebut belum ada.")
+        if run.status != "completed":
+            raise CommandError(f"Payroll run belum selesai (status: {run.status}).")
+
+        self.stdout.write(self.style.WARNING(f"🚀 Render payslip {run}..."))
+
+        started = time.monotonic()
+        start_rendering(run.id)
+        run.refresh_from_db()
+        elapsed = time.monotonic() - started
+
+        if run.pdf_status == "failed":
+            raise CommandError(f"Render gagal: {run.pdf_error}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 {run.pdf_rendered_count}/{run.pdf_total} payslip "
+            f"({run.get_pdf_status_display()}), {elapsed:.1f}s"
+        ))
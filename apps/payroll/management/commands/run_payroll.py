@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.workdays import month_working_days
+from apps.payroll.engine import run_payroll
+from apps.payroll.models import PayrollRun
+
+
+class Command(BaseCommand):
+    help = "Hitung payroll 1 periode secara langsung (tanpa worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, required=True)
+        parser.add_argument("--month", type=int, required=True)
+        parser.add_argument("--working-days", type=int, default=None)
+
+    def handle(self, *args, **options):
+        year, month = options["year"], options["month"]
+        if not 1 <= month <= 12:
+            raise CommandError("--month harus 1-12.")
+
+        run, _ = PayrollRun.objects.get_or_create(
+            period_year=year,
+            period_month=month,
+            defaults={"working_days": month_working_days(year, month)},
+        )
+        if options["working_days"]:
+            run.working_days = options["working_days"]
+            run.save(update_fields=["working_days", "updated_at"])
+
+        self.stdout.write(self.style.WARNING(f"🚀 Hitung payroll {year}-{month:02d}..."))
+
+        started = time.monotonic()
+        run_payroll(run.id)
+        run.refresh_from_db()
+        elapsed = time.monotonic() - started
+
+        if run.status != "completed":
+            raise CommandError(f"Payroll gagal: {run.error or run.status}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 Payroll selesai: {run.employee_count} payslip "
+            f"({run.skipped_count} employee tanpa GradeSalary), "
+            f"total net {run.total_net}, {elapsed:.1f}s"
+        ))
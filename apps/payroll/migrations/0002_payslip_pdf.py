@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:33
+
+import apps.payroll.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="payrollrun",
+            name="pdf_error",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="payrollrun",
+            name="pdf_finished_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="payrollrun",
+            name="pdf_rendered_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="payrollrun",
+            name="pdf_status",
+            field=models.CharField(
+                choices=[
+                    ("idle", "Idle"),
+                    ("rendering", "Rendering"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                ],
+                default="idle",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="payrollrun",
+            name="pdf_total",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="payslip",
+            name="pdf_file",
+            field=models.FileField(
+                blank=True, null=True, upload_to=apps.payroll.models.payslip_upload_to
+            ),
+        ),
+    ]
@@ -1,3 +1,162 @@
+from django.conf import settings
 from django.db import models
 
 # Create your models here.
+
+
+class GradeSalary(models.Model):
+    """
+    Komponen gaji per Grade. Dipakai engine payroll (engine.py).
+    """
+    grade = models.OneToOneField(
+        "employees.Grade",
+        on_delete=models.CASCADE,
+        related_name="salary",
+    )
+
+    base_salary = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    meal_allowance_per_day = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    transport_allowance_per_day = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    late_deduction = models.DecimalField(max_digits=12, decimal_places=2, default=0)  # per kali telat
+
+    is_active = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "payroll_grade_salaries"
+
+    def __str__(self):
+        return f"{self.grade} - {self.base_salary}"
+
+
+class PayrollRun(models.Model):
+    """
+    1 run payroll per periode (tahun-bulan).
+    Hitung ulang (recalculate) mengganti seluruh payslip run tersebut.
+    """
+    STATUS_CHOICES = [
+        ("draft", "Draft"),
+        ("processing", "Processing"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    ]
+
+    PDF_STATUS_CHOICES = [
+        ("idle", "Idle"),
+        ("rendering", "Rendering"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    period_year = models.PositiveSmallIntegerField()
+    period_month = models.PositiveSmallIntegerField()
+
+    # hari kerja periode, dasar potongan alpha (gaji pokok / hari kerja).
+    # Diisi dari kalender (apps.core.workdays.month_working_days) saat run
+    # dibuat lewat API / command; 22 hanya fallback
+    working_days = models.PositiveSmallIntegerField(default=22)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="draft")
+    employee_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)  # employee tanpa GradeSalary
+    total_gross = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    total_deductions = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    total_net = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    error = models.TextField(null=True, blank=True)
+
+    # render PDF payslip (payslips.py)
+    pdf_status = models.CharField(max_length=20, choices=PDF_STATUS_CHOICES, default="idle")
+    pdf_total = models.PositiveIntegerField(default=0)
+    pdf_rendered_count = models.PositiveIntegerField(default=0)
+    pdf_error = models.TextField(null=True, blank=True)
+    pdf_finished_at = models.DateTimeField(null=True, blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="payroll_runs",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "payroll_runs"
+        unique_together = ("period_year", "period_month")
+        ordering = ["-period_year", "-period_month"]
+
+    def __str__(self):
+        return f"Payroll {self.period_year}-{self.period_month:02d} ({self.status})"
+
+
+def payslip_upload_to(instance, filename):
+    run = instance.run
+    return f"payroll/payslips/{run.period_year}-{run.period_month:02d}/{filename}"
+
+
+class Payslip(models.Model):
+    run = models.ForeignKey(PayrollRun, on_delete=models.CASCADE, related_name="payslips")
+    employee = models.ForeignKey(
+        "employees.Employee",
+        on_delete=models.PROTECT,
+        related_name="payslips",
+    )
+    grade = models.ForeignKey(
+        "employees.Grade",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="payslips",
+    )
+
+    # rekap periode
+    present_days = models.PositiveIntegerField(default=0)
+    late_count = models.PositiveIntegerField(default=0)
+    alpha_count = models.PositiveIntegerField(default=0)
+    leave_days = models.PositiveIntegerField(default=0)
+    working_minutes = models.PositiveIntegerField(default=0)
+
+    gross_pay = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_deductions = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    net_pay = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    pdf_file = models.FileField(upload_to=payslip_upload_to, null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "payroll_payslips"
+        unique_together = ("run", "employee")
+        ordering = ["run", "employee"]
+
+    def __str__(self):
+        return f"{self.employee.employee_number} - {self.run}"
+
+
+class PayslipLine(models.Model):
+    KIND_CHOICES = [
+        ("earning", "Earning"),
+        ("deduction", "Deduction"),
+    ]
+
+    payslip = models.ForeignKey(Payslip, on_delete=models.CASCADE, related_name="lines")
+
+    code = models.CharField(max_length=30)
+    name = models.CharField(max_length=100)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+
+    quantity = models.DecimalField(max_digits=10, decimal_places=2, default=1)
+    rate = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = "payroll_payslip_lines"
+        ordering = ["payslip", "id"]
+
+    def __str__(self):
+        return f"{self.code} {self.amount}"
@@ -0,0 +1,173 @@
+"""
+Pipeline PDF payslip untuk 1 PayrollRun.
+
+start_rendering membagi payslip run menjadi chunk lalu fan-out:
+- CELERY_BROKER_URL di-set : 1 task Celery per chunk (group), dikerjakan
+                             paralel oleh worker Celery
+- local/dev                : ProcessPoolExecutor (spawn) di proses ini
+
+Setiap chunk (render_chunk) memuat data payslip dengan 2 query, render
+PDF memakai PayslipTemplate yang dibuat 1x per proses worker, menyimpan
+file ke Payslip.pdf_file (MEDIA_ROOT), lalu menaikkan progress run
+dengan F(). Chunk yang membuat progress mencapai total menandai run done.
+"""
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import F
+from django.utils import timezone
+
+from . import workers
+from .models import PayrollRun, Payslip
+from .pdf import PayslipTemplate
+
+logger = logging.getLogger(__name__)
+
+_template = None
+
+
+def get_template():
+    """
+    Template per proses worker (dibuat sekali, dipakai ulang).
+    """
+    global _template
+
+    if _template is None:
+        _template = PayslipTemplate(settings.PAYSLIP_COMPANY_NAME)
+    return _template
+
+
+def payslip_data(payslip):
+    employee = payslip.employee
+
+    return {
+        "period_year": payslip.run.period_year,
+        "period_month": payslip.run.period_month,
+        "employee_number": employee.employee_number,
+        "full_name": employee.user.full_name,
+        "department": employee.department.name if employee.department else None,
+        "grade": payslip.grade.name if payslip.grade else None,
+        "present_days": payslip.present_days,
+        "late_count": payslip.late_count,
+        "alpha_count": payslip.alpha_count,
+        "leave_days": payslip.leave_days,
+        "gross_pay": payslip.gross_pay,
+        "total_deductions": payslip.total_deductions,
+        "net_pay": payslip.net_pay,
+        "lines": [
+            {
+                "name": line.name,
+                "kind": line.kind,
+                "quantity": line.quantity,
+                "rate": line.rate,
+                "amount": line.amount,
+            }
+            for line in payslip.lines.all()
+        ],
+    }
+
+
+def payslip_filename(payslip):
+    run = payslip.run
+    return f"payslip_{run.period_year}-{run.period_month:02d}_{payslip.employee.employee_number}.pdf"
+
+
+def render_chunk(run_id, payslip_ids):
+    payslips = list(
+        Payslip.objects.filter(id__in=payslip_ids)
+        .select_related("run", "employee__user", "employee__department", "grade")
+        .prefetch_related("lines")
+    )
+    template = get_template()
+
+    for payslip in payslips:
+        old_name = payslip.pdf_file.name
+        content = template.render(payslip_data(payslip))
+        payslip.pdf_file.save(payslip_filename(payslip), ContentFile(content), save=False)
+
+        if old_name:
+            payslip.pdf_file.storage.delete(old_name)
+
+    Payslip.objects.bulk_update(payslips, ["pdf_file"], batch_size=500)
+
+    PayrollRun.objects.filter(id=run_id).update(
+        pdf_rendered_count=F("pdf_rendered_count") + len(payslips),
+    )
+    finish_if_complete(run_id)
+    return len(payslips)
+
+
+def finish_if_complete(run_id):
+    PayrollRun.objects.filter(
+        id=run_id,
+        pdf_status="rendering",
+        pdf_rendered_count__gte=F("pdf_total"),
+    ).update(pdf_status="done", pdf_finished_at=timezone.now())
+
+
+def mark_failed(run_id, exc):
+    logger.error("Render payslip run %s gagal: %s", run_id, exc)
+    PayrollRun.objects.filter(id=run_id).update(
+        pdf_status="failed",
+        pdf_error=str(exc),
+        pdf_finished_at=timezone.now(),
+    )
+
+
+def render_in_process_pool(run_id, chunks):
+    max_workers = settings.PAYSLIP_PDF_WORKERS or multiprocessing.cpu_count()
+
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(chunks)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=workers.init_worker,
+    ) as pool:
+        futures = [pool.submit(workers.render_chunk, run_id, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            future.result()
+
+
+def start_rendering(run_id):
+    """
+    Mulai render PDF seluruh payslip run (run harus sudah completed).
+    """
+    payslip_ids = list(
+        Payslip.objects.filter(run_id=run_id).order_by("id").values_list("id", flat=True)
+    )
+
+    claimed = (
+        PayrollRun.objects.filter(id=run_id, status="completed")
+        .exclude(pdf_status="rendering")
+        .update(
+            pdf_status="rendering",
+            pdf_total=len(payslip_ids),
+            pdf_rendered_count=0,
+            pdf_error=None,
+            pdf_finished_at=None,
+        )
+    )
+    if not claimed:
+        return
+
+    size = settings.PAYSLIP_PDF_CHUNK_SIZE
+    chunks = [payslip_ids[start:start + size] for start in range(0, len(payslip_ids), size)]
+
+    if not chunks:
+        finish_if_complete(run_id)
+        return
+
+    if settings.CELERY_BROKER_URL:
+        from celery import group
+
+        from .tasks import render_payslip_chunk
+
+        group(render_payslip_chunk.s(run_id, chunk) for chunk in chunks).apply_async()
+        return
+
+    try:
+        render_in_process_pool(run_id, chunks)
+    except Exception as exc:
+        mark_failed(run_id, exc)
@@ -0,0 +1,142 @@
+"""
+Render PDF payslip dengan reportlab (canvas, tanpa platypus).
+
+PayslipTemplate dibuat 1x per proses worker (font, ukuran kolom, teks
+statis) lalu dipakai ulang untuk setiap payslip. Modul ini tidak
+mengimport model Django supaya murah di-load oleh proses worker.
+"""
+import io
+from decimal import Decimal
+
+from reportlab.lib.pagesizes import A5, landscape
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+MONTH_NAMES = (
+    "Januari", "Februari", "Maret", "April", "Mei", "Juni",
+    "Juli", "Agustus", "September", "Oktober", "November", "Desember",
+)
+
+
+def rupiah(value):
+    value = Decimal(value or 0)
+    formatted = f"{abs(value):,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+    return f"-Rp {formatted}" if value < 0 else f"Rp {formatted}"
+
+
+class PayslipTemplate:
+    """
+    Layout payslip (A5 landscape). Semua yang tidak bergantung pada data
+    employee dihitung di __init__.
+    """
+    font = "Helvetica"
+    font_bold = "Helvetica-Bold"
+
+    def __init__(self, company_name):
+        self.company_name = company_name
+        self.page_size = landscape(A5)
+        self.width, self.height = self.page_size
+
+        self.margin = 12 * mm
+        self.line_height = 5.5 * mm
+        self.col_name = self.margin
+        self.col_quantity = self.width - self.margin - 75 * mm
+        self.col_rate = self.width - self.margin - 40 * mm
+        self.col_amount = self.width - self.margin
+
+    def draw_header(self, pdf, data):
+        top = self.height - self.margin
+
+        pdf.setFont(self.font_bold, 13)
+        pdf.drawString(self.margin, top, self.company_name)
+        pdf.setFont(self.font, 9)
+        pdf.drawRightString(
+            self.width - self.margin,
+            top,
+            f"SLIP GAJI {MONTH_NAMES[data['period_month'] - 1].upper()} {data['period_year']}",
+        )
+
+        pdf.line(self.margin, top - 3 * mm, self.width - self.margin, top - 3 * mm)
+
+        y = top - 9 * mm
+        rows = (
+            ("No. Pegawai", data["employee_number"]),
+            ("Nama", data["full_name"]),
+            ("Department", data["department"] or "-"),
+            ("Grade", data["grade"] or "-"),
+        )
+        for label, value in rows:
+            pdf.drawString(self.margin, y, label)
+            pdf.drawString(self.margin + 28 * mm, y, f": {value}")
+            y -= self.line_height
+
+        summary = (
+            ("Hadir", data["present_days"]),
+            ("Terlambat", data["late_count"]),
+            ("Alpha", data["alpha_count"]),
+            ("Cuti", data["leave_days"]),
+        )
+        y = top - 9 * mm
+        for label, value in summary:
+            pdf.drawString(self.col_rate, y, label)
+            pdf.drawRightString(self.col_amount, y, f"{value} hari")
+            y -= self.line_height
+
+        return top - 9 * mm - 4 * self.line_height - 3 * mm
+
+    def draw_lines(self, pdf, lines, y):
+        pdf.setFont(self.font_bold, 9)
+        pdf.drawString(self.col_name, y, "Komponen")
+        pdf.drawRightString(self.col_quantity, y, "Qty")
+        pdf.drawRightString(self.col_rate, y, "Tarif")
+        pdf.drawRightString(self.col_amount, y, "Jumlah")
+        pdf.line(self.margin, y - 2 * mm, self.width - self.margin, y - 2 * mm)
+
+        pdf.setFont(self.font, 9)
+        y -= self.line_height + 1 * mm
+        for line in lines:
+            amount = Decimal(line["amount"])
+            if line["kind"] == "deduction":
+                amount = -amount
+
+            pdf.drawString(self.col_name, y, line["name"])
+            pdf.drawRightString(self.col_quantity, y, f"{Decimal(line['quantity']):g}")
+            pdf.drawRightString(self.col_rate, y, rupiah(line["rate"]))
+            pdf.drawRightString(self.col_amount, y, rupiah(amount))
+            y -= self.line_height
+
+        return y
+
+    def draw_totals(self, pdf, data, y):
+        pdf.line(self.margin, y + 2 * mm, self.width - self.margin, y + 2 * mm)
+        y -= 2 * mm
+
+        totals = (
+            ("Total Pendapatan", data["gross_pay"]),
+            ("Total Potongan", -Decimal(data["total_deductions"])),
+        )
+        pdf.setFont(self.font, 9)
+        for label, value in totals:
+            pdf.drawString(self.col_rate - 35 * mm, y, label)
+            pdf.drawRightString(self.col_amount, y, rupiah(value))
+            y -= self.line_height
+
+        pdf.setFont(self.font_bold, 11)
+        pdf.drawString(self.col_rate - 35 * mm, y, "Gaji Bersih")
+        pdf.drawRightString(self.col_amount, y, rupiah(data["net_pay"]))
+
+    def render(self, data):
+        """
+        data: dict payslip (lihat payslips.payslip_data). Return bytes PDF.
+        """
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer, pagesize=self.page_size, pageCompression=1)
+        pdf.setTitle(f"Payslip {data['employee_number']} {data['period_year']}-{data['period_month']:02d}")
+
+        y = self.draw_header(pdf, data)
+        y = self.draw_lines(pdf, data["lines"], y)
+        self.draw_totals(pdf, data, y)
+
+        pdf.showPage()
+        pdf.save()
+        return buffer.getvalue()
@@ -0,0 +1,101 @@
+from rest_framework import serializers
+
+from apps.core.dates import MAX_YEAR, MIN_YEAR
+from apps.core.workdays import month_working_days
+
+from .models import GradeSalary, PayrollRun, Payslip, PayslipLine
+
+
+class GradeSalarySerializer(serializers.ModelSerializer):
+    grade_name = serializers.CharField(source="grade.name", read_only=True)
+
+    class Meta:
+        model = GradeSalary
+        fields = "__all__"
+
+
+class PayrollRunSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PayrollRun
+        fields = "__all__"
+        read_only_fields = (
+            "status",
+            "employee_count",
+            "skipped_count",
+            "total_gross",
+            "total_deductions",
+            "total_net",
+            "error",
+            "pdf_status",
+            "pdf_total",
+            "pdf_rendered_count",
+            "pdf_error",
+            "pdf_finished_at",
+            "created_by",
+            "created_at",
+            "updated_at",
+            "processed_at",
+        )
+
+    def validate_period_year(self, value):
+        if not MIN_YEAR <= value <= MAX_YEAR:
+            raise serializers.ValidationError(f"period_year harus {MIN_YEAR}-{MAX_YEAR}.")
+        return value
+
+    def validate_period_month(self, value):
+        if not 1 <= value <= 12:
+            raise serializers.ValidationError("period_month harus 1-12.")
+        return value
+
+    def validate(self, attrs):
+        # working_days tidak diisi -> dari kalender hari kerja (Holiday)
+        if not self.instance and "working_days" not in attrs:
+            attrs["working_days"] = month_working_days(attrs["period_year"], attrs["period_month"])
+        return attrs
+
+
+class PayslipLineSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PayslipLine
+        fields = ["code", "name", "kind", "quantity", "rate", "amount"]
+
+
+class PayslipSerializer(serializers.ModelSerializer):
+    employee_number = serializers.CharField(source="employee.employee_number", read_only=True)
+    full_name = serializers.CharField(source="employee.user.full_name", read_only=True)
+    period_year = serializers.IntegerField(source="run.period_year", read_only=True)
+    period_month = serializers.IntegerField(source="run.period_month", read_only=True)
+    lines = PayslipLineSerializer(many=True, read_only=True)
+    pdf_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Payslip
+        fields = [
+            "id",
+            "run",
+            "period_year",
+            "period_month",
+            "employee",
+            "employee_number",
+            "full_name",
+            "grade",
+            "present_days",
+            "late_count",
+            "alpha_count",
+            "leave_days",
+            "working_minutes",
+            "gross_pay",
+            "total_deductions",
+            "net_pay",
+            "lines",
+            "pdf_url",
+            "created_at",
+        ]
+
+    def get_pdf_url(self, obj):
+        if not obj.pdf_file:
+            return None
+
+        path = f"/api/payroll/payslips/{obj.id}/pdf/"
+        request = self.context.get("request")
+        return request.build_absolute_uri(path) if request else path
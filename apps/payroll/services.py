@@ -0,0 +1,19 @@
+from apps.core.background import enqueue
+
+from .models import PayrollRun
+
+
+def enqueue_payroll_run(run):
+    """
+    Tandai run sebagai draft lalu hitung di background setelah commit.
+    """
+    from .tasks import calculate_payroll_run
+
+    PayrollRun.objects.filter(id=run.id).exclude(status="processing").update(status="draft")
+    enqueue(calculate_payroll_run, run.id)
+
+
+def enqueue_payslip_rendering(run):
+    from .tasks import render_run_payslips
+
+    enqueue(render_run_payslips, run.id)
@@ -0,0 +1,26 @@
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def calculate_payroll_run(run_id):
+    from .engine import run_payroll
+
+    run_payroll(run_id)
+
+
+@shared_task(ignore_result=True)
+def render_run_payslips(run_id):
+    from .payslips import start_rendering
+
+    start_rendering(run_id)
+
+
+@shared_task(ignore_result=True)
+def render_payslip_chunk(run_id, payslip_ids):
+    from .payslips import mark_failed, render_chunk
+
+    try:
+        render_chunk(run_id, payslip_ids)
+    except Exception as exc:
+        mark_failed(run_id, exc)
+        raise
@@ -1,3 +1,105 @@
 from django.test import TestCase
 
 # Create your tests here.
+from datetime import date
+from decimal import Decimal
+
+from apps.accounts.models import User
+from apps.attendance.models import Attendance
+from apps.core import workdays
+from apps.core.models import Holiday
+from apps.employees.models import Employee, Grade
+from apps.leave.models import LeaveRequest, LeaveType
+from .engine import run_payroll
+from .models import GradeSalary, PayrollRun, Payslip
+from .serializers import PayrollRunSerializer
+
+
+class PayrollEngineTest(TestCase):
+    """
+    Maret 2026: 22 weekday, 3 Maret libur -> 21 hari kerja.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Holiday.objects.create(date=date(2026, 3, 3), name="Libur")
+
+        grade = Grade.objects.create(name="Grade 1", code="G1")
+        GradeSalary.objects.create(
+            grade=grade,
+            base_salary=Decimal("5000000.00"),
+            meal_allowance_per_day=Decimal("50000.50"),
+            late_deduction=Decimal("25000.00"),
+        )
+
+        user = User.objects.create_user(email="emp@example.com", password="secret", full_name="Employee")
+        cls.employee = Employee.objects.create(user=user, employee_number="20260001", grade=grade)
+
+        Attendance.objects.bulk_create([
+            Attendance(employee=cls.employee, date=date(2026, 3, 9), status="on_time"),
+            Attendance(employee=cls.employee, date=date(2026, 3, 10), status="alpha"),
+        ])
+
+        # Kamis 26 Feb s/d Rabu 4 Mar: 4 hari kerja, 2 di antaranya di Maret
+        LeaveRequest.objects.create(
+            employee=cls.employee,
+            leave_type=LeaveType.objects.create(code="ANNUAL", name="Annual Leave"),
+            start_date=date(2026, 2, 26),
+            end_date=date(2026, 3, 4),
+            total_days=4,
+            status="approved",
+        )
+
+    def setUp(self):
+        # index hari kerja in-process bisa tersisa dari test lain; Holiday
+        # test ini juga tidak boleh tertinggal (rollback tanpa on_commit)
+        workdays.invalidate()
+        self.addCleanup(workdays.invalidate)
+
+    def create_run(self):
+        serializer = PayrollRunSerializer(data={"period_year": 2026, "period_month": 3})
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def test_working_days_default_from_calendar(self):
+        self.assertEqual(self.create_run().working_days, 21)
+
+    def test_period_year_out_of_range_is_invalid(self):
+        for year in (0, 1899, 9999, 10000):
+            with self.subTest(year=year):
+                serializer = PayrollRunSerializer(data={"period_year": year, "period_month": 12})
+                self.assertFalse(serializer.is_valid())
+                self.assertIn("period_year", serializer.errors)
+
+    def test_leave_days_prorated_by_working_days(self):
+        run = self.create_run()
+        run_payroll(run.id)
+
+        payslip = Payslip.objects.get(run=run, employee=self.employee)
+        self.assertEqual(payslip.leave_days, 2)
+
+    def test_amounts_are_exact_cents(self):
+        run = self.create_run()
+        run_payroll(run.id)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, "completed", run.error)
+
+        payslip = Payslip.objects.get(run=run, employee=self.employee)
+        lines = {line.code: line.amount for line in payslip.lines.all()}
+
+        # 5.000.000 / 21 = 238.095,238... -> 238.095,24
+        self.assertEqual(lines["ALPHA"], Decimal("238095.24"))
+        self.assertEqual(lines["MEAL"], Decimal("50000.50"))
+        self.assertEqual(payslip.gross_pay, Decimal("5050000.50"))
+        self.assertEqual(payslip.total_deductions, Decimal("238095.24"))
+        self.assertEqual(payslip.net_pay, Decimal("4811905.26"))
+        self.assertEqual(run.total_net, payslip.net_pay)
+
+    def test_recalculate_replaces_payslips(self):
+        run = self.create_run()
+        run_payroll(run.id)
+        run_payroll(run.id)
+
+        self.assertEqual(Payslip.objects.filter(run=run).count(), 1)
+        self.assertEqual(PayrollRun.objects.get(id=run.id).employee_count, 1)
@@ -1,3 +1,13 @@
-from django.urls import path
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
 
-urlpatterns = []
+from .views import GradeSalaryViewSet, PayrollRunViewSet, PayslipViewSet
+
+router = DefaultRouter()
+router.register(r"grade-salaries", GradeSalaryViewSet, basename="grade-salaries")
+router.register(r"runs", PayrollRunViewSet, basename="payroll-runs")
+router.register(r"payslips", PayslipViewSet, basename="payslips")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
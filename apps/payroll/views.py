@@ -1,3 +1,123 @@
 from django.shortcuts import render
 
 # Create your views here.
+import os
+
+from django.http import FileResponse
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.accounts.models import user_has_permission
+from apps.accounts.permissions import HasPermission
+from .models import GradeSalary, PayrollRun, Payslip
+from .serializers import GradeSalarySerializer, PayrollRunSerializer, PayslipSerializer
+from .services import enqueue_payroll_run, enqueue_payslip_rendering
+
+
+class GradeSalaryViewSet(viewsets.ModelViewSet):
+    permission_classes = [HasPermission]
+    required_permissions = ["payroll.update"]
+    queryset = GradeSalary.objects.select_related("grade").all().order_by("grade__level")
+    serializer_class = GradeSalarySerializer
+
+
+class PayrollRunViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    POST /runs/                 -> buat run periode + hitung di background
+    POST /runs/{id}/recalculate/ -> hitung ulang (payslip lama diganti)
+    POST /runs/{id}/render-payslips/ -> render PDF semua payslip di background
+    """
+    permission_classes = [HasPermission]
+    required_permissions = ["payroll.generate"]
+    queryset = PayrollRun.objects.all()
+    serializer_class = PayrollRunSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        run = serializer.save(created_by=request.user)
+
+        enqueue_payroll_run(run)
+
+        return Response(self.get_serializer(run).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=["post"])
+    def recalculate(self, request, pk=None):
+        run = self.get_object()
+
+        if run.status == "processing":
+            return Response({"detail": "Payroll sedang diproses."}, status=status.HTTP_409_CONFLICT)
+
+        enqueue_payroll_run(run)
+        run.refresh_from_db()
+
+        return Response(self.get_serializer(run).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=["post"], url_path="render-payslips")
+    def render_payslips(self, request, pk=None):
+        run = self.get_object()
+
+        if run.status != "completed":
+            return Response({"detail": "Payroll belum selesai dihitung."}, status=status.HTTP_409_CONFLICT)
+
+        if run.pdf_status == "rendering":
+            return Response({"detail": "Payslip sedang di-render."}, status=status.HTTP_409_CONFLICT)
+
+        enqueue_payslip_rendering(run)
+
+        return Response(self.get_serializer(run).data, status=status.HTTP_202_ACCEPTED)
+
+
+class PayslipViewSet(viewsets.ReadOnlyModelViewSet):
+    permission_classes = [IsAuthenticated]
+    serializer_class = PayslipSerializer
+    queryset = Payslip.objects.select_related(
+        "run",
+        "employee",
+        "employee__user",
+    ).prefetch_related("lines")
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        user = self.request.user
+
+        # HR / payroll bisa lihat semua, employee hanya payslip miliknya
+        if user_has_permission(user, "payroll.view") or user.is_staff:
+            base_qs = qs
+        else:
+            employee = getattr(user, "employee_profile", None)
+            if not employee:
+                return qs.none()
+            base_qs = qs.filter(employee=employee)
+
+        run = self.request.query_params.get("run")
+        employee_number = self.request.query_params.get("employee_number")
+
+        if run:
+            base_qs = base_qs.filter(run_id=run)
+
+        if employee_number:
+            base_qs = base_qs.filter(employee__employee_number=employee_number)
+
+        return base_qs
+
+    @action(detail=True, methods=["get"])
+    def pdf(self, request, pk=None):
+        payslip = self.get_object()
+
+        if not payslip.pdf_file:
+            return Response({"detail": "PDF payslip belum di-render."}, status=status.HTTP_404_NOT_FOUND)
+
+        return FileResponse(
+            payslip.pdf_file.open("rb"),
+            as_attachment=True,
+            filename=os.path.basename(payslip.pdf_file.name),
+            content_type="application/pdf",
+        )
@@ -0,0 +1,23 @@
+"""
+Entry point proses ProcessPoolExecutor (spawn).
+
+Modul ini sengaja tidak mengimport Django/model di level atas: proses
+spawn meng-unpickle referensi fungsi di sini sebelum initializer
+menjalankan django.setup().
+"""
+
+
+def init_worker():
+    import django
+
+    django.setup()
+
+    from .payslips import get_template
+
+    get_template()
+
+
+def render_chunk(run_id, payslip_ids):
+    from .payslips import render_chunk
+
+    return render_chunk(run_id, payslip_ids)
@@ -1,3 +1,32 @@
 from django.contrib import admin
 
 # Register your models here.
+from .models import ReportJob
+
+
+@admin.register(ReportJob)
+class ReportJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "report_type",
+        "file_type",
+        "status",
+        "progress",
+        "row_count",
+        "requested_by",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("report_type", "status", "file_type")
+    search_fields = ("requested_by__email",)
+    ordering = ("-created_at",)
+    readonly_fields = (
+        "status",
+        "progress",
+        "row_count",
+        "error",
+        "output_file",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
@@ -0,0 +1,249 @@
+"""
+Definisi jenis laporan.
+
+Setiap report punya:
+- clean(parameters) : validasi & normalisasi parameters dari request
+- headers           : judul kolom
+- queryset()        : query (sudah di-GROUP BY) yang menghasilkan row
+- rows()            : iterator list nilai per baris
+
+Query sengaja berupa agregasi di DB (.values().annotate()), sehingga yang
+ditarik ke Python hanya hasil rekap, bukan row mentah.
+"""
+from datetime import date
+
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.attendance.models import AttendanceMonthlySummary
+from apps.core.dates import filter_period
+from apps.employees.models import Employee
+from apps.leave.models import LeaveRequest
+
+ITERATOR_CHUNK_SIZE = 2000
+
+
+def parse_int(parameters, name, required=False, low=None, high=None):
+    value = parameters.get(name)
+    if value in (None, ""):
+        if required:
+            raise serializers.ValidationError({name: f"{name} wajib diisi."})
+        return None
+
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise serializers.ValidationError({name: f"{name} tidak valid."})
+
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise serializers.ValidationError({name: f"{name} tidak valid."})
+
+    return value
+
+
+class BaseReport:
+    title = ""
+    headers = ()
+
+    def __init__(self, parameters):
+        self.parameters = self.clean(parameters or {})
+
+    def clean(self, parameters):
+        return {}
+
+    def queryset(self):
+        raise NotImplementedError
+
+    def filename(self):
+        return self.title.lower().replace(" ", "_")
+
+    def count(self):
+        return self.queryset().count()
+
+    def rows(self):
+        for row in self.queryset().iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            yield self.format_row(row)
+
+    def format_row(self, row):
+        return list(row.values())
+
+
+class AttendanceRecapReport(BaseReport):
+    """
+    Rekap attendance per employee, dibaca dari rollup bulanan.
+    parameters: year (wajib), month, department_id
+    """
+    title = "Attendance Recap"
+    headers = (
+        "Employee Number",
+        "Full Name",
+        "Department",
+        "Total Days",
+        "On Time",
+        "Late",
+        "Alpha",
+        "Working Hours",
+    )
+
+    def clean(self, parameters):
+        return {
+            "year": parse_int(parameters, "year", required=True, low=1900, high=9999),
+            "month": parse_int(parameters, "month", low=1, high=12),
+            "department_id": parse_int(parameters, "department_id"),
+        }
+
+    def filename(self):
+        name = f"attendance_recap_{self.parameters['year']}"
+        if self.parameters["month"]:
+            name += f"-{self.parameters['month']:02d}"
+        return name
+
+    def queryset(self):
+        qs = AttendanceMonthlySummary.objects.filter(year=self.parameters["year"])
+
+        if self.parameters["month"]:
+            qs = qs.filter(month=self.parameters["month"])
+
+        if self.parameters["department_id"]:
+            qs = qs.filter(employee__department_id=self.parameters["department_id"])
+
+        return (
+            qs.values(
+                "employee__employee_number",
+                "employee__user__full_name",
+                "employee__department__name",
+            )
+            .annotate(
+                total=Sum("total_days"),
+                on_time=Sum("on_time_count"),
+                late=Sum("late_count"),
+                alpha=Sum("alpha_count"),
+                minutes=Sum("total_working_minutes"),
+            )
+            .order_by("employee__employee_number")
+        )
+
+    def format_row(self, row):
+        return [
+            row["employee__employee_number"],
+            row["employee__user__full_name"],
+            row["employee__department__name"],
+            row["total"] or 0,
+            row["on_time"] or 0,
+            row["late"] or 0,
+            row["alpha"] or 0,
+            round((row["minutes"] or 0) / 60, 2),
+        ]
+
+
+class LeaveUsageReport(BaseReport):
+    """
+    Pemakaian leave per employee per jenis leave dalam 1 tahun.
+    parameters: year (wajib), department_id
+    """
+    title = "Leave Usage"
+    headers = (
+        "Employee Number",
+        "Full Name",
+        "Department",
+        "Leave Type",
+        "Approved Requests",
+        "Approved Days",
+        "Pending Requests",
+        "Rejected Requests",
+    )
+
+    def clean(self, parameters):
+        return {
+            "year": parse_int(parameters, "year", required=True, low=1900, high=9999),
+            "department_id": parse_int(parameters, "department_id"),
+        }
+
+    def filename(self):
+        return f"leave_usage_{self.parameters['year']}"
+
+    def queryset(self):
+        qs = filter_period(LeaveRequest.objects.all(), "start_date", year=self.parameters["year"])
+
+        if self.parameters["department_id"]:
+            qs = qs.filter(employee__department_id=self.parameters["department_id"])
+
+        return (
+            qs.values(
+                "employee__employee_number",
+                "employee__user__full_name",
+                "employee__department__name",
+                "leave_type__name",
+            )
+            .annotate(
+                approved=Count("id", filter=Q(status="approved")),
+                approved_days=Sum("total_days", filter=Q(status="approved")),
+                pending=Count("id", filter=Q(status="pending")),
+                rejected=Count("id", filter=Q(status="rejected")),
+            )
+            .order_by("employee__employee_number", "leave_type__name")
+        )
+
+    def format_row(self, row):
+        return [
+            row["employee__employee_number"],
+            row["employee__user__full_name"],
+            row["employee__department__name"],
+            row["leave_type__name"],
+            row["approved"],
+            row["approved_days"] or 0,
+            row["pending"],
+            row["rejected"],
+        ]
+
+
+class HeadcountReport(BaseReport):
+    """
+    Jumlah employee aktif per department & employment status per tanggal.
+    parameters: as_of (YYYY-MM-DD, default hari ini)
+    """
+    title = "Headcount"
+    headers = ("Department", "Employment Status", "Headcount")
+
+    def clean(self, parameters):
+        as_of = parameters.get("as_of")
+        if not as_of:
+            return {"as_of": timezone.localdate().isoformat()}
+
+        try:
+            as_of = date.fromisoformat(str(as_of))
+        except ValueError:
+            raise serializers.ValidationError({"as_of": "Format as_of harus YYYY-MM-DD."})
+
+        return {"as_of": as_of.isoformat()}
+
+    def filename(self):
+        return f"headcount_{self.parameters['as_of']}"
+
+    def queryset(self):
+        as_of = date.fromisoformat(self.parameters["as_of"])
+
+        return (
+            Employee.objects.filter(
+                Q(join_date__isnull=True) | Q(join_date__lte=as_of),
+                Q(resign_date__isnull=True) | Q(resign_date__gt=as_of),
+            )
+            .values("department__name", "employment_status__name")
+            .annotate(headcount=Count("id"))
+            .order_by("department__name", "employment_status__name")
+        )
+
+    def format_row(self, row):
+        return [row["department__name"], row["employment_status__name"], row["headcount"]]
+
+
+REPORTS = {
+    "attendance_recap": AttendanceRecapReport,
+    "leave_usage": LeaveUsageReport,
+    "headcount": HeadcountReport,
+}
+
+
+def get_report(report_type, parameters):
+    return REPORTS[report_type](parameters)
@@ -1,3 +1,61 @@
+from django.conf import settings
 from django.db import models
 
 # Create your models here.
+
+
+class ReportJob(models.Model):
+    """
+    Job pembuatan laporan. Dibuat oleh endpoint enqueue, dikerjakan di
+    background (lihat tasks.generate_report), hasil disimpan di output_file.
+    """
+    TYPE_CHOICES = [
+        ("attendance_recap", "Attendance Recap"),
+        ("leave_usage", "Leave Usage"),
+        ("headcount", "Headcount"),
+    ]
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    FILE_TYPE_CHOICES = [
+        ("xlsx", "XLSX"),
+        ("csv", "CSV"),
+    ]
+
+    report_type = models.CharField(max_length=50, choices=TYPE_CHOICES)
+    parameters = models.JSONField(default=dict, blank=True)
+    file_type = models.CharField(max_length=10, choices=FILE_TYPE_CHOICES, default="xlsx")
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    progress = models.PositiveSmallIntegerField(default=0)  # 0..100
+    row_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+
+    output_file = models.FileField(upload_to="reports/%Y/%m/", null=True, blank=True)
+
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="report_jobs",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "report_jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["requested_by", "created_at"], name="report_job_user_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_report_type_display()} #{self.pk} ({self.status})"
@@ -0,0 +1,51 @@
+from rest_framework import serializers
+
+from .generators import get_report
+from .models import ReportJob
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    report_type_display = serializers.CharField(source="get_report_type_display", read_only=True)
+    requested_by_email = serializers.CharField(source="requested_by.email", read_only=True, default=None)
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "id",
+            "report_type",
+            "report_type_display",
+            "parameters",
+            "file_type",
+            "status",
+            "progress",
+            "row_count",
+            "error",
+            "download_url",
+            "requested_by",
+            "requested_by_email",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != "done" or not obj.output_file:
+            return None
+
+        path = f"/api/reports/jobs/{obj.id}/download/"
+        request = self.context.get("request")
+        return request.build_absolute_uri(path) if request else path
+
+
+class ReportJobCreateSerializer(serializers.Serializer):
+    report_type = serializers.ChoiceField(choices=ReportJob.TYPE_CHOICES)
+    parameters = serializers.DictField(required=False, default=dict)
+    file_type = serializers.ChoiceField(choices=ReportJob.FILE_TYPE_CHOICES, default="xlsx")
+
+    def validate(self, attrs):
+        # parameters dinormalisasi oleh definisi report masing-masing
+        report = get_report(attrs["report_type"], attrs.get("parameters"))
+        attrs["parameters"] = report.parameters
+        return attrs
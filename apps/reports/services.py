@@ -0,0 +1,129 @@
+"""
+Pembuatan & eksekusi ReportJob.
+
+create_report_job dipanggil dari view (hanya INSERT + enqueue),
+run_report dijalankan di worker (Celery / thread pool lokal).
+"""
+import csv
+import io
+import logging
+import tempfile
+
+from django.core.files import File
+from django.utils import timezone
+from openpyxl import Workbook
+
+from apps.core.background import enqueue
+
+from .generators import get_report
+from .models import ReportJob
+
+logger = logging.getLogger(__name__)
+
+# update kolom progress setiap N baris
+PROGRESS_EVERY = 1000
+
+
+def create_report_job(user, report_type, parameters, file_type="xlsx"):
+    from .tasks import generate_report
+
+    job = ReportJob.objects.create(
+        report_type=report_type,
+        parameters=parameters,
+        file_type=file_type,
+        requested_by=user,
+    )
+    enqueue(generate_report, job.id)
+    return job
+
+
+def set_progress(job_id, done, total):
+    if total:
+        progress = min(99, int(done * 100 / total))
+        ReportJob.objects.filter(id=job_id).update(progress=progress)
+
+
+def iter_with_progress(job_id, rows, total):
+    count = 0
+    for row in rows:
+        yield row
+        count += 1
+        if count % PROGRESS_EVERY == 0:
+            set_progress(job_id, count, total)
+
+
+def write_csv(report, rows, file):
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    writer = csv.writer(text)
+
+    writer.writerow(report.headers)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+
+    text.flush()
+    text.detach()
+    return count
+
+
+def write_xlsx(report, rows, file):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(report.title[:31])
+
+    sheet.append(report.headers)
+    count = 0
+    for row in rows:
+        sheet.append(row)
+        count += 1
+
+    workbook.save(file)
+    return count
+
+
+WRITERS = {
+    "csv": write_csv,
+    "xlsx": write_xlsx,
+}
+
+
+def run_report(job_id):
+    """
+    Kerjakan 1 ReportJob. Job yang sudah diambil worker lain
+    (status bukan pending) dilewati.
+    """
+    claimed = ReportJob.objects.filter(id=job_id, status="pending").update(
+        status="running",
+        progress=0,
+        started_at=timezone.now(),
+    )
+    if not claimed:
+        return
+
+    job = ReportJob.objects.get(id=job_id)
+
+    try:
+        report = get_report(job.report_type, job.parameters)
+        total = report.count()
+        rows = iter_with_progress(job.id, report.rows(), total)
+
+        with tempfile.TemporaryFile() as file:
+            row_count = WRITERS[job.file_type](report, rows, file)
+            file.seek(0)
+            job.output_file.save(f"{report.filename()}.{job.file_type}", File(file), save=False)
+
+        ReportJob.objects.filter(id=job.id).update(
+            status="done",
+            progress=100,
+            row_count=row_count,
+            output_file=job.output_file.name,
+            error=None,
+            finished_at=timezone.now(),
+        )
+    except Exception as exc:
+        logger.exception("ReportJob %s gagal", job.id)
+        ReportJob.objects.filter(id=job.id).update(
+            status="failed",
+            error=str(exc),
+            finished_at=timezone.now(),
+        )
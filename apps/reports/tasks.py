@@ -0,0 +1,8 @@
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def generate_report(job_id):
+    from .services import run_report
+
+    run_report(job_id)
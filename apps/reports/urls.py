@@ -1,3 +1,11 @@
-from django.urls import path
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
 
-urlpatterns = []
+from .views import ReportJobViewSet
+
+router = DefaultRouter()
+router.register(r"jobs", ReportJobViewSet, basename="report-jobs")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
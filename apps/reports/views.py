@@ -1,3 +1,86 @@
-from django.shortcuts import render
+import os
 
-# Create your views here.
+from django.http import FileResponse
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.accounts.models import user_has_permission
+from .models import ReportJob
+from .serializers import ReportJobCreateSerializer, ReportJobSerializer
+from .services import create_report_job
+
+
+class ReportJobViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    POST   /jobs/               -> enqueue report (202, dikerjakan di background)
+    GET    /jobs/               -> daftar job
+    GET    /jobs/{id}/          -> status & progress
+    GET    /jobs/{id}/download/ -> file hasil (jika status done)
+    """
+    permission_classes = [IsAuthenticated]
+    queryset = ReportJob.objects.select_related("requested_by").all()
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return ReportJobCreateSerializer
+        return ReportJobSerializer
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        user = self.request.user
+
+        # HR / Manager bisa lihat semua job, selain itu hanya job miliknya
+        if user_has_permission(user, "reports.view") or user.is_staff:
+            base_qs = qs
+        else:
+            base_qs = qs.filter(requested_by=user)
+
+        report_type = self.request.query_params.get("report_type")
+        status_param = self.request.query_params.get("status")
+
+        if report_type:
+            base_qs = base_qs.filter(report_type=report_type)
+
+        if status_param:
+            base_qs = base_qs.filter(status=status_param)
+
+        return base_qs
+
+    def create(self, request, *args, **kwargs):
+        user = request.user
+        if not (user_has_permission(user, "reports.export") or user.is_staff):
+            raise PermissionDenied("Tidak punya akses membuat report.")
+
+        serializer = ReportJobCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        job = create_report_job(user, **serializer.validated_data)
+
+        return Response(
+            ReportJobSerializer(job, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, pk=None):
+        job = self.get_object()
+
+        if job.status != "done" or not job.output_file:
+            return Response(
+                {"detail": "Report belum selesai.", "status": job.status},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        return FileResponse(
+            job.output_file.open("rb"),
+            as_attachment=True,
+            filename=os.path.basename(job.output_file.name),
+        )
@@ -0,0 +1,11 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+app = Celery("config")
+
+# semua setting CELERY_* dibaca dari Django settings
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -1,7 +1,9 @@
 from pathlib import Path
 from datetime import timedelta
 import os
+import tempfile
 import environ
+from celery.schedules import crontab
 
 # ============================================================
 # BASE DIR
@@ -115,6 +117,55 @@ DATABASES = {
     }
 }
 
+# ============================================================
+# CACHE (LocMem default, Redis opsional via REDIS_URL)
+# ============================================================
+REDIS_URL = env("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "hris",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "hris-default",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+
+# lama cache permission per user (detik), lihat apps.accounts.rbac
+RBAC_CACHE_TIMEOUT = env.int("RBAC_CACHE_TIMEOUT", default=300)
+
+# lama cache AttendanceSetting aktif (detik), lihat apps.attendance.utils
+ATTENDANCE_SETTING_CACHE_TIMEOUT = env.int("ATTENDANCE_SETTING_CACHE_TIMEOUT", default=300)
+
+# validasi device saat check-in/out: off | registered | verified
+# (lihat apps.employee_devices.trust)
+ATTENDANCE_DEVICE_ENFORCEMENT = env("ATTENDANCE_DEVICE_ENFORCEMENT", default="off")
+
+# lama cache trust device (detik)
+DEVICE_TRUST_CACHE_TIMEOUT = env.int("DEVICE_TRUST_CACHE_TIMEOUT", default=300)
+
+# write-behind last_used_at device: flush tiap N detik (task beat / Redis)
+# atau N device (buffer memori tanpa Redis)
+DEVICE_TOUCH_FLUSH_SIZE = env.int("DEVICE_TOUCH_FLUSH_SIZE", default=200)
+DEVICE_TOUCH_FLUSH_INTERVAL = env.int("DEVICE_TOUCH_FLUSH_INTERVAL", default=60)
+
+# attendance tanpa check-out ditutup otomatis setelah jam pulang + grace (menit)
+ATTENDANCE_AUTO_CHECKOUT_GRACE_MINUTES = env.int("ATTENDANCE_AUTO_CHECKOUT_GRACE_MINUTES", default=240)
+
+# hari kerja (0 = Senin ... 6 = Minggu), lihat apps.core.workdays
+WORKING_WEEKDAYS = env.list("WORKING_WEEKDAYS", cast=int, default=[0, 1, 2, 3, 4])
+
+# interval (detik) proses mengecek versi kalender libur (cache shared / DB)
+WORKDAY_INDEX_CHECK_INTERVAL = env.int("WORKDAY_INDEX_CHECK_INTERVAL", default=30)
+
 # ============================================================
 # PASSWORD VALIDATORS
 # ============================================================
@@ -125,6 +176,17 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# hasher pertama = hasher utama; pbkdf2_sha256_bulk hanya dipakai
+# untuk user massal (BULK_PASSWORD_HASHER) dan di-upgrade saat login
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+    "apps.accounts.hashers.BulkPBKDF2PasswordHasher",
+]
+
 AUTH_USER_MODEL = "accounts.User"
 
 # ============================================================
@@ -163,12 +225,13 @@ CORS_ALLOW_ALL_ORIGINS = env.bool("CORS_ALLOW_ALL_ORIGINS", default=True)
 # ============================================================
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.PermissionClaimJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "EXCEPTION_HANDLER": "apps.core.exceptions.exception_handler",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": (
@@ -178,6 +241,9 @@ REST_FRAMEWORK = {
     ),
 }
 
+# batas ?page_size= (apps.core.pagination)
+API_MAX_PAGE_SIZE = env.int("API_MAX_PAGE_SIZE", default=500)
+
 # ============================================================
 # JWT (SimpleJWT)
 # ============================================================
@@ -189,6 +255,9 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Embed bitset permission RBAC di access token (lihat apps.accounts.tokens)
+RBAC_JWT_PERMISSIONS = env.bool("RBAC_JWT_PERMISSIONS", default=False)
+
 # ============================================================
 # SWAGGER / OPENAPI (drf-spectacular)
 # ============================================================
@@ -200,6 +269,70 @@ SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True,
 }
 
+# ============================================================
+# CELERY (opsional)
+# ============================================================
+# Tanpa broker, task background dijalankan di thread pool lokal
+# (lihat apps.core.background).
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="")
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_TASK_IGNORE_RESULT = True
+
+# job terjadwal (jalankan `celery -A config beat`)
+CELERY_BEAT_SCHEDULE = {
+    # alpha hari kemarin, lihat apps.attendance.alpha
+    "attendance-materialize-alpha": {
+        "task": "apps.attendance.tasks.materialize_alpha",
+        "schedule": crontab(
+            hour=env.int("ATTENDANCE_ALPHA_HOUR", default=1),
+            minute=env.int("ATTENDANCE_ALPHA_MINUTE", default=0),
+        ),
+    },
+    # attendance lupa check-out, lihat apps.attendance.autocheckout
+    "attendance-auto-check-out": {
+        "task": "apps.attendance.tasks.auto_check_out",
+        "schedule": crontab(minute=env("ATTENDANCE_AUTO_CHECKOUT_MINUTE", default="*/30")),
+    },
+    # buffer last_used_at device (Redis), lihat apps.employee_devices.touches
+    "devices-flush-touches": {
+        "task": "apps.employee_devices.tasks.flush_device_touches",
+        "schedule": float(DEVICE_TOUCH_FLUSH_INTERVAL),
+    },
+}
+
+BACKGROUND_THREAD_WORKERS = env.int("BACKGROUND_THREAD_WORKERS", default=2)
+
+# ============================================================
+# ATTENDANCE PHOTO
+# ============================================================
+# Upload foto check-in/out di-spool ke sini lalu diproses di background.
+# Jika worker Celery ada di host lain, arahkan ke storage bersama.
+ATTENDANCE_PHOTO_SPOOL_DIR = env(
+    "ATTENDANCE_PHOTO_SPOOL_DIR",
+    default=os.path.join(tempfile.gettempdir(), "hris-attendance-spool"),
+)
+ATTENDANCE_PHOTO_MAX_SIZE = env.int("ATTENDANCE_PHOTO_MAX_SIZE", default=1280)
+ATTENDANCE_PHOTO_THUMB_SIZE = env.int("ATTENDANCE_PHOTO_THUMB_SIZE", default=256)
+ATTENDANCE_PHOTO_QUALITY = env.int("ATTENDANCE_PHOTO_QUALITY", default=82)
+
+# ============================================================
+# PAYSLIP PDF
+# ============================================================
+PAYSLIP_COMPANY_NAME = env("PAYSLIP_COMPANY_NAME", default="HRIS")
+# 0 = jumlah CPU
+PAYSLIP_PDF_WORKERS = env.int("PAYSLIP_PDF_WORKERS", default=0)
+PAYSLIP_PDF_CHUNK_SIZE = env.int("PAYSLIP_PDF_CHUNK_SIZE", default=200)
+
+# ============================================================
+# IMPORT EMPLOYEE / USER MASSAL
+# ============================================================
+EMPLOYEE_IMPORT_MAX_ROWS = env.int("EMPLOYEE_IMPORT_MAX_ROWS", default=20000)
+# proses hash password paralel (apps.accounts.hashing), 0 = jumlah CPU
+PASSWORD_HASH_WORKERS = env.int("PASSWORD_HASH_WORKERS", default=0)
+# hasher user massal: "default" (hasher utama) atau "pbkdf2_sha256_bulk"
+BULK_PASSWORD_HASHER = env("BULK_PASSWORD_HASHER", default="default")
+BULK_PASSWORD_HASH_ITERATIONS = env.int("BULK_PASSWORD_HASH_ITERATIONS", default=100000)
+
 # ============================================================
 # LOGGING (basic)
 # ============================================================
@@ -17,6 +17,7 @@ urlpatterns = [
     path("api/attendance/", include("apps.attendance.urls")),
     path("api/leave/", include("apps.leave.urls")),
     path("api/payroll/", include("apps.payroll.urls")),
+    path("api/reports/", include("apps.reports.urls")),
     path("api/device/", include("apps.employee_devices.urls")),
     
 ]